@@ -0,0 +1,103 @@
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성이다.
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # lz4는 선택 의존성이다.
+    lz4 = None
+
+
+# 값 앞에 붙는 1바이트 헤더. 압축된 값과 압축되지 않은 값이 같은 Redis에 섞여 있어도 읽을 수 있다.
+HEADER_RAW = 0x00
+HEADER_ZLIB = 0x01
+HEADER_ZSTD = 0x02
+HEADER_LZ4 = 0x03
+
+
+def _codecs() -> Dict[str, Tuple[int, Callable, Callable]]:
+    codecs = {
+        "zlib": (
+            HEADER_ZLIB,
+            lambda data: zlib.compress(data, 1),
+            zlib.decompress,
+        ),
+    }
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3)
+        decompressor = zstandard.ZstdDecompressor()
+        codecs["zstd"] = (HEADER_ZSTD, compressor.compress, decompressor.decompress)
+    if lz4 is not None:
+        codecs["lz4"] = (HEADER_LZ4, lz4.frame.compress, lz4.frame.decompress)
+
+    return codecs
+
+
+@dataclass
+class CompressionStats:
+    compressed: int = 0
+    skipped: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    compress_seconds: float = 0.0
+    decompress_seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        return self.bytes_in / self.bytes_out if self.bytes_out else 1.0
+
+
+class Compressor:
+    """
+    threshold 바이트 이상인 값만 압축한다.
+    읽을 때는 헤더를 보고 코덱을 고르므로, 설정을 바꿔도 이전에 저장된 값을 읽을 수 있다.
+    """
+
+    def __init__(self, codec: str = "none", threshold: int = 1024):
+        codecs = _codecs()
+        if codec != "none" and codec not in codecs:
+            raise RuntimeError(f"Compression codec is not available: {codec}")
+
+        self.codec = codec
+        self.threshold = threshold
+        self.stats = CompressionStats()
+        self._compress = codecs.get(codec)
+        self._decompress = {
+            header: decompress for header, _, decompress in codecs.values()
+        }
+
+    def compress(self, data: bytes) -> bytes:
+        if self._compress is None or len(data) < self.threshold:
+            self.stats.skipped += 1
+            return bytes([HEADER_RAW]) + data
+
+        header, compress, _ = self._compress
+        started = time.thread_time()
+        compressed = compress(data)
+        self.stats.compress_seconds += time.thread_time() - started
+
+        if len(compressed) >= len(data):
+            self.stats.skipped += 1
+            return bytes([HEADER_RAW]) + data
+
+        self.stats.compressed += 1
+        self.stats.bytes_in += len(data)
+        self.stats.bytes_out += len(compressed)
+        return bytes([header]) + compressed
+
+    def decompress(self, data: bytes) -> bytes:
+        header, payload = data[0], data[1:]
+        if header == HEADER_RAW:
+            return payload
+
+        started = time.thread_time()
+        decompressed = self._decompress[header](payload)
+        self.stats.decompress_seconds += time.thread_time() - started
+
+        return decompressed
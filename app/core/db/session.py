@@ -1,35 +1,373 @@
+import asyncio
+import time
 from asyncio import current_task
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+)
+from uuid import uuid4
 
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, ExceptionContext
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.selectable import SelectBase
+from starlette_context import context
+
+from app.core.config import config
+from app.core.errors import error
+from app.core.logger import logger
+from app.core.metrics import (
+    InstrumentedPool,
+    deadline_metrics,
+    statement_metrics,
+    unit_of_work_metrics,
+)
 
-from app.core.config import config, is_local
+# statement_timeout(또는 pg_cancel_backend)으로 끊긴 쿼리의 SQLSTATE
+QUERY_CANCELED = "57014"
 
 
 class Base(DeclarativeBase): ...
 
 
-engine = create_async_engine(
-    config.DB_URL, pool_size=10, echo=is_local(), pool_pre_ping=True, max_overflow=5
+def create_engine(url: str) -> AsyncEngine:
+    if config.DB_PGBOUNCER:
+        return create_pgbouncer_engine(url)
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedPool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        echo=config.DB_ECHO,
+        connect_args={
+            # asyncpg 자체 캐시와 SQLAlchemy 어댑터의 캐시를 같은 크기로 맞춘다.
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+def create_pgbouncer_engine(url: str) -> AsyncEngine:
+    """
+    PgBouncer(pool_mode=transaction) 뒤에서 쓰는 엔진.
+    트랜잭션마다 서버 커넥션이 바뀌므로 prepared statement를 캐시하지 않고,
+    이름이 다른 커넥션의 것과 겹치지 않도록 매번 새 이름을 붙인다.
+    풀링은 PgBouncer가 하므로 앱 쪽은 NullPool로 둔다.
+    """
+    return create_async_engine(
+        url,
+        poolclass=NullPool,
+        echo=config.DB_ECHO,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4().hex}__",
+        },
+    )
+
+
+engine = create_engine(config.DB_URL)
+
+# 읽기 전용 복제본. DB_REPLICA_URL이 없으면 primary를 같이 쓴다.
+replica_engine = (
+    create_engine(config.DB_REPLICA_URL) if config.DB_REPLICA_URL else engine
 )
 
+
+def translate_query_canceled(exception_context: ExceptionContext):
+    """
+    statement_timeout으로 끊긴 쿼리는 DBAPIError(500) 대신 DeadlineExceeded(504)로 바꿔 던진다.
+    """
+    sqlstate = getattr(exception_context.original_exception, "sqlstate", None)
+    if sqlstate == QUERY_CANCELED:
+        deadline_metrics.exceeded["statement_timeout"] += 1
+        return error.DeadlineExceeded()
+
+
+for target in {engine, replica_engine}:
+    statement_metrics.instrument(target)
+    event.listen(target.sync_engine, "handle_error", translate_query_canceled)
+
+
+def primary_until() -> float:
+    """
+    이 시각까지는 읽기도 primary로 보낸다. (read-your-writes)
+    요청 밖(배치, 벤치마크)에서는 context가 없으므로 항상 0이다.
+    """
+    if not context.exists():
+        return 0.0
+
+    return context.get("db_primary_until", 0.0)
+
+
+def stick_to_primary() -> None:
+    if context.exists():
+        context["db_primary_until"] = time.time() + config.DB_REPLICA_STICKY_SECONDS
+
+
+def start_deadline(timeout: float) -> None:
+    context["db_deadline"] = time.monotonic() + timeout
+
+
+def clear_deadline() -> None:
+    if context.exists():
+        context["db_deadline"] = None
+
+
+def remaining_time() -> Optional[float]:
+    """
+    요청의 남은 시간 예산(초). 요청 밖이거나 예산이 없으면 None이다.
+    요청보다 오래 사는 백그라운드 태스크(create_detached_task)는 요청의 예산을 따르지 않는다.
+    """
+    if _detached.get() or not context.exists():
+        return None
+
+    deadline = context.get("db_deadline")
+    return None if deadline is None else deadline - time.monotonic()
+
+
+class RoutingSession(Session):
+    """
+    SELECT는 replica로, 나머지(INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE)는 primary로 보낸다.
+    쓰기가 한 번 일어나면 DB_REPLICA_STICKY_SECONDS 동안 같은 요청/클라이언트의 읽기도 primary로 보낸다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if replica_engine is engine:
+            return engine.sync_engine
+
+        if (
+            isinstance(clause, SelectBase)
+            and getattr(clause, "_for_update_arg", None) is None
+            and not self._flushing
+            and primary_until() < time.time()
+        ):
+            return replica_engine.sync_engine
+
+        stick_to_primary()
+        return engine.sync_engine
+
+
+def set_statement_timeout(session: Session, transaction, connection: Connection):
+    """
+    세션 트랜잭션을 시작할 때 요청의 남은 시간을 statement_timeout으로 건다.
+    SET LOCAL이라 트랜잭션이 끝나면 풀려서 풀의 다른 요청에 남지 않는다. (PgBouncer transaction 모드에서도 안전하다)
+    AUTOCOMMIT 조회(read_connection)는 트랜잭션이 없으므로 DeadlineMiddleware의 취소로 끊는다.
+    """
+    remaining = remaining_time()
+    if remaining is not None:
+        # SET은 bind 파라미터를 받지 않는다. 값은 정수(ms)라 그대로 넣는다.
+        timeout = max(int(remaining * 1000), 1)
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout}")
+
+
+event.listen(RoutingSession, "after_begin", set_statement_timeout)
+
 async_session_factory = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False
 )
 
-AsyncScopedSession = async_scoped_session(async_session_factory, scopefunc=current_task)
+# 요청보다 오래 사는 백그라운드 태스크는 요청 세션을 같이 쓰면 안 된다. (create_detached_task)
+_detached: ContextVar[bool] = ContextVar("db_session_detached", default=False)
+# unit_of_work()가 커밋한 뒤에 실행할 콜백. unit_of_work 밖이면 None이다.
+_after_commit: ContextVar[Optional[List[Callable[[], Awaitable[Any]]]]] = ContextVar(
+    "db_after_commit", default=None
+)
+
+
+def session_scope() -> Hashable:
+    """
+    요청 안에서는 SQLAlchemyMiddleware가 만든 session_id로, 그 밖에서는 현재 태스크로 세션을 나눈다.
+    한 요청의 리포지토리 호출은 모두 같은 세션(트랜잭션)을 쓴다.
+    """
+    if not _detached.get() and context.exists() and "session_id" in context:
+        return context["session_id"]
+
+    return current_task()
+
+
+AsyncScopedSession = async_scoped_session(
+    async_session_factory, scopefunc=session_scope
+)
+
+
+class UnitOfWork:
+    def __init__(self):
+        self.rollback_only = False
+        self.after_commit: List[Callable[[], Awaitable[Any]]] = []
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """
+    블록 안의 리포지토리 호출을 한 트랜잭션으로 묶는다.
+    정상 종료면 한 번 커밋하고, 예외가 나거나 rollback_only면 롤백한다. 세션은 항상 remove()한다.
+    리포지토리는 커밋하지 않으므로 요청 밖(배치, 벤치마크)에서 쓰기를 하려면 이 블록 안에서 호출한다.
+    """
+    uow = UnitOfWork()
+    token = _after_commit.set(uow.after_commit)
+    committed = False
+    try:
+        yield uow
+
+        if AsyncScopedSession.registry.has():
+            session = AsyncScopedSession()
+            if uow.rollback_only:
+                await session.rollback()
+            else:
+                await session.commit()
+                committed = True
+        else:
+            committed = not uow.rollback_only
+    except BaseException:
+        if AsyncScopedSession.registry.has():
+            await AsyncScopedSession().rollback()
+        raise
+    finally:
+        await AsyncScopedSession.remove()
+        _after_commit.reset(token)
+
+    if committed:
+        # 이미 커밋했으므로 콜백(캐시 무효화 등)이 실패해도 요청은 성공이다.
+        # 실패로 돌려주면 클라이언트가 재시도해서 같은 쓰기가 두 번 들어갈 수 있다.
+        for callback in uow.after_commit:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"after_commit callback failed: {e}")
+                unit_of_work_metrics.after_commit_failures += 1
+
+
+async def after_commit(callback: Callable[[], Awaitable[Any]]) -> None:
+    """
+    unit_of_work 안이면 커밋한 뒤에, 밖이면 바로 callback을 실행한다.
+    커밋 전에 캐시를 무효화하면 다른 요청이 커밋 전 데이터를 새 세대로 캐시할 수 있다.
+    """
+    callbacks = _after_commit.get()
+    if callbacks is None:
+        await callback()
+    else:
+        callbacks.append(callback)
+
+
+def create_detached_task(coroutine: Coroutine) -> asyncio.Task:
+    """
+    요청 세션을 공유하지 않는 태스크를 띄운다. 태스크는 자기 unit_of_work 안에서 실행된다.
+    요청이 끝난 뒤에도 계속될 수 있는 작업(캐시 single-flight, 백그라운드 갱신)에 쓴다.
+
+    요청의 시간 예산은 따르지 않는 대신 REQUEST_TIMEOUT초를 넘기면 취소되고 DeadlineExceeded를 던진다.
+    요청이 끊겨도 느린 쿼리가 커넥션을 끝없이 잡고 있지 않게 한다.
+    """
+
+    async def run():
+        _detached.set(True)
+        try:
+            async with asyncio.timeout(config.REQUEST_TIMEOUT or None):
+                async with unit_of_work():
+                    return await coroutine
+        except TimeoutError:
+            deadline_metrics.exceeded["detached_timeout"] += 1
+            raise error.DeadlineExceeded()
+
+    return asyncio.create_task(run())
+
+
+@asynccontextmanager
+async def read_connection() -> AsyncIterator[AsyncConnection]:
+    """
+    조회 전용 커넥션. AUTOCOMMIT이라 SELECT 하나에 BEGIN/ROLLBACK 왕복이 붙지 않고,
+    세션을 거치지 않으므로 identity map과 ORM 엔티티도 만들지 않는다.
+
+    요청 세션에 아직 커밋하지 않은 쓰기가 있으면 그 트랜잭션 안에서 읽는다. (read-your-writes)
+    """
+    if AsyncScopedSession.registry.has():
+        session = AsyncScopedSession()
+        if session.in_transaction():
+            yield await session.connection()
+            return
+
+    target = replica_engine if primary_until() < time.time() else engine
+    async with target.execution_options(
+        isolation_level="AUTOCOMMIT"
+    ).connect() as connection:
+        yield connection
+
+
+@asynccontextmanager
+async def stream_connection() -> AsyncIterator[AsyncConnection]:
+    """
+    server-side cursor(stream_results)로 큰 결과를 나눠 읽는 커넥션.
+    StreamingResponse의 본문은 미들웨어의 unit of work가 끝난 뒤에 만들어지므로 요청 세션과 따로 연다.
+    커서는 트랜잭션 안에서만 열리므로 읽기 트랜잭션을 열고, 끝나거나 취소되면 롤백한다.
+    """
+    target = replica_engine if primary_until() < time.time() else engine
+    async with target.connect() as connection:
+        yield connection
 
 
 async def ping_db():
     async with engine.begin() as conn:
         await conn.execute(text("SELECT 1"))
 
+    if replica_engine is not engine:
+        async with replica_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+
+async def warm_up_db(statements: Sequence[Executable] = ()) -> None:
+    """
+    풀 크기만큼 커넥션을 동시에 열고, 커넥션마다 statements를 한 번씩 실행해서
+    컴파일 캐시와 prepared statement를 채워 둔다.
+    배포 직후 첫 요청들이 커넥션 수립(TLS, 인증)과 prepare를 줄지어 기다리지 않게 한다.
+    """
+    engines = [engine] if replica_engine is engine else [engine, replica_engine]
+
+    for target in engines:
+        # NullPool(PgBouncer 모드)은 커넥션을 들고 있지 않으므로 미리 열어 둘 것이 없다.
+        if isinstance(target.pool, NullPool):
+            continue
+
+        connections = await asyncio.gather(
+            *(target.connect() for _ in range(target.pool.size()))
+        )
+        try:
+            await asyncio.gather(
+                *(prepare(connection, statements) for connection in connections)
+            )
+        finally:
+            await asyncio.gather(*(connection.close() for connection in connections))
+
+
+async def prepare(connection: AsyncConnection, statements: Sequence[Executable]):
+    for statement in statements:
+        await connection.execute(statement)
+    await connection.rollback()
+
 
 async def close_db():
     await engine.dispose()
+    if replica_engine is not engine:
+        await replica_engine.dispose()
@@ -5,9 +5,15 @@ ERROR_400_CLASS_NOTICE_CREATION_FAILED = "40003"
 ERROR_400_CLASS_NOTICE_UPDATE_FAILED = "40004"
 ERROR_400_CLASS_NOTICE_DELETE_FAILED = "40005"
 ERROR_400_USER_CREATION_FAILED = "40006"
+ERROR_400_INVALID_CURSOR = "40007"
+ERROR_400_CLASS_STUDENT_ENROLL_FAILED = "40008"
+ERROR_400_CLASS_STUDENT_NOT_FOUND = "40009"
+ERROR_400_CLASS_STUDENT_UNENROLL_FAILED = "40010"
 
 ERROR_401_INVALID_API_KEY = "40100"
 
+ERROR_504_DEADLINE_EXCEEDED = "50400"
+
 
 class BaseAPIException(Exception):
     def __init__(self, code: str, message: str):
@@ -25,6 +31,12 @@ class BaseAuthException(Exception):
         self.message = message
 
 
+class BaseTimeoutException(Exception):
+    def __init__(self, code: str, message: str):
+        self.code = code
+        self.message = message
+
+
 class ClassNotFoundException(BaseAPIException):
     def __init__(self):
         # super().__init__(code="40000", message="Class not found")
@@ -86,3 +98,38 @@ class UserCreationFailed(BaseAPIException):
         super().__init__(
             code=ERROR_400_USER_CREATION_FAILED, message="User creation failed"
         )
+
+
+class InvalidCursor(BaseAPIException):
+    def __init__(self):
+        super().__init__(code=ERROR_400_INVALID_CURSOR, message="Invalid cursor")
+
+
+class ClassStudentEnrollFailed(BaseAPIException):
+    def __init__(self):
+        super().__init__(
+            code=ERROR_400_CLASS_STUDENT_ENROLL_FAILED,
+            message="Class student enrollment failed",
+        )
+
+
+class ClassStudentNotFound(BaseAPIException):
+    def __init__(self):
+        super().__init__(
+            code=ERROR_400_CLASS_STUDENT_NOT_FOUND, message="Class student not found"
+        )
+
+
+class ClassStudentUnenrollFailed(BaseAPIException):
+    def __init__(self):
+        super().__init__(
+            code=ERROR_400_CLASS_STUDENT_UNENROLL_FAILED,
+            message="Class student unenrollment failed",
+        )
+
+
+class DeadlineExceeded(BaseTimeoutException):
+    def __init__(self):
+        super().__init__(
+            code=ERROR_504_DEADLINE_EXCEEDED, message="Request deadline exceeded"
+        )
@@ -1,7 +1,11 @@
 from fastapi import Request
 from fastapi.responses import ORJSONResponse
 from starlette import status
-from app.core.errors.error import BaseAPIException, BaseAuthException
+from app.core.errors.error import (
+    BaseAPIException,
+    BaseAuthException,
+    BaseTimeoutException,
+)
 
 
 async def api_error_handler(_: Request, exc: BaseAPIException) -> ORJSONResponse:
@@ -28,3 +32,15 @@ async def api_auth_error_handler(_: Request, exc: BaseAuthException) -> ORJSONRe
         },
         status_code=status.HTTP_401_UNAUTHORIZED,
     )
+
+
+async def api_timeout_error_handler(
+    _: Request, exc: BaseTimeoutException
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        content={
+            "statusCode": exc.code,
+            "message": exc.message,
+        },
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+    )
@@ -0,0 +1,76 @@
+import csv
+import dataclasses
+import io
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, List, Literal, Sequence
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from app.core.logger import logger
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def encode_ndjson(rows: Sequence[Any]) -> bytes:
+    return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+
+
+def encode_csv(
+    rows: Sequence[Any], names: Sequence[str], header: bool = False
+) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(names)
+    for row in rows:
+        writer.writerow(
+            [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in (getattr(row, name) for name in names)
+            ]
+        )
+
+    return buffer.getvalue().encode()
+
+
+def export_response(
+    request: Request,
+    batches: AsyncIterator[List[Any]],
+    convert: Callable[[Any], Any],
+    row_type: type,
+    format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    batches(DTO 목록)를 한 묶음씩 convert로 응답 dataclass로 바꿔 NDJSON/CSV 청크로 보낸다.
+    메모리에는 한 묶음만 올라가므로 행 수와 상관없이 일정하다.
+
+    클라이언트가 연결을 끊으면 다음 묶음을 읽기 전에 멈추고 batches를 닫는다. (커서와 커넥션 반환)
+    """
+    names = [field.name for field in dataclasses.fields(row_type)]
+
+    async def body() -> AsyncIterator[bytes]:
+        if format == "csv":
+            yield encode_csv([], names, header=True)
+
+        async with aclosing(batches):
+            async for batch in batches:
+                if await request.is_disconnected():
+                    logger.info(f"Export cancelled: {request.url.path}")
+                    return
+
+                rows = [convert(dto) for dto in batch]
+                if format == "csv":
+                    yield encode_csv(rows, names)
+                else:
+                    yield encode_ndjson(rows)
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
@@ -1,16 +1,47 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from app.core.db.session import ping_db, close_db
+from app.core.config import config
+from app.core.db.session import ping_db, close_db, warm_up_db
+from app.core.logger import logger
 from app.core.redis import redis_cache
+from app.repositories.class_repository import hot_statements
+
+
+async def warm_up(app: FastAPI):
+    """
+    커넥션 풀과 prepared statement를 채운 뒤 ready로 바꾼다.
+    uvicorn은 lifespan 시작이 끝나야 요청을 받으므로, 워밍업은 시작 뒤에 백그라운드로 돌리고
+    그 동안은 /ready가 503을 돌려준다.
+    """
+    try:
+        if config.DB_WARM_UP:
+            await warm_up_db(hot_statements())
+        if config.REDIS_WARM_UP_CONNECTIONS:
+            await redis_cache.warm_up(config.REDIS_WARM_UP_CONNECTIONS)
+    except Exception as e:
+        # 워밍업은 최적화일 뿐이다. 실패해도 첫 요청들이 커넥션을 직접 연다.
+        logger.error(f"Warm-up failed: {e}")
+
+    app.state.ready = True
 
 
 @asynccontextmanager  # 함수에 함수로 감싸는 데코레이터. 지금은 큰 기능은 없더라도, 더 복잡한 기능 구현에 쓰일 것이다.
 async def lifespan(app: FastAPI):
+    app.state.ready = False  # 워밍업이 끝나기 전에는 /ready가 503을 돌려준다.
+
     await ping_db()
     await redis_cache.ping()
+    await redis_cache.start_invalidation_listener()
+
+    warm_up_task = asyncio.create_task(warm_up(app))
 
     yield
 
+    app.state.ready = False
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+
     await close_db()
     await redis_cache.close()
@@ -0,0 +1,161 @@
+import bisect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 커넥션 체크아웃 대기 시간 구간(초). 마지막 구간 위로는 +Inf로 모인다.
+CHECKOUT_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# 구문 컴파일(캐시 키 생성 + 컴파일 캐시 조회/컴파일) 시간 구간(초)
+COMPILE_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01)
+
+
+class Histogram:
+    """
+    Prometheus 히스토그램처럼 누적 구간으로 보여준다. (le = less than or equal)
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+@dataclass
+class PoolMetrics:
+    checkout_wait: Histogram = field(
+        default_factory=lambda: Histogram(CHECKOUT_WAIT_BUCKETS)
+    )
+    timeouts: int = 0
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    풀에서 커넥션을 꺼낼 때까지 기다린 시간과 pool_timeout 초과 횟수를 센다.
+    새 커넥션을 여는 시간(overflow)도 대기 시간에 포함된다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # overflow()는 아직 만들지 않은 커넥션 수만큼 음수다.
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, InstrumentedPool):
+        stats.update(
+            timeouts=pool.metrics.timeouts,
+            checkout_wait=pool.metrics.checkout_wait.snapshot(),
+        )
+
+    return stats
+
+
+class StatementMetrics:
+    """
+    execute()에서 DBAPI 호출 직전까지 걸린 시간(캐시 키 생성, 컴파일 또는 컴파일 캐시 조회)과
+    SQLAlchemy 컴파일 캐시 적중 여부를 센다.
+    """
+
+    def __init__(self):
+        self.compile = Histogram(COMPILE_BUCKETS)
+        self.cache: Dict[str, int] = {}
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_execute", self._before_execute)
+        event.listen(
+            engine.sync_engine, "before_cursor_execute", self._before_cursor_execute
+        )
+
+    def _before_execute(self, conn, clauseelement, multiparams, params, options):
+        conn.info["compile_started"] = time.perf_counter()
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        # 시작 시각은 before_execute에서만 기록한다. 그래서 다음 경우에는 없다.
+        # - before_execute가 불리지 않는 실행: exec_driver_sql, 방언 내부 조회(리플렉션 등)
+        # - insertmanyvalues의 두 번째 배치부터: execute() 한 번에 커서 실행이 여러 번이고,
+        #   첫 배치가 시작 시각을 가져간다. (execute() 한 번을 한 번만 센다)
+        started = conn.info.pop("compile_started", None)
+        if started is None:
+            return
+
+        self.compile.observe(time.perf_counter() - started)
+        cache = getattr(context, "cache_hit", None)
+        name = cache.name.lower() if cache is not None else "no_cache_key"
+        self.cache[name] = self.cache.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"compile": self.compile.snapshot(), "cache": dict(self.cache)}
+
+
+statement_metrics = StatementMetrics()
+
+
+class DeadlineMetrics:
+    """
+    요청 시간 예산(REQUEST_TIMEOUT)을 넘겨서 끊긴 횟수와, 클라이언트가 끊어서 취소한 요청 수를 센다.
+    statement_timeout은 DB가 쿼리를 끊은 것이고, request_timeout은 미들웨어가 요청을 끊은 것이다.
+    detached_timeout은 요청과 따로 도는 캐시 계산(create_detached_task)이 시간을 넘겨 취소된 것이다.
+    """
+
+    def __init__(self):
+        self.exceeded: Dict[str, int] = {
+            "statement_timeout": 0,
+            "request_timeout": 0,
+            "detached_timeout": 0,
+        }
+        self.disconnected = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"exceeded": dict(self.exceeded), "disconnected": self.disconnected}
+
+
+deadline_metrics = DeadlineMetrics()
+
+
+@dataclass
+class UnitOfWorkMetrics:
+    # 커밋 뒤 콜백(캐시 무효화 등)이 실패한 횟수. 실패해도 요청은 성공으로 끝난다.
+    after_commit_failures: int = 0
+
+
+unit_of_work_metrics = UnitOfWorkMetrics()
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Any, Dict
+
+from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import config
+from app.core.db.session import clear_deadline, start_deadline
+from app.core.errors.error import DeadlineExceeded
+from app.core.errors.handler import api_timeout_error_handler
+from app.core.logger import logger
+from app.core.metrics import deadline_metrics
+
+# 클라이언트가 먼저 끊은 요청. (nginx의 관례) 클라이언트는 받지 못하고 접근 로그에만 남는다.
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+
+class DeadlineMiddleware:
+    """
+    요청마다 REQUEST_TIMEOUT초의 시간 예산을 둔다.
+    응답을 시작하기 전에 예산을 넘기면 요청을 취소하고 504(DeadlineExceeded)를 돌려준다.
+    남은 시간은 트랜잭션마다 statement_timeout으로도 걸려서 DB가 같은 시각에 쿼리를 끊는다. (app.core.db.session)
+
+    클라이언트가 끊으면(http.disconnect) 응답 중이라도 요청을 취소한다.
+    asyncpg는 실행 중인 쿼리가 취소되면 서버에도 cancel request를 보내므로, 커넥션이 느린 쿼리를 끝까지 기다리지 않고 풀로 돌아간다.
+
+    응답을 시작한 뒤(StreamingResponse 본문)에는 예산을 적용하지 않는다. 내보내기처럼 클라이언트 속도로 길게 보내는 응답이 있기 때문이다.
+    ContextMiddleware 안쪽, SQLAlchemyMiddleware 바깥쪽에 둔다. 취소는 unit of work의 롤백으로 이어진다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not config.REQUEST_TIMEOUT:
+            await self.app(scope, receive, send)
+            return
+
+        start_deadline(config.REQUEST_TIMEOUT)
+        state: Dict[str, Any] = {"started": False, "finished": False}
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+
+        async def listen() -> None:
+            # 앱이 receive()를 부르지 않아도(GET) 끊김을 알 수 있도록 미리 읽어서 넘겨준다.
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    # 응답을 다 보낸 뒤의 disconnect는 정상 종료다.
+                    if not state["finished"]:
+                        disconnected.set()
+                    return
+
+        async def wrapped_receive() -> Message:
+            message = await messages.get()
+            if message["type"] == "http.disconnect":
+                # 이후의 receive()도 바로 disconnect를 받는다.
+                messages.put_nowait(message)
+            return message
+
+        async def wrapped_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["started"] = True
+                clear_deadline()
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                state["finished"] = True
+            await send(message)
+
+        app_task = asyncio.create_task(self.app(scope, wrapped_receive, wrapped_send))
+        listener = asyncio.create_task(listen())
+        disconnect = asyncio.create_task(disconnected.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {app_task, disconnect},
+                timeout=config.REQUEST_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done and state["started"]:
+                done, _ = await asyncio.wait(
+                    {app_task, disconnect}, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            listener.cancel()
+            disconnect.cancel()
+            if not app_task.done():
+                app_task.cancel()
+                await asyncio.gather(app_task, return_exceptions=True)
+
+        if app_task in done:
+            app_task.result()
+            return
+
+        if disconnect in done:
+            deadline_metrics.disconnected += 1
+            logger.info(f"Client disconnected, cancelled {scope['path']}")
+            # 바깥의 BaseHTTPMiddleware(ContextMiddleware)는 응답이 없으면 에러를 낸다.
+            if not state["started"]:
+                response = Response(status_code=HTTP_499_CLIENT_CLOSED_REQUEST)
+                await response(scope, receive, send)
+            return
+
+        deadline_metrics.exceeded["request_timeout"] += 1
+        logger.warning(f"Request deadline exceeded: {scope['path']}")
+        if not state["started"]:
+            response = await api_timeout_error_handler(
+                Request(scope), DeadlineExceeded()
+            )
+            await response(scope, receive, send)
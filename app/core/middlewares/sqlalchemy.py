@@ -1,9 +1,13 @@
+import time
 from uuid import uuid4
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette_context import context
 
+from app.core.config import config
+from app.core.db.session import unit_of_work
+
 
 class SQLAlchemyMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -13,6 +17,29 @@ class SQLAlchemyMiddleware(BaseHTTPMiddleware):
         유일한 값을 넣어준다.
         각 요청마다 유지되는 컨텍스트 값이다.
 
+        이 session_id로 요청 하나에 세션 하나를 쓴다. (app.core.db.session.session_scope)
+        요청이 끝나면 한 번 커밋(에러 응답이면 롤백)하고 세션을 remove()한다.
         """
 
-        return await call_next(request)
+        # 직전 요청에서 쓰기를 했다면 쿠키가 남아 있는 동안 읽기를 primary로 보낸다.
+        try:
+            primary_until = float(
+                request.cookies.get(config.DB_REPLICA_STICKY_COOKIE, 0)
+            )
+        except ValueError:
+            primary_until = 0.0
+        context["db_primary_until"] = primary_until
+
+        async with unit_of_work() as uow:
+            response = await call_next(request)
+            uow.rollback_only = response.status_code >= 400
+
+        if config.DB_REPLICA_URL and context["db_primary_until"] > primary_until:
+            response.set_cookie(
+                config.DB_REPLICA_STICKY_COOKIE,
+                str(context["db_primary_until"]),
+                max_age=max(int(context["db_primary_until"] - time.time()), 1),
+                httponly=True,
+            )
+
+        return response
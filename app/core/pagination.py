@@ -0,0 +1,50 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List
+from uuid import UUID
+
+import orjson
+
+from app.core.errors import error
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    keyset 페이지네이션의 커서. 마지막 행의 정렬 키를 담은 불투명한 토큰이다.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = orjson.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (binascii.Error, ValueError):
+        raise error.InvalidCursor()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise error.InvalidCursor()
+
+    return values
+
+
+def cursor_uuid(value: Any) -> UUID:
+    """
+    커서에 담긴 id(JSON 문자열)를 uuid 컬럼과 비교할 수 있게 되돌린다.
+    """
+    try:
+        return UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        raise error.InvalidCursor()
+
+
+def cursor_datetime(value: Any) -> datetime:
+    """
+    커서에 담긴 시각(ISO 8601 문자열)을 되돌린다.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise error.InvalidCursor()
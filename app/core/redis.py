@@ -1,69 +1,736 @@
-import pickle
+import asyncio
+import inspect
+import math
+import random
+import struct
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from hashlib import blake2b
+from uuid import uuid4
 
+import orjson
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 
 from app.core.config import config
+from app.core.compression import Compressor
+from app.core.db.session import after_commit, create_detached_task
+from app.core.serializer import Serializer, get_serializer
 
-from typing import Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from functools import wraps
 from app.core.logger import logger
 
 
+# 저장되는 값의 형식(헤더 등)이 바뀌면 올린다. 키 네임스페이스에 들어간다.
+CACHE_FORMAT = "f3"
+
+# RedisCacheDecorator가 저장하는 값 앞에 붙는 메타데이터: (soft expiry epoch, 계산에 걸린 초)
+ENTRY_HEADER = struct.Struct("!dd")
+
+# RedisCache.get의 miss 표시. None이나 빈 리스트도 캐시될 수 있는 값이므로 따로 둔다.
+MISS = object()
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    soft_expires_at: float
+    delta: float = 0.0
+
+    def is_stale(self, now: float) -> bool:
+        return now >= self.soft_expires_at
+
+
+class LocalCache:
+    """
+    워커 프로세스 안의 L1 캐시. LRU + TTL이고, 항목 수와 바이트 수 모두 상한이 있다.
+    객체가 아니라 직렬화된 bytes를 보관해서, 꺼낼 때마다 새 객체가 만들어진다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: str, record: bool = True) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self.delete(key)
+            entry = None
+
+        if record:
+            self.stats.record(entry is not None)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        self.delete(key)
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.size += len(value)
+
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
 class RedisCache:
     def __init__(self):
         self.redis = Redis(
             host=config.REDIS_HOST,
             port=config.REDIS_PORT,
         )
+        self.local: Optional[LocalCache] = (
+            LocalCache(
+                max_entries=config.CACHE_LOCAL_MAX_ENTRIES,
+                max_bytes=config.CACHE_LOCAL_MAX_BYTES,
+                ttl=config.CACHE_LOCAL_TTL,
+            )
+            if config.CACHE_LOCAL_ENABLED
+            else None
+        )
+        self.serializer: Serializer = get_serializer(config.CACHE_SERIALIZER)
+        self.compressor = Compressor(
+            codec=config.CACHE_COMPRESSION,
+            threshold=config.CACHE_COMPRESSION_THRESHOLD,
+        )
+        self.remote_stats = CacheStats()
+        self._release_lock = self.redis.register_script(RELEASE_LOCK_SCRIPT)
+        self.invalidation_channel = f"{config.CACHE_KEY_PREFIX}:invalidate"
+        self._listener: Optional[asyncio.Task] = None
 
     async def ping(self) -> None:
         await self.redis.ping()
 
+    async def warm_up(self, connections: int) -> None:
+        """
+        동시에 PING을 보내서 커넥션 풀에 connections개의 커넥션을 미리 만들어 둔다.
+        """
+        await asyncio.gather(*(self.redis.ping() for _ in range(connections)))
+
     async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
         await self.redis.close()
 
     async def set(
         self, key: str, value: object, ttl: Optional[int] = None
     ) -> None:  # Null이 가능한 것은 항상 Optional을 써야함
-        await self.redis.set(key, pickle.dumps(value), ex=ttl)
+        data = self.encode(value)
+        await self.redis.set(key, data, ex=ttl)
+        if self.local is not None:
+            self.local.set(key, data, ttl)
+
+    async def set_entry(
+        self,
+        key: str,
+        value: object,
+        ttl: float,
+        stale_ttl: float = 0,
+        delta: float = 0.0,
+    ) -> None:
+        """
+        ttl이 지나면 stale(soft expiry)이 되고, Redis에서는 stale_ttl만큼 더 남아 있다.
+        """
+        data = ENTRY_HEADER.pack(time.time() + ttl, delta) + self.encode(value)
+        await self.redis.set(key, data, px=int((ttl + stale_ttl) * 1000))
+        if self.local is not None:
+            self.local.set(key, data, ttl + stale_ttl)
+
+    async def get_entry(
+        self, key: str, type_: Any = Any, remote: bool = False
+    ) -> Optional[CacheEntry]:
+        """
+        remote=True면 L1을 건너뛰고 Redis에서 읽는다. 읽은 값으로 L1도 바뀐다.
+        """
+        (data,) = await self._get_many_raw([key], remote)
+        if data is None:
+            return None
+
+        soft_expires_at, delta = ENTRY_HEADER.unpack_from(data)
+        value = self.decode(data[ENTRY_HEADER.size :], type_)
+        if value is MISS:
+            return None
 
-    async def get(self, key: str) -> object:
-        value = await self.redis.get(key)
-        return pickle.loads(value)
+        return CacheEntry(value=value, soft_expires_at=soft_expires_at, delta=delta)
+
+    async def set_many(self, items: Dict[str, object], ttl: Optional[int] = None):
+        if not items:
+            return
+
+        encoded = {key: self.encode(value) for key, value in items.items()}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, data in encoded.items():
+                pipe.set(key, data, ex=ttl)
+            await pipe.execute()
+
+        if self.local is not None:
+            for key, data in encoded.items():
+                self.local.set(key, data, ttl)
+
+    async def get(self, key: str, default: object = MISS, type_: Any = Any) -> object:
+        """
+        GET 한 번으로 조회한다. 키가 없으면 default(MISS)를 돌려준다.
+        EXISTS 후 GET 하는 사이에 키가 만료되는 경쟁 상태가 없다.
+        type_은 serializer가 DTO를 복원할 때 쓰는 타입 힌트다.
+        """
+        (value,) = await self._get_many_raw([key])
+        value = self.decode(value, type_)
+        return value if value is not MISS else default
+
+    async def get_many(self, keys: Sequence[str], type_: Any = Any) -> List[object]:
+        return [self.decode(value, type_) for value in await self._get_many_raw(keys)]
+
+    async def set_bytes(self, key: str, data: bytes, ttl: Optional[int] = None):
+        """
+        serializer를 거치지 않는 bytes 저장. (압축은 적용된다)
+        """
+        data = self.compressor.compress(data)
+        await self.redis.set(key, data, ex=ttl)
+        if self.local is not None:
+            self.local.set(key, data, ttl)
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        (data,) = await self._get_many_raw([key])
+        return self.compressor.decompress(data) if data is not None else None
+
+    def encode(self, value: object) -> bytes:
+        return self.compressor.compress(self.serializer.dumps(value))
+
+    def decode(self, data: Optional[bytes], type_: Any = Any) -> object:
+        if data is None:
+            return MISS
+
+        try:
+            return self.serializer.loads(self.compressor.decompress(data), type_)
+        except Exception as e:
+            # 읽을 수 없는 값(예: 이 워커에 없는 압축 코덱)은 miss로 보고 다시 계산한다.
+            logger.error(e)
+            return MISS
 
     async def exists(self, key: str) -> bool:
+        if self.local is not None and key in self.local:
+            return True
         return await self.redis.exists(key)
 
+    async def _get_many_raw(
+        self, keys: Sequence[str], remote: bool = False
+    ) -> List[Optional[bytes]]:
+        """
+        L1에서 먼저 찾고, 없는 키만 MGET 한 번으로 Redis에서 가져온다.
+        """
+        values: List[Optional[bytes]] = [None] * len(keys)
+        if self.local is not None and not remote:
+            values = [self.local.get(key) for key in keys]
+
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        fetched = await self.redis.mget([keys[i] for i in missing])
+        for i, value in zip(missing, fetched):
+            self.remote_stats.record(value is not None)
+            values[i] = value
+            if value is not None and self.local is not None:
+                self.local.set(keys[i], value)
+
+        return values
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        return bool(await self.redis.set(key, token, px=int(ttl * 1000), nx=True))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        # 락이 만료되어 다른 워커가 가져간 경우에는 지우지 않는다.
+        await self._release_lock(keys=[key], args=[token])
+
+    def generation_key(self, tag: str) -> str:
+        return f"{config.CACHE_KEY_PREFIX}:gen:{tag}"
+
+    async def get_generations(self, tags: Sequence[str]) -> List[int]:
+        if not tags:
+            return []
+
+        keys = [self.generation_key(tag) for tag in tags]
+        values = await self._get_many_raw(keys)
+        for i, value in enumerate(values):
+            if value is None:
+                # 세대 키가 아직 없으면 0세대다. 다음 조회를 위해 L1에도 0으로 기억한다.
+                values[i] = b"0"
+                if self.local is not None:
+                    self.local.set(keys[i], values[i])
+
+        return [int(value) for value in values]
+
+    async def bump_generations(self, tags: Sequence[str]) -> None:
+        """
+        태그마다 INCR 한 번. 이전 세대로 만들어진 키는 다시 조회되지 않고 TTL로 사라진다.
+        """
+        if not tags:
+            return
+
+        keys = [self.generation_key(tag) for tag in tags]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+            if self.local is not None:
+                pipe.publish(self.invalidation_channel, "\n".join(keys))
+            await pipe.execute()
+
+        if self.local is not None:
+            for key in keys:
+                self.local.delete(key)
+
+    async def start_invalidation_listener(self) -> None:
+        """
+        다른 워커가 세대를 올리면 pub/sub으로 받은 키를 L1에서 지운다.
+        """
+        if self.local is None or self._listener is not None:
+            return
+
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self.invalidation_channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        subscribed = True
+        retry_interval = config.CACHE_INVALIDATION_RETRY_INTERVAL
+        while True:
+            try:
+                if not subscribed:
+                    await pubsub.subscribe(self.invalidation_channel)
+                    subscribed = True
+                    retry_interval = config.CACHE_INVALIDATION_RETRY_INTERVAL
+                    logger.info("Resubscribed to cache invalidation channel")
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    for key in message["data"].decode().split("\n"):
+                        self.local.delete(key)
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as e:
+                # 연결이 끊긴 동안의 메시지는 잃어버렸을 수 있으므로 L1을 비운다.
+                # 다시 구독할 때까지 실패할 때마다 비워서, 그 사이에 채워진 값도 오래 남지 않게 한다.
+                logger.error(f"Cache invalidation listener failed: {e}")
+                self.local.clear()
+                subscribed = False
+                await asyncio.sleep(retry_interval)
+                retry_interval = min(
+                    retry_interval * 2, config.CACHE_INVALIDATION_RETRY_MAX_INTERVAL
+                )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {
+            "remote": asdict(self.remote_stats),
+            "compression": {
+                "codec": self.compressor.codec,
+                **asdict(self.compressor.stats),
+                "ratio": self.compressor.stats.ratio,
+            },
+        }
+        if self.local is not None:
+            stats["local"] = {
+                **asdict(self.local.stats),
+                "entries": len(self.local),
+                "bytes": self.local.size,
+            }
+
+        return stats
+
+
+def digest(data: bytes, size: int = 16) -> str:
+    return blake2b(data, digest_size=size).hexdigest()
+
+
+def _type_signature(tp: Any, seen: Optional[set] = None) -> str:
+    """
+    반환 타입(DTO)의 구조를 문자열로 펼친다.
+    DTO의 필드가 바뀌면 문자열이 바뀌고, 따라서 캐시 네임스페이스도 바뀐다.
+    """
+    seen = seen if seen is not None else set()
+
+    if is_dataclass(tp) and isinstance(tp, type):
+        name = f"{tp.__module__}.{tp.__qualname__}"
+        if name in seen:
+            return name
+        seen.add(name)
+
+        hints = typing.get_type_hints(tp)
+        body = ",".join(
+            f"{f.name}:{_type_signature(hints.get(f.name, f.type), seen)}"
+            for f in fields(tp)
+        )
+        return f"{name}({body})"
+
+    args = typing.get_args(tp)
+    if args:
+        origin = typing.get_origin(tp)
+        inner = ",".join(_type_signature(arg, seen) for arg in args)
+        return f"{getattr(origin, '__name__', origin)}[{inner}]"
+
+    return getattr(tp, "__qualname__", repr(tp))
+
+
+def schema_version(func: Callable) -> str:
+    return_type = typing.get_type_hints(func).get("return", Any)
+    return digest(_type_signature(return_type).encode(), size=4)
+
+
+def bind_arguments(signature: inspect.Signature, *args, **kwargs) -> Dict[str, Any]:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    arguments = dict(bound.arguments)
+    for name in ("self", "cls"):
+        arguments.pop(name, None)
+
+    return arguments
+
+
+def format_tags(tags: Sequence[str], arguments: Dict[str, Any]) -> List[str]:
+    return [tag.format(**arguments) for tag in tags]
+
 
 class RedisCacheDecorator:
-    def __init__(self, ttl: int = 60):
-        self.ttl = ttl
+    """
+    캐시 키 형식: {prefix}:{app version}:{format}:{serializer}:{module.qualname}:{schema version}:{args hash}
 
-    def key_builder(self, *args) -> str:
-        return ":".join(map(str, args))
+    - 인자는 함수 시그니처로 바인딩해서 정규화한다. (positional/keyword 호출이 같은 키가 된다)
+    - self/cls는 키에서 제외한다. 레포지토리는 요청마다 새로 만들어지기 때문이다.
+    - 반환 DTO의 구조가 바뀌면 schema version이 바뀌므로, 이전 배포의 객체를 unpickle하지 않는다.
+    - tags의 현재 세대(generation)가 args hash에 포함된다. RedisCacheInvalidator가 세대를 올리면
+      이전 키는 더 이상 조회되지 않는다. 예: tags=("class_notice:{class_id}",)
+    - 같은 키의 miss는 워커 안에서 하나의 계산으로 합쳐진다(single-flight).
+      lock=True면 Redis 락으로 워커 사이에서도 한 곳만 계산하고, 나머지는 lock_wait초 동안 결과를 기다린다.
+    - ttl이 지난 값은 stale_ttl초 동안 더 남아서, 그 동안은 stale 값을 바로 돌려주고 백그라운드에서 갱신한다.
+      early_refresh(XFetch의 beta)가 0보다 크면 만료 전에도 확률적으로 미리 갱신한다.
+      jitter는 TTL을 최대 그 비율만큼 줄여서 같이 쓰인 키들의 만료 시점을 흩뜨린다.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        version: Optional[str] = None,
+        tags: Sequence[str] = (),
+        lock: bool = False,
+        lock_timeout: Optional[float] = None,
+        lock_wait: Optional[float] = None,
+        stale_ttl: int = 0,
+        early_refresh: float = 0.0,
+        jitter: Optional[float] = None,
+    ):
+        self.ttl = ttl or config.CACHE_TTL
+        self.version = version
+        self.tags = tags
+        self.lock = lock
+        self.lock_timeout = lock_timeout or config.CACHE_LOCK_TIMEOUT
+        self.lock_wait = lock_wait or config.CACHE_LOCK_WAIT
+        self.stale_ttl = stale_ttl
+        self.early_refresh = early_refresh
+        self.jitter = config.CACHE_TTL_JITTER if jitter is None else jitter
+        self.return_type: Any = Any
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 백그라운드 갱신은 다른 워커가 락을 잡고 있으면 None으로 끝나므로, miss가 기다리는 _inflight와 따로 둔다.
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        # single_flight 태스크마다 기다리는 요청 수
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    def namespace(self, func: Callable) -> str:
+        return ":".join(
+            [
+                config.CACHE_KEY_PREFIX,
+                config.VERSION,
+                CACHE_FORMAT,
+                config.CACHE_SERIALIZER,
+                f"{func.__module__}.{func.__qualname__}",
+                self.version or schema_version(func),
+            ]
+        )
+
+    def key_builder(
+        self,
+        namespace: str,
+        arguments: Dict[str, Any],
+        generations: Sequence[int] = (),
+    ) -> str:
+        # orjson은 dataclass, datetime, Enum, UUID를 그대로 직렬화하고, 모르는 타입이면 에러를 낸다.
+        # repr()처럼 메모리 주소가 키에 섞이는 일이 없다.
+        payload = orjson.dumps(
+            [arguments, list(generations)], option=orjson.OPT_SORT_KEYS
+        )
+        return f"{namespace}:{digest(payload)}"
 
     def __call__(self, func):
+        signature = inspect.signature(func)
+        namespace: Optional[str] = None
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            _key = self.key_builder(func.__name__, *args, *kwargs)
+            nonlocal namespace
+            if namespace is None:
+                namespace = self.namespace(func)
+                # serializer가 DTO를 복원할 때 쓸 타입
+                self.return_type = typing.get_type_hints(func).get("return", Any)
 
-            if await redis_cache.exists(_key):
-                logger.debug("Cache hit")
-                result = await redis_cache.get(_key)
-            else:
+            arguments = bind_arguments(signature, *args, **kwargs)
+            generations = await redis_cache.get_generations(
+                format_tags(self.tags, arguments)
+            )
+
+            _key = self.key_builder(namespace, arguments, generations)
+
+            entry = await redis_cache.get_entry(_key, self.return_type)
+            if entry is None:
                 logger.debug("Cache miss")
-                result = await func(*args, **kwargs)
-                if result:
-                    await redis_cache.set(_key, result, ttl=self.ttl)
+                return await self.single_flight(
+                    _key, lambda: self.load(_key, func, args, kwargs)
+                )
+
+            now = time.time()
+            if entry.is_stale(now):
+                logger.debug("Cache hit (stale)")
+                self.refresh(_key, entry, func, args, kwargs)
+            elif self.should_refresh_early(entry, now):
+                logger.debug("Cache hit (early refresh)")
+                self.refresh(_key, entry, func, args, kwargs)
+            else:
+                logger.debug("Cache hit")
+
+            return entry.value
+
+        return wrapper
+
+    async def single_flight(self, key: str, load: Callable[[], Awaitable[Any]]):
+        """
+        키마다 계산 태스크를 하나만 띄우고, 나머지 호출은 그 태스크를 기다린다.
+        먼저 들어온 요청이 취소되어도 기다리던 요청들이 결과를 받을 수 있도록 별도 태스크로 실행한다.
+        별도 태스크는 요청 세션이 아니라 자기 세션을 쓴다. (create_detached_task)
+        기다리던 요청이 모두 취소되면(타임아웃, 클라이언트 끊김) 계산도 취소해서 커넥션을 바로 돌려준다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = create_detached_task(load())
+            self._inflight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda _: self.forget(key, task))
+
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if not task.done():
+                self._waiters[task] -= 1
+                if self._waiters[task] == 0:
+                    # 취소가 끝나기(롤백, asyncpg cancel 왕복)를 기다리는 동안 들어온 요청은
+                    # 취소될 태스크가 아니라 새 태스크를 띄워야 하므로 먼저 목록에서 뺀다.
+                    self.forget(key, task)
+                    task.cancel()
+
+    def forget(self, key: str, task: asyncio.Task) -> None:
+        # 같은 키로 이미 새 태스크가 떴으면 그것은 지우지 않는다.
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._waiters.pop(task, None)
+
+    def should_refresh_early(self, entry: CacheEntry, now: float) -> bool:
+        """
+        XFetch: 만료가 가까울수록, 계산이 오래 걸리는 값일수록 일찍 다시 계산할 확률이 높다.
+        """
+        if self.early_refresh <= 0:
+            return False
+
+        return (
+            now - entry.delta * self.early_refresh * math.log(1.0 - random.random())
+            >= entry.soft_expires_at
+        )
+
+    def refresh(
+        self, key: str, entry: CacheEntry, func: Callable, args: tuple, kwargs: dict
+    ) -> None:
+        """
+        기다리지 않는 백그라운드 갱신. 이미 계산 중인 키면 아무것도 하지 않는다.
+        갱신 중에 키가 만료되면 miss는 갱신을 기다리지 않고 single_flight로 따로 계산한다.
+
+        L1을 쓰면 다른 워커가 이미 Redis의 값을 갱신했어도 이 워커의 L1에는 옛 값이 남아 있다.
+        그래서 다시 계산하기 전에 Redis를 직접 읽어 보고, 더 새 값이 있으면 그것으로 L1을 바꾸고 끝낸다.
+        """
+        if key in self._inflight or key in self._refreshing:
+            return
+
+        async def _refresh():
+            try:
+                if redis_cache.local is not None:
+                    latest = await redis_cache.get_entry(
+                        key, self.return_type, remote=True
+                    )
+                    if (
+                        latest is not None
+                        and latest.soft_expires_at > entry.soft_expires_at
+                    ):
+                        return latest.value
+
+                return await self.load(key, func, args, kwargs, background=True)
+            except Exception as e:
+                logger.error(e)
+
+        task = create_detached_task(_refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def load(
+        self,
+        key: str,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        background: bool = False,
+    ):
+        if not self.lock:
+            return await self.compute(key, func, args, kwargs)
+
+        lock_key = f"{key}:lock"
+        token = uuid4().hex
+        if await redis_cache.acquire_lock(lock_key, token, self.lock_timeout):
+            try:
+                return await self.compute(key, func, args, kwargs)
+            finally:
+                await redis_cache.release_lock(lock_key, token)
+
+        if background:
+            # 다른 워커가 이미 갱신 중이다.
+            return None
+
+        # 다른 워커가 계산 중이다. 잠깐 기다려 보고, 그래도 없으면 직접 계산한다.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_wait
+        while loop.time() < deadline:
+            await asyncio.sleep(config.CACHE_LOCK_POLL_INTERVAL)
+            entry = await redis_cache.get_entry(key, self.return_type)
+            if entry is not None:
+                return entry.value
+
+        return await self.compute(key, func, args, kwargs)
+
+    async def compute(self, key: str, func: Callable, args: tuple, kwargs: dict):
+        started = time.perf_counter()
+        result = await func(*args, **kwargs)
+        delta = time.perf_counter() - started
+
+        if result:
+            # 같이 쓰인 키들이 한꺼번에 만료되지 않도록 TTL을 조금씩 줄인다.
+            ttl = self.ttl * (1 - self.jitter * random.random())
+            await redis_cache.set_entry(
+                key, result, ttl=ttl, stale_ttl=self.stale_ttl, delta=delta
+            )
+
+        return result
+
+
+class RedisCacheInvalidator:
+    """
+    데코레이트된 함수(쓰기)가 성공하면 tags의 세대를 올린다.
+    예: @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
+
+    replica를 쓰면 복제 지연 동안 다른 요청이 옛 데이터를 새 세대로 캐시할 수 있다.
+    그래서 DB_REPLICA_STICKY_SECONDS 뒤에 세대를 한 번 더 올린다. (delayed double invalidation)
+    """
+
+    def __init__(self, tags: Sequence[str]):
+        self.tags = tags
+        self._delayed: Set[asyncio.Task] = set()
+
+    def __call__(self, func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+
+            arguments = bind_arguments(signature, *args, **kwargs)
+            tags = format_tags(self.tags, arguments)
+            # 요청(unit of work) 안이면 커밋한 뒤에 세대를 올린다.
+            await after_commit(lambda: self.bump(tags))
 
             return result
 
         return wrapper
 
+    async def bump(self, tags: List[str]) -> None:
+        await redis_cache.bump_generations(tags)
+        if config.DB_REPLICA_URL:
+            self.bump_later(tags, config.DB_REPLICA_STICKY_SECONDS)
+
+    def bump_later(self, tags: List[str], delay: float) -> None:
+        async def _bump():
+            await asyncio.sleep(delay)
+            try:
+                await redis_cache.bump_generations(tags)
+            except Exception as e:
+                logger.error(e)
 
-# def key_builder(*args) -> str:
-#     return ":".join(map(str, args))
+        task = asyncio.create_task(_bump())
+        self._delayed.add(task)
+        task.add_done_callback(self._delayed.discard)
 
 
 redis_cache = RedisCache()
@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import orjson
+from fastapi import Request, Response
+from starlette import status
+
+from app.core.config import config
+from app.core.logger import logger
+from app.core.redis import CACHE_FORMAT, digest, format_tags, redis_cache
+
+
+def last_modified_from(*field_names: str) -> Callable[[Any], Optional[datetime]]:
+    """
+    응답 JSON의 data(단건 또는 목록)에서 가장 최근 시각을 찾는다.
+    field_names 중 값이 있는 첫 필드를 쓴다. 예: last_modified_from("updatedAt", "createdAt")
+    """
+
+    def last_modified(body: Dict[str, Any]) -> Optional[datetime]:
+        data = body.get("data")
+        if isinstance(data, dict) and isinstance(data.get("data"), list):
+            items = data["data"]
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = [data] if data else []
+
+        timestamps: List[datetime] = []
+        for item in items:
+            value = next((item[name] for name in field_names if item.get(name)), None)
+            if value:
+                timestamp = datetime.fromisoformat(value)
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
+                timestamps.append(timestamp)
+
+        return max(timestamps) if timestamps else None
+
+    return last_modified
+
+
+class ResponseCacheDecorator:
+    """
+    GET 엔드포인트의 최종 응답(ORJSON bytes)과 strong ETag를 캐시한다.
+    캐시가 있으면 서비스 레이어를 호출하지 않고, If-None-Match가 맞으면 본문 없이 304를 돌려준다.
+
+    tags는 RedisCacheDecorator와 같은 세대 태그이고, 엔드포인트의 인자로 포맷된다.
+    데코레이트되는 엔드포인트는 request: Request 인자를 받아야 한다.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        tags: Sequence[str] = (),
+        last_modified: Optional[Callable[[Any], Optional[datetime]]] = None,
+    ):
+        self.ttl = ttl or config.CACHE_TTL
+        self.tags = tags
+        self.last_modified = last_modified
+
+    def key_builder(self, request: Request, generations: Sequence[int]) -> str:
+        payload = orjson.dumps(
+            [request.url.path, sorted(request.query_params.multi_items()), generations]
+        )
+        return ":".join(
+            [
+                config.CACHE_KEY_PREFIX,
+                config.VERSION,
+                CACHE_FORMAT,
+                "response",
+                digest(payload),
+            ]
+        )
+
+    def __call__(self, func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not config.HTTP_CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            request: Request = kwargs["request"]
+            generations = await redis_cache.get_generations(
+                format_tags(self.tags, kwargs)
+            )
+            key = self.key_builder(request, generations)
+
+            cached = await redis_cache.get_bytes(key)
+            if cached is not None:
+                logger.debug("Response cache hit")
+                header, body = cached.split(b"\n", 1)
+                headers = orjson.loads(header)
+            else:
+                logger.debug("Response cache miss")
+                response = await func(*args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+                body = response.body
+                headers = self.build_headers(body)
+                await redis_cache.set_bytes(
+                    key, orjson.dumps(headers) + b"\n" + body, ttl=self.ttl
+                )
+
+            if self.not_modified(request, headers["ETag"]):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
+
+        return wrapper
+
+    def build_headers(self, body: bytes) -> Dict[str, str]:
+        headers = {"ETag": f'"{digest(body)}"'}
+
+        if self.last_modified is not None:
+            last_modified = self.last_modified(orjson.loads(body))
+            if last_modified is not None:
+                headers["Last-Modified"] = format_datetime(
+                    last_modified.astimezone(timezone.utc), usegmt=True
+                )
+
+        return headers
+
+    def not_modified(self, request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+
+        # If-None-Match는 weak comparison이다. (RFC 9110 13.1.2)
+        candidates = [value.strip() for value in if_none_match.split(",")]
+        return "*" in candidates or etag in (
+            value.removeprefix("W/") for value in candidates
+        )
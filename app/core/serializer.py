@@ -0,0 +1,175 @@
+import pickle
+import typing
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Type, Union
+from uuid import UUID
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성이다.
+    msgpack = None
+
+
+class Serializer:
+    """
+    RedisCache에 저장할 값을 bytes로 바꾼다.
+    loads는 반환 타입(type_)을 받아서 dataclass DTO를 그대로 복원한다.
+    """
+
+    name: str
+
+    def dumps(self, value: object) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes, type_: Any = Any) -> object:
+        raise NotImplementedError
+
+
+class PickleSerializer(Serializer):
+    name = "pickle"
+
+    def dumps(self, value: object) -> bytes:
+        return pickle.dumps(value)
+
+    def loads(self, data: bytes, type_: Any = Any) -> object:
+        return pickle.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    name = "orjson"
+
+    def dumps(self, value: object) -> bytes:
+        # dataclass, datetime, Enum, UUID는 orjson이 직접 직렬화한다.
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes, type_: Any = Any) -> object:
+        return from_primitive(type_, orjson.loads(data))
+
+
+class MsgpackSerializer(Serializer):
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+
+    def dumps(self, value: object) -> bytes:
+        return msgpack.packb(value, default=_to_primitive)
+
+    def loads(self, data: bytes, type_: Any = Any) -> object:
+        return from_primitive(type_, msgpack.unpackb(data, strict_map_key=False))
+
+
+def _to_primitive(value: object) -> object:
+    if is_dataclass(value):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+
+    raise TypeError(f"Type is not serializable: {type(value)}")
+
+
+def from_primitive(tp: Any, data: Any) -> Any:
+    """
+    JSON/msgpack으로 풀린 dict, list, str을 타입 힌트를 따라 DTO로 되돌린다.
+    """
+    return _decoder(tp)(data)
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _nullable(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if decode is _identity:
+        return decode
+
+    return lambda data: None if data is None else decode(data)
+
+
+@lru_cache(maxsize=None)
+def _decoder(tp: Any) -> Callable[[Any], Any]:
+    """
+    타입마다 디코더 함수를 한 번만 만들어 둔다.
+    매 호출마다 타입 힌트를 해석하면 목록 페이지 디코딩이 인코딩보다 수십 배 느려진다.
+    """
+    if tp is Any:
+        return _identity
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if origin is Union:
+        # Optional[X]는 X의 디코더로 처리한다. 그 밖의 Union은 그대로 둔다.
+        candidates = [arg for arg in args if arg is not type(None)]
+        return _decoder(candidates[0]) if len(candidates) == 1 else _identity
+
+    if origin in (list, tuple, set, frozenset):
+        decode_item = _nullable(_decoder(args[0] if args else Any))
+        if decode_item is _identity:
+            return _nullable(origin)
+        return _nullable(lambda data: origin(decode_item(item) for item in data))
+
+    if origin is dict:
+        decode_key, decode_value = (
+            (_decoder(args[0]), _nullable(_decoder(args[1])))
+            if args
+            else (_identity,) * 2
+        )
+        return _nullable(
+            lambda data: {
+                decode_key(key): decode_value(value) for key, value in data.items()
+            }
+        )
+
+    if is_dataclass(tp) and isinstance(tp, type):
+        hints = typing.get_type_hints(tp)
+        decoders = [
+            (f.name, _nullable(_decoder(hints.get(f.name, f.type))))
+            for f in fields(tp)
+            if f.init
+        ]
+        return _nullable(
+            lambda data: tp(
+                **{
+                    name: decode(data[name])
+                    for name, decode in decoders
+                    if name in data
+                }
+            )
+        )
+
+    if isinstance(tp, type):
+        if issubclass(tp, datetime):
+            return _nullable(datetime.fromisoformat)
+        if issubclass(tp, date):
+            return _nullable(date.fromisoformat)
+        if issubclass(tp, Enum):
+            return _nullable(tp)
+        if issubclass(tp, UUID):
+            return _nullable(tp)
+        if tp in (int, float):
+            # JSON 객체의 키는 문자열이므로 Dict[int, ...]의 키를 되돌린다.
+            return _nullable(lambda data: tp(data) if isinstance(data, str) else data)
+
+    return _identity
+
+
+SERIALIZERS: Dict[str, Type[Serializer]] = {
+    PickleSerializer.name: PickleSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+    MsgpackSerializer.name: MsgpackSerializer,
+}
+
+
+def get_serializer(name: str) -> Serializer:
+    return SERIALIZERS[name]()
@@ -59,16 +59,26 @@
 #     async with AsyncScopedSession() as session:
 #         logger.debug(session)
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from starlette_context.middleware import ContextMiddleware
 
 from app.core.config import config
 from app.core.lifespan import lifespan
 from app.core.container import Container
+from app.core.middlewares.deadline import DeadlineMiddleware
 from app.core.middlewares.sqlalchemy import SQLAlchemyMiddleware
-from app.core.errors.error import BaseAPIException, BaseAuthException
-from app.core.errors.handler import api_error_handler, api_auth_error_handler
+from app.core.errors.error import (
+    BaseAPIException,
+    BaseAuthException,
+    BaseTimeoutException,
+)
+from app.core.errors.handler import (
+    api_error_handler,
+    api_auth_error_handler,
+    api_timeout_error_handler,
+)
 from app.routers import router
 
 
@@ -81,6 +91,7 @@ def create_app(container=Container()) -> FastAPI:
     app.include_router(router)
     app.add_exception_handler(BaseAPIException, api_error_handler)
     app.add_exception_handler(BaseAuthException, api_auth_error_handler)
+    app.add_exception_handler(BaseTimeoutException, api_timeout_error_handler)
 
     app.add_middleware(
         CORSMiddleware,
@@ -90,6 +101,7 @@ def create_app(container=Container()) -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(SQLAlchemyMiddleware)
+    app.add_middleware(DeadlineMiddleware)
     app.add_middleware(ContextMiddleware)
 
     return app
@@ -101,3 +113,15 @@ app = create_app()
 @app.get("/")
 async def root():
     return {"message": "Hello World"}
+
+
+@app.get("/ready")
+async def ready(request: Request):
+    # 커넥션 풀 워밍업(lifespan)이 끝나야 트래픽을 받는다.
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"message": "Warming up"},
+        )
+
+    return {"message": "OK"}
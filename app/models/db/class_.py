@@ -2,48 +2,136 @@
 
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import String, DateTime, Integer, Text
+from sqlalchemy import Computed, String, DateTime, Index, Integer, Text, Uuid, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
 from app.core.db.session import Base
 
+# 전문 검색 설정. 한국어 형태소 사전이 없으므로 공백 단위로 자르고 소문자로만 바꾼다.
+# 바꾸면 search_vector를 다시 만들어야 한다.
+SEARCH_CONFIG = "simple"
+
 
 class Class(Base):
+    """
+    id 컬럼(class_id, teacher_id, student_id)은 모두 UUIDv7(app.core.ids.uuid7)을 담는 uuid 타입이다.
+    기존 uuid4 hex 문자열은 그대로 uuid로 바뀐다. 한 트랜잭션에서 참조하는 쪽부터 바꾼다.
+    (모델에는 외래 키가 없다. DB에 따로 만든 외래 키가 있으면 먼저 지우고 끝난 뒤 다시 만든다)
+    BEGIN;
+    ALTER TABLE class_notice ALTER COLUMN class_id TYPE uuid USING class_id::uuid;
+    ALTER TABLE class_notice_count ALTER COLUMN class_id TYPE uuid USING class_id::uuid;
+    ALTER TABLE class_student ALTER COLUMN class_id TYPE uuid USING class_id::uuid,
+        ALTER COLUMN student_id TYPE uuid USING student_id::uuid;
+    ALTER TABLE class ALTER COLUMN class_id TYPE uuid USING class_id::uuid,
+        ALTER COLUMN teacher_id TYPE uuid USING teacher_id::uuid;
+    ALTER TABLE student ALTER COLUMN student_id TYPE uuid USING student_id::uuid;
+    ALTER TABLE teacher ALTER COLUMN teacher_id TYPE uuid USING teacher_id::uuid;
+    COMMIT;
+
+    목록은 (created_at DESC, class_id DESC) 순이고, 같은 순서의 인덱스를 그대로 따라 읽는다. (정렬 없음)
+    created_at은 DB의 now()(트랜잭션 시작 시각)로 채운다. 한 트랜잭션에서 넣은 행은 시각이 같고 class_id로 구분된다.
+    ALTER TABLE class ALTER COLUMN created_at SET DEFAULT now();
+    CREATE INDEX CONCURRENTLY ix_class_created_at_class_id ON class (created_at DESC, class_id DESC);
+    """
+
     __tablename__ = "class"
 
-    class_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    class_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     class_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    teacher_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    teacher_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
 
+Index("ix_class_created_at_class_id", Class.created_at.desc(), Class.class_id.desc())
+
+
 class ClassNotice(Base):
+    """
+    search_vector는 message로 DB가 채우는 tsvector이고, GIN 인덱스로 검색한다.
+    기존 테이블에는 컬럼과 인덱스를 따로 만들어야 한다.
+    ALTER TABLE class_notice ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', message)) STORED;
+    CREATE INDEX CONCURRENTLY ix_class_notice_search_vector ON class_notice USING gin (search_vector);
+
+    목록은 클래스마다 (created_at DESC, id DESC) 순이고, (class_id, created_at DESC, id DESC) 인덱스로 읽는다.
+    class_id로만 찾는 조회도 이 인덱스를 쓰므로 class_id 단독 인덱스는 없앤다.
+    ALTER TABLE class_notice ALTER COLUMN created_at SET DEFAULT now();
+    CREATE INDEX CONCURRENTLY ix_class_notice_class_id_created_at_id
+        ON class_notice (class_id, created_at DESC, id DESC);
+    DROP INDEX CONCURRENTLY ix_class_notice_class_id;
+    """
+
     __tablename__ = "class_notice"
+    __table_args__ = (
+        Index("ix_class_notice_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    class_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    class_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
     message: Mapped[str] = mapped_column(
         Text, nullable=False
     )  # Text는 길이 제한이 없다.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # UPDATE 문에 updated_at=now()가 붙어서 DB 시각으로 채워지고, RETURNING으로 돌아온다.
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True, onupdate=datetime.now()
+        DateTime(timezone=True), nullable=True, onupdate=func.now()
     )
+    # 검색에만 쓰므로 엔티티를 읽을 때는 가져오지 않는다.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', message)", persisted=True),
+        deferred=True,
+    )
+
+
+Index(
+    "ix_class_notice_class_id_created_at_id",
+    ClassNotice.class_id,
+    ClassNotice.created_at.desc(),
+    ClassNotice.id.desc(),
+)
 
 
 class ClassStudent(Base):
-    __tablename__ = "class_student"
+    """
+    클래스 수강 학생. PK (class_id, student_id)로 클래스의 학생 목록(roster)을 student_id 순으로 읽는다.
+    학생의 클래스 목록은 PK로 찾을 수 없으므로 (student_id, class_id) 역방향 인덱스로 읽는다.
+
+    기존 테이블에는 인덱스를 따로 만들어야 한다.
+    CREATE INDEX CONCURRENTLY ix_class_student_student_id_class_id ON class_student (student_id, class_id);
+    """
 
-    class_id: Mapped[str] = mapped_column(String(255), nullable=False, primary_key=True)
-    student_id: Mapped[str] = mapped_column(
-        String(255), nullable=False, primary_key=True
+    __tablename__ = "class_student"
+    __table_args__ = (
+        Index("ix_class_student_student_id_class_id", "student_id", "class_id"),
     )
+
+    class_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, primary_key=True)
+    student_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, primary_key=True)
+    # 벌크 등록은 Core INSERT로 하므로 등록 시각은 DB에서 채운다.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+
+class ClassNoticeCount(Base):
+    """
+    클래스별 공지사항 개수. 공지사항 생성/삭제와 같은 트랜잭션에서 증감한다.
+    count(*) 대신 PK 조회 한 번으로 total을 구하기 위한 테이블이다.
+
+    기존 데이터는 한 번 채워 넣어야 한다.
+    INSERT INTO class_notice_count SELECT class_id, count(*) FROM class_notice GROUP BY class_id;
+    """
+
+    __tablename__ = "class_notice_count"
+
+    class_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
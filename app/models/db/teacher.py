@@ -1,7 +1,8 @@
 # app/models/db/teacher.py
 from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Uuid, func
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
@@ -11,8 +12,8 @@ from app.core.db.session import Base
 class Teacher(Base):
     __tablename__ = "teacher"
 
-    teacher_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    teacher_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
     teacher_name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
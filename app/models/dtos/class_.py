@@ -1,15 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
+from uuid import UUID
 
 from app.models.dtos.common import PageDTO
 
 
 @dataclass
 class ClassDTO:
-    class_id: str
+    class_id: UUID
     class_name: str
-    teacher_id: str
+    teacher_id: UUID
     created_at: Optional[datetime] = None
 
 
@@ -22,7 +23,7 @@ class ClassListDTO:
 @dataclass
 class ClassNoticeDTO:
     notice_id: int
-    class_id: str
+    class_id: UUID
     message: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -32,3 +33,22 @@ class ClassNoticeDTO:
 class ClassNoticeListDTO:
     data: List[ClassNoticeDTO]
     page: PageDTO
+
+
+@dataclass
+class ClassStudentDTO:
+    class_id: UUID
+    student_id: UUID
+    created_at: Optional[datetime] = None
+
+
+@dataclass
+class ClassStudentListDTO:
+    data: List[ClassStudentDTO]
+    page: PageDTO
+
+
+@dataclass
+class ClassStudentBulkDTO:
+    enrolled: int  # 새로 등록된 학생 수
+    already_enrolled: int  # 이미 등록되어 있어서 건너뛴 학생 수
@@ -1,8 +1,25 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
 class PageDTO:
-    total: int
+    total: Optional[int]
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class BulkErrorDTO:
+    index: int  # 요청 목록에서의 위치
+    code: str
+    message: str
+
+
+@dataclass
+class BulkDTO(Generic[T]):
+    data: List[T] = field(default_factory=list)
+    errors: List[BulkErrorDTO] = field(default_factory=list)
@@ -1,13 +1,14 @@
 from typing import Optional
 from dataclasses import dataclass
 from datetime import datetime
+from uuid import UUID
 
 from app.models.constants import UserRole
 
 
 @dataclass
 class UserDTO:
-    user_id: str
+    user_id: UUID
     user_name: str
     user_role: UserRole
     created_at: Optional[datetime] = None
@@ -6,14 +6,20 @@ from pydantic import BaseModel, Field
 from pydantic.dataclasses import dataclass
 from typing import List
 
+from app.core.config import config
+from app.core.ids import uuid7
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.class_ import (
     ClassDTO,
     ClassNoticeDTO,
     ClassListDTO,
     ClassNoticeListDTO,
+    ClassStudentDTO,
+    ClassStudentListDTO,
+    ClassStudentBulkDTO,
 )
-from app.models.schemas.common import PageResp
-from uuid import uuid4
+from app.models.schemas.common import BulkErrorResp, PageResp
+from uuid import UUID
 
 
 class ClassReq(BaseModel):  # postfix로 Req, Resp는 각각 요청, 응답이다. 식별을 위함.
@@ -21,13 +27,13 @@ class ClassReq(BaseModel):  # postfix로 Req, Resp는 각각 요청, 응답이
     className: str = Field(
         ..., description="Class Name"
     )  # 외부 통신은 서로 다른 언어와 통신한다. 팀바팀, 사바사로 카멜/스네이크를 따라라.
-    teacherId: str = Field(
+    teacherId: UUID = Field(
         ..., description="Teacher ID"
     )  # 필드에 대한 정보들을 파라미터로 추가할 수 있다. 파라미터 목록 살펴보기.
 
     def to_dto(self) -> ClassDTO:
         return ClassDTO(
-            class_id=uuid4().hex,
+            class_id=uuid7(),
             class_name=self.className,
             teacher_id=self.teacherId,
         )
@@ -35,9 +41,9 @@ class ClassReq(BaseModel):  # postfix로 Req, Resp는 각각 요청, 응답이
 
 @dataclass
 class ClassResp:  # 실제 반환은 ORJSONResponse로 한다.
-    classId: str = Field(..., description="Class ID")
+    classId: UUID = Field(..., description="Class ID")
     className: str = Field(..., description="Class Name")
-    teacherId: str = Field(..., description="Teacher ID")
+    teacherId: UUID = Field(..., description="Teacher ID")
     createdAt: datetime = Field(..., description="Created At")
     # dataclass로 정의하면 바로 JSON으로 변환돼서 성능이 개선된다.
 
@@ -58,6 +64,28 @@ class ClassResp:  # 실제 반환은 ORJSONResponse로 한다.
         )
 
 
+class ClassBulkReq(BaseModel):
+    data: List[ClassReq] = Field(
+        ..., min_length=1, max_length=config.BULK_MAX_ROWS, description="Classes"
+    )
+
+    def to_dtos(self) -> List[ClassDTO]:
+        return [class_.to_dto() for class_ in self.data]
+
+
+@dataclass
+class ClassBulkResp:
+    data: List[ClassResp] = Field(..., description="Created classes")
+    errors: List[BulkErrorResp] = Field(..., description="Rows that failed")
+
+    @classmethod
+    def from_dto(cls, dto: BulkDTO[ClassDTO]) -> "ClassBulkResp":
+        return cls(
+            data=[ClassResp.from_dto(class_) for class_ in dto.data],
+            errors=[BulkErrorResp.from_dto(error) for error in dto.errors],
+        )
+
+
 @dataclass
 class ClassListResp:
     data: List[ClassResp] = Field(..., description="Data")
@@ -74,7 +102,9 @@ class ClassListResp:
 class ClassNoticeReq(BaseModel):
     message: str = Field(..., description="Message")
 
-    def to_dto(self, class_id: str = None, notice_id: int = None) -> ClassNoticeDTO:
+    def to_dto(
+        self, class_id: Optional[UUID] = None, notice_id: Optional[int] = None
+    ) -> ClassNoticeDTO:
         return ClassNoticeDTO(
             notice_id=notice_id,
             class_id=class_id,
@@ -85,7 +115,7 @@ class ClassNoticeReq(BaseModel):
 @dataclass
 class ClassNoticeResp:
     id: int = Field(..., description="ID")
-    classId: str = Field(..., description="Class ID")
+    classId: UUID = Field(..., description="Class ID")
     message: str = Field(..., description="Message")
     createdAt: datetime = Field(..., description="Created At")
     updatedAt: Optional[datetime] = Field(None, description="Updated At")
@@ -112,3 +142,49 @@ class ClassNoticeListResp:
             data=[ClassNoticeResp.from_dto(class_notice) for class_notice in dto.data],
             page=PageResp.from_dto(dto.page),
         )
+
+
+class ClassStudentBulkReq(BaseModel):
+    studentIds: List[UUID] = Field(
+        ..., min_length=1, max_length=config.BULK_MAX_ROWS, description="Student IDs"
+    )
+
+
+@dataclass
+class ClassStudentBulkResp:
+    enrolled: int = Field(..., description="Newly enrolled")
+    alreadyEnrolled: int = Field(..., description="Skipped (already enrolled)")
+
+    @classmethod
+    def from_dto(cls, dto: ClassStudentBulkDTO) -> "ClassStudentBulkResp":
+        return cls(enrolled=dto.enrolled, alreadyEnrolled=dto.already_enrolled)
+
+
+@dataclass
+class ClassStudentResp:
+    classId: UUID = Field(..., description="Class ID")
+    studentId: UUID = Field(..., description="Student ID")
+    createdAt: datetime = Field(..., description="Enrolled At")
+
+    @classmethod
+    def from_dto(cls, dto: ClassStudentDTO) -> "ClassStudentResp":
+        return cls(
+            classId=dto.class_id,
+            studentId=dto.student_id,
+            createdAt=dto.created_at,
+        )
+
+
+@dataclass
+class ClassStudentListResp:
+    data: List[ClassStudentResp] = Field(..., description="Data")
+    page: PageResp = Field(..., description="Page")
+
+    @classmethod
+    def from_dto(cls, dto: ClassStudentListDTO) -> "ClassStudentListResp":
+        return cls(
+            data=[
+                ClassStudentResp.from_dto(class_student) for class_student in dto.data
+            ],
+            page=PageResp.from_dto(dto.page),
+        )
@@ -4,7 +4,7 @@ from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
 
-from app.models.dtos.common import PageDTO
+from app.models.dtos.common import BulkErrorDTO, PageDTO
 
 
 T = TypeVar("T")
@@ -37,8 +37,27 @@ class HttpResponse(ORJSONResponse):
 class PageResp:
     page: int
     limit: int
-    total: int
+    total: Optional[int]
+    nextCursor: Optional[str] = (
+        None  # 다음 페이지를 cursor로 조회할 때 쓴다. 마지막 페이지면 None
+    )
 
     @classmethod
     def from_dto(cls, dto: PageDTO) -> "PageResp":
-        return cls(page=dto.page, limit=dto.limit, total=dto.total)
+        return cls(
+            page=dto.page,
+            limit=dto.limit,
+            total=dto.total,
+            nextCursor=dto.next_cursor,
+        )
+
+
+@dataclass
+class BulkErrorResp:
+    index: int  # 요청 목록에서 실패한 행의 위치
+    statusCode: str
+    message: str
+
+    @classmethod
+    def from_dto(cls, dto: BulkErrorDTO) -> "BulkErrorResp":
+        return cls(index=dto.index, statusCode=dto.code, message=dto.message)
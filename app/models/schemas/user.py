@@ -1,11 +1,16 @@
-from uuid import uuid4
+from uuid import UUID
 from datetime import datetime
+from typing import List
 
 from pydantic import BaseModel, Field
 from pydantic.dataclasses import dataclass
 
+from app.core.config import config
+from app.core.ids import uuid7
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.user import UserDTO
 from app.models.constants import UserRole
+from app.models.schemas.common import BulkErrorResp
 
 
 class UserReq(BaseModel):
@@ -13,7 +18,7 @@ class UserReq(BaseModel):
 
     def to_dto(self, user_role: UserRole) -> UserDTO:
         return UserDTO(
-            user_id=uuid4().hex,
+            user_id=uuid7(),
             user_name=self.userName,
             user_role=user_role,
         )
@@ -21,7 +26,7 @@ class UserReq(BaseModel):
 
 @dataclass
 class UserResp:
-    userId: str = Field(..., title="User ID")
+    userId: UUID = Field(..., title="User ID")
     userName: str = Field(..., title="Username")
     userRole: UserRole = Field(..., title="User Role")
     createdAt: datetime = Field(..., title="Created At")
@@ -33,3 +38,25 @@ class UserResp:
             userRole=dto.user_role.value,
             createdAt=dto.created_at,
         )
+
+
+class UserBulkReq(BaseModel):
+    data: List[UserReq] = Field(
+        ..., min_length=1, max_length=config.BULK_MAX_ROWS, title="Users"
+    )
+
+    def to_dtos(self, user_role: UserRole) -> List[UserDTO]:
+        return [user.to_dto(user_role=user_role) for user in self.data]
+
+
+@dataclass
+class UserBulkResp:
+    data: List[UserResp] = Field(..., title="Created users")
+    errors: List[BulkErrorResp] = Field(..., title="Rows that failed")
+
+    @classmethod
+    def from_dto(cls, dto: BulkDTO[UserDTO]) -> "UserBulkResp":
+        return cls(
+            data=[UserResp.from_dto(user) for user in dto.data],
+            errors=[BulkErrorResp.from_dto(error) for error in dto.errors],
+        )
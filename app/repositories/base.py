@@ -0,0 +1,312 @@
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import Row, bindparam, delete, insert, select, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import Executable
+
+from app.core.config import config
+from app.core.db.session import AsyncScopedSession, read_connection
+from app.core.errors.error import BaseAPIException, BaseTimeoutException
+from app.core.logger import logger
+from app.models.dtos.common import BulkDTO, BulkErrorDTO
+
+T = TypeVar("T")
+
+
+class BaseRepository(Generic[T]):
+    """
+    테이블 하나에 대한 단건/여러 건 CRUD.
+    model, columns(DTO 필드 순서대로), dto만 정하면 된다. 조회 결과 행은 dto(*row)로 바로 만든다.
+
+    구문은 (클래스, 모양)마다 bindparam 템플릿으로 한 번만 만들어서 재사용한다.
+    같은 구문 객체는 캐시 키가 메모이즈되어 있어서 매 호출마다 구문을 만들고 캐시 키를 계산하는 비용이 없다.
+    컴파일 시간과 캐시 적중은 app.core.metrics.statement_metrics에서 볼 수 있다.
+
+    쓰기는 요청 세션(unit of work)의 트랜잭션에서 Core로 실행하고, 커밋은 하지 않는다.
+    """
+
+    model: ClassVar[type]
+    columns: ClassVar[Tuple[Any, ...]]
+    dto: ClassVar[Callable[..., Any]]
+
+    _statements: ClassVar[Dict[Tuple, Executable]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._statements = {}
+
+    @classmethod
+    def statement(cls, key: Tuple, build: Callable[[], Executable]) -> Executable:
+        stmt = cls._statements.get(key)
+        if stmt is None:
+            stmt = cls._statements[key] = build()
+
+        return stmt
+
+    @classmethod
+    def to_dto(cls, row: Row) -> T:
+        return cls.dto(*row)
+
+    @classmethod
+    def where(cls, names: Sequence[str]) -> List[Any]:
+        # bindparam 이름이 컬럼 이름과 같으면 UPDATE의 SET 절과 겹치므로 접두어를 붙인다.
+        return [getattr(cls.model, name) == bindparam(f"w_{name}") for name in names]
+
+    @classmethod
+    def insert_stmt(cls) -> Executable:
+        # VALUES의 컬럼은 실행할 때 넘긴 파라미터의 키로 정해진다.
+        return cls.statement(
+            ("insert",),
+            lambda: insert(cls.model).returning(
+                *cls.columns, sort_by_parameter_order=True
+            ),
+        )
+
+    @classmethod
+    def select_stmt(cls, where: Sequence[str]) -> Executable:
+        return cls.statement(
+            ("select", tuple(where)),
+            lambda: select(*cls.columns).where(*cls.where(where)),
+        )
+
+    @classmethod
+    def select_in_stmt(cls, by: str) -> Executable:
+        return cls.statement(
+            ("select_in", by),
+            lambda: select(*cls.columns).where(
+                getattr(cls.model, by).in_(bindparam("values", expanding=True))
+            ),
+        )
+
+    @classmethod
+    def update_stmt(
+        cls, where: Sequence[str], values: Sequence[str], returning: bool = True
+    ) -> Executable:
+        def build():
+            stmt = (
+                update(cls.model)
+                .where(*cls.where(where))
+                .values({name: bindparam(f"v_{name}") for name in values})
+            )
+            return stmt.returning(*cls.columns) if returning else stmt
+
+        return cls.statement(("update", tuple(where), tuple(values), returning), build)
+
+    @classmethod
+    def delete_stmt(cls, where: Sequence[str]) -> Executable:
+        return cls.statement(
+            ("delete", tuple(where)),
+            lambda: delete(cls.model).where(*cls.where(where)).returning(*cls.columns),
+        )
+
+    @classmethod
+    def delete_in_stmt(cls, by: str) -> Executable:
+        return cls.statement(
+            ("delete_in", by),
+            lambda: delete(cls.model)
+            .where(getattr(cls.model, by).in_(bindparam("values", expanding=True)))
+            .returning(*cls.columns),
+        )
+
+    @asynccontextmanager
+    async def writing(
+        self, failure: Optional[Type[BaseAPIException]] = None
+    ) -> AsyncIterator[AsyncConnection]:
+        session = AsyncScopedSession()
+        try:
+            yield await session.connection()
+        except Exception as e:
+            logger.error(e)
+            await session.rollback()
+            # 시간 예산 초과는 요청 실패(504)이므로 failure로 바꾸지 않는다.
+            if failure is None or isinstance(e, BaseTimeoutException):
+                raise
+            raise failure()
+
+    async def create(
+        self,
+        values: Dict[str, Any],
+        failure: Optional[Type[BaseAPIException]] = None,
+    ) -> T:
+        return (await self.create_many([values], failure))[0]
+
+    async def create_many(
+        self,
+        rows: List[Dict[str, Any]],
+        failure: Optional[Type[BaseAPIException]] = None,
+    ) -> List[T]:
+        """
+        여러 행을 한 번에 넣는다. (insertmanyvalues: 여러 행 VALUES + RETURNING)
+        돌려주는 DTO는 rows와 같은 순서다.
+        """
+        if not rows:
+            return []
+
+        async with self.writing(failure) as connection:
+            results = (await connection.execute(self.insert_stmt(), rows)).all()
+
+        return [self.to_dto(row) for row in results]
+
+    async def create_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        failure: Type[BaseAPIException],
+        batch_size: Optional[int] = None,
+    ) -> BulkDTO[T]:
+        """
+        수천 행을 batch_size개씩 SAVEPOINT 안에서 넣는다. (insertmanyvalues + RETURNING)
+        배치가 중복/잘못된 값으로 실패하면 그 배치만 한 행씩 다시 넣어서 실패한 행을 골라낸다.
+        실패한 행은 errors에 (요청 목록의 index, failure의 코드)로 남고, 나머지 행은 그대로 들어간다.
+
+        COPY(copy_records_to_table)는 RETURNING이 없고 한 행만 잘못돼도 전체가 실패해서 쓰지 않는다.
+        그 밖의 DB 에러(커넥션 끊김 등)는 행 단위 문제가 아니므로 전체를 롤백하고 failure를 던진다.
+        """
+        batch_size = batch_size or config.BULK_BATCH_SIZE
+        result = BulkDTO()
+        session = AsyncScopedSession()
+
+        async with self.writing(failure) as connection:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                try:
+                    async with session.begin_nested():
+                        results = (
+                            await connection.execute(self.insert_stmt(), batch)
+                        ).all()
+                    result.data.extend(self.to_dto(row) for row in results)
+                    continue
+                except (DataError, IntegrityError) as e:
+                    logger.warning(f"Bulk insert batch failed, retrying per row: {e}")
+
+                for index, row in enumerate(batch, start):
+                    try:
+                        async with session.begin_nested():
+                            created = (
+                                await connection.execute(self.insert_stmt(), [row])
+                            ).one()
+                        result.data.append(self.to_dto(created))
+                    except (DataError, IntegrityError):
+                        reason = failure()
+                        result.errors.append(
+                            BulkErrorDTO(index, reason.code, reason.message)
+                        )
+
+        return result
+
+    async def read(self, **where: Any) -> Optional[T]:
+        async with read_connection() as connection:
+            result = (
+                await connection.execute(
+                    self.select_stmt(list(where)),
+                    {f"w_{name}": value for name, value in where.items()},
+                )
+            ).first()
+
+        return self.to_dto(result) if result else None
+
+    async def read_many(self, by: str, values: Sequence[Any]) -> List[T]:
+        """
+        by 컬럼이 values 중 하나인 행들. (WHERE by IN (...)) 순서는 보장하지 않는다.
+        """
+        if not values:
+            return []
+
+        async with read_connection() as connection:
+            results = (
+                await connection.execute(
+                    self.select_in_stmt(by), {"values": list(values)}
+                )
+            ).all()
+
+        return [self.to_dto(row) for row in results]
+
+    async def update(
+        self,
+        where: Dict[str, Any],
+        values: Dict[str, Any],
+        failure: Optional[Type[BaseAPIException]] = None,
+    ) -> Optional[T]:
+        stmt = self.update_stmt(list(where), list(values))
+        params = {f"w_{name}": value for name, value in where.items()}
+        params.update({f"v_{name}": value for name, value in values.items()})
+
+        async with self.writing(failure) as connection:
+            result = (await connection.execute(stmt, params)).first()
+
+        return self.to_dto(result) if result else None
+
+    async def update_many(
+        self,
+        by: str,
+        rows: List[Dict[str, Any]],
+        failure: Optional[Type[BaseAPIException]] = None,
+    ) -> int:
+        """
+        rows의 각 행에서 by 컬럼으로 대상을 찾아 나머지 값으로 고친다. (executemany)
+        executemany는 RETURNING을 지원하지 않으므로 고친 행 수만 돌려준다.
+        """
+        if not rows:
+            return 0
+
+        names = tuple(name for name in rows[0] if name != by)
+        stmt = self.update_stmt([by], names, returning=False)
+        params = [
+            {
+                f"w_{by}": row[by],
+                **{f"v_{name}": row[name] for name in names},
+            }
+            for row in rows
+        ]
+
+        async with self.writing(failure) as connection:
+            result = await connection.execute(stmt, params)
+
+        return result.rowcount
+
+    async def delete(
+        self,
+        failure: Optional[Type[BaseAPIException]] = None,
+        **where: Any,
+    ) -> Optional[T]:
+        async with self.writing(failure) as connection:
+            result = (
+                await connection.execute(
+                    self.delete_stmt(list(where)),
+                    {f"w_{name}": value for name, value in where.items()},
+                )
+            ).first()
+
+        return self.to_dto(result) if result else None
+
+    async def delete_many(
+        self,
+        by: str,
+        values: Sequence[Any],
+        failure: Optional[Type[BaseAPIException]] = None,
+    ) -> List[T]:
+        if not values:
+            return []
+
+        async with self.writing(failure) as connection:
+            results = (
+                await connection.execute(
+                    self.delete_in_stmt(by), {"values": list(values)}
+                )
+            ).all()
+
+        return [self.to_dto(row) for row in results]
@@ -1,217 +1,626 @@
-from typing import List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional
+from uuid import UUID
 
-from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy import (
+    BigInteger,
+    bindparam,
+    column,
+    func,
+    lambda_stmt,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from app.core.logger import logger
-from app.core.redis import RedisCacheDecorator
+from app.core.pagination import (
+    cursor_datetime,
+    cursor_uuid,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.redis import RedisCacheDecorator, RedisCacheInvalidator
 from app.core.errors import error
-from app.core.db.session import AsyncScopedSession
-from app.models.db.class_ import Class, ClassNotice
-from app.models.dtos.common import PageDTO
+from app.core.config import config
+from app.core.db.session import read_connection, stream_connection
+from app.models.db.class_ import (
+    SEARCH_CONFIG,
+    Class,
+    ClassNotice,
+    ClassNoticeCount,
+    ClassStudent,
+)
+from app.models.dtos.common import BulkDTO, PageDTO
 from app.models.dtos.class_ import (
     ClassDTO,
     ClassNoticeDTO,
     ClassListDTO,
     ClassNoticeListDTO,
+    ClassStudentDTO,
+    ClassStudentListDTO,
+    ClassStudentBulkDTO,
+)
+from app.repositories.base import BaseRepository
+
+# pg_class.reltuples는 ANALYZE/autovacuum이 갱신하는 추정치다. 한 번도 ANALYZE되지 않았으면 -1이다.
+CLASS_COUNT_ESTIMATE = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'class'::regclass"
+).columns(column("reltuples", BigInteger))
+CLASS_COUNT = select(func.count()).select_from(Class)
+
+CLASS_NOTICE_COUNT = select(ClassNoticeCount.count).where(
+    ClassNoticeCount.class_id == bindparam("class_id")
+)
+INCREMENT_CLASS_NOTICE_COUNT = (
+    pg_insert(ClassNoticeCount)
+    .values(class_id=bindparam("class_id"), count=1)
+    .on_conflict_do_update(
+        index_elements=[ClassNoticeCount.class_id],
+        set_={"count": ClassNoticeCount.count + 1},
+    )
+)
+DECREMENT_CLASS_NOTICE_COUNT = (
+    update(ClassNoticeCount)
+    .where(ClassNoticeCount.class_id == bindparam("class_id"))
+    .values(count=ClassNoticeCount.count - 1)
+)
+
+
+class ClassTable(BaseRepository[ClassDTO]):
+    model = Class
+    columns = (Class.class_id, Class.class_name, Class.teacher_id, Class.created_at)
+    dto = ClassDTO
+
+
+class ClassNoticeTable(BaseRepository[ClassNoticeDTO]):
+    model = ClassNotice
+    columns = (
+        ClassNotice.id.label("notice_id"),
+        ClassNotice.class_id,
+        ClassNotice.message,
+        ClassNotice.created_at,
+        ClassNotice.updated_at,
+    )
+    dto = ClassNoticeDTO
+
+
+async def count_classes(connection: AsyncConnection) -> int:
+    estimate = (await connection.execute(CLASS_COUNT_ESTIMATE)).scalar()
+    if estimate is not None and estimate >= 0:
+        return estimate
+
+    return (await connection.execute(CLASS_COUNT)).scalar()
+
+
+async def count_class_notices(connection: AsyncConnection, class_id: UUID) -> int:
+    result = await connection.execute(CLASS_NOTICE_COUNT, {"class_id": class_id})
+
+    return result.scalar() or 0
+
+
+# 내보내기는 server-side cursor로 EXPORT_BATCH_SIZE행씩 읽는다. 정렬은 목록 조회와 같다.
+CLASS_EXPORT = (
+    select(*ClassTable.columns)
+    .order_by(Class.created_at.desc(), Class.class_id.desc())
+    .execution_options(yield_per=config.EXPORT_BATCH_SIZE)
 )
+CLASS_NOTICE_EXPORT = (
+    select(*ClassNoticeTable.columns)
+    .where(ClassNotice.class_id == bindparam("class_id"))
+    .order_by(ClassNotice.created_at.desc(), ClassNotice.id.desc())
+    .execution_options(yield_per=config.EXPORT_BATCH_SIZE)
+)
+
+
+SEARCH_QUERY = websearch_to_tsquery(SEARCH_CONFIG, bindparam("query"))
+SEARCH_RANK = func.ts_rank_cd(ClassNotice.search_vector, SEARCH_QUERY)
+
+
+@lru_cache
+def class_notice_search_stmt(scope: str, with_cursor: bool) -> Executable:
+    """
+    공지사항 검색. GIN 인덱스로 일치하는 행을 찾고 (rank, id) 순으로 정렬한다.
+    scope는 "class"(class_id 하나) 또는 "teacher"(teacher_id의 모든 클래스)다.
+    모양이 네 가지뿐이므로 bindparam 템플릿으로 한 번씩만 만든다.
+    """
+    if scope == "class":
+        condition = ClassNotice.class_id == bindparam("class_id")
+    else:
+        condition = ClassNotice.class_id.in_(
+            select(Class.class_id).where(Class.teacher_id == bindparam("teacher_id"))
+        )
+
+    stmt = (
+        select(*ClassNoticeTable.columns, SEARCH_RANK.label("rank"))
+        .where(condition, ClassNotice.search_vector.bool_op("@@")(SEARCH_QUERY))
+        .order_by(SEARCH_RANK.desc(), ClassNotice.id.desc())
+        .limit(bindparam("size"))
+    )
+    if with_cursor:
+        return stmt.where(
+            tuple_(SEARCH_RANK, ClassNotice.id)
+            < tuple_(bindparam("rank"), bindparam("notice_id"))
+        )
+
+    return stmt.offset(bindparam("offset"))
+
+
+class ClassStudentTable(BaseRepository[ClassStudentDTO]):
+    model = ClassStudent
+    columns = (ClassStudent.class_id, ClassStudent.student_id, ClassStudent.created_at)
+    dto = ClassStudentDTO
+
+
+# 이미 등록된 학생은 건너뛴다. 새로 등록된 행만 RETURNING으로 돌아온다.
+ENROLL_STUDENTS = (
+    pg_insert(ClassStudent)
+    .on_conflict_do_nothing(
+        index_elements=[ClassStudent.class_id, ClassStudent.student_id]
+    )
+    .returning(*ClassStudentTable.columns)
+)
+# PK (class_id, student_id) 범위를 index-only scan으로 센다.
+CLASS_STUDENT_COUNT = (
+    select(func.count())
+    .select_from(ClassStudent)
+    .where(ClassStudent.class_id == bindparam("class_id"))
+)
+# 역방향 인덱스 (student_id, class_id)를 쓴다.
+STUDENT_CLASS_COUNT = (
+    select(func.count())
+    .select_from(ClassStudent)
+    .where(ClassStudent.student_id == bindparam("student_id"))
+)
+
+
+def class_list_stmt(
+    page: int, limit: int, cursor: Optional[str] = None
+) -> StatementLambdaElement:
+    """
+    목록 조회는 조건에 따라 모양이 달라지므로 lambda 구문으로 만든다.
+    lambda의 코드 위치가 캐시 키가 되므로 호출마다 구문을 새로 만들지 않고, 값은 bind 파라미터로 빠진다.
+    """
+    size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(*ClassTable.columns)
+        .order_by(Class.created_at.desc(), Class.class_id.desc())
+        .limit(size)
+    )
+    if cursor:
+        created_at, class_id = decode_cursor(cursor, 2)
+        class_id = cursor_uuid(class_id)
+        created_at = cursor_datetime(created_at)
+        return stmt + (
+            lambda s: s.where(
+                tuple_(Class.created_at, Class.class_id) < tuple_(created_at, class_id)
+            )
+        )
+
+    offset = (page - 1) * limit if page > 1 else 0
+    return stmt + (lambda s: s.offset(offset))
+
+
+def class_notice_list_stmt(
+    class_id: UUID, page: int, limit: int, cursor: Optional[str] = None
+) -> StatementLambdaElement:
+    size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(*ClassNoticeTable.columns)
+        .where(ClassNotice.class_id == class_id)
+        .order_by(ClassNotice.created_at.desc(), ClassNotice.id.desc())
+        .limit(size)
+    )
+    if cursor:
+        created_at, notice_id = decode_cursor(cursor, 2)
+        if not isinstance(notice_id, int):
+            raise error.InvalidCursor()
+        created_at = cursor_datetime(created_at)
+        return stmt + (
+            lambda s: s.where(
+                tuple_(ClassNotice.created_at, ClassNotice.id)
+                < tuple_(created_at, notice_id)
+            )
+        )
+
+    offset = (page - 1) * limit if page > 1 else 0
+    return stmt + (lambda s: s.offset(offset))
+
+
+def class_student_list_stmt(
+    class_id: UUID, page: int, limit: int, cursor: Optional[str] = None
+) -> StatementLambdaElement:
+    """
+    student_id 순으로 PK (class_id, student_id)를 그대로 따라 읽는다. cursor는 마지막 student_id다.
+    """
+    size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(*ClassStudentTable.columns)
+        .where(ClassStudent.class_id == class_id)
+        .order_by(ClassStudent.student_id)
+        .limit(size)
+    )
+    if cursor:
+        student_id = cursor_uuid(*decode_cursor(cursor, 1))
+        return stmt + (lambda s: s.where(ClassStudent.student_id > student_id))
+
+    offset = (page - 1) * limit if page > 1 else 0
+    return stmt + (lambda s: s.offset(offset))
+
+
+def student_class_list_stmt(
+    student_id: UUID, page: int, limit: int, cursor: Optional[str] = None
+) -> StatementLambdaElement:
+    """
+    역방향 인덱스 (student_id, class_id)를 class_id 순으로 읽고 class를 PK로 붙인다.
+    cursor는 마지막 class_id다.
+    """
+    size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(*ClassTable.columns)
+        .join(ClassStudent, ClassStudent.class_id == Class.class_id)
+        .where(ClassStudent.student_id == student_id)
+        .order_by(ClassStudent.class_id)
+        .limit(size)
+    )
+    if cursor:
+        class_id = cursor_uuid(*decode_cursor(cursor, 1))
+        return stmt + (lambda s: s.where(ClassStudent.class_id > class_id))
+
+    offset = (page - 1) * limit if page > 1 else 0
+    return stmt + (lambda s: s.offset(offset))
+
+
+def hot_statements() -> List[Executable]:
+    """
+    시작할 때 커넥션마다 미리 실행해서 컴파일 캐시와 prepared statement를 채워 둘 조회문.
+    값은 아무것도 찾지 않도록 비워 둔다. SQL 문자열만 같으면 된다.
+    """
+    epoch = datetime.fromtimestamp(0, timezone.utc)
+    nil = UUID(int=0)
+    return [
+        ClassTable.select_stmt(["class_id"]).params(w_class_id=nil),
+        class_list_stmt(1, 10),
+        class_list_stmt(1, 10, encode_cursor(epoch, nil)),
+        CLASS_COUNT_ESTIMATE,
+        class_notice_list_stmt(nil, 1, 10),
+        class_notice_list_stmt(nil, 1, 10, encode_cursor(epoch, 0)),
+        CLASS_NOTICE_COUNT.params(class_id=nil),
+        class_student_list_stmt(nil, 1, 10),
+        class_student_list_stmt(nil, 1, 10, encode_cursor(nil)),
+        CLASS_STUDENT_COUNT.params(class_id=nil),
+        student_class_list_stmt(nil, 1, 10),
+    ]
 
 
 class ClassRepository:
+    def __init__(self):
+        self.classes = ClassTable()
+        self.notices = ClassNoticeTable()
+        self.enrollments = ClassStudentTable()
 
+    @RedisCacheInvalidator(tags=("class_list",))
     async def create_class(
-        self, class_id: str, class_name: str, teacher_id: str
+        self, class_id: UUID, class_name: str, teacher_id: UUID
     ) -> ClassDTO:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    insert(Class)
-                    .values(
-                        class_id=class_id,
-                        class_name=class_name,
-                        teacher_id=teacher_id,
-                    )
-                    .returning(Class)
-                )
+        return await self.classes.create(
+            {"class_id": class_id, "class_name": class_name, "teacher_id": teacher_id},
+            failure=error.ClassCreationFailed,
+        )
 
-                result: Class = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.ClassCreationFailed()
-
-        return ClassDTO(
-            class_id=result.class_id,
-            class_name=result.class_name,
-            teacher_id=result.teacher_id,
-            created_at=result.created_at,
+    @RedisCacheInvalidator(tags=("class_list",))
+    async def create_classes(self, classes: List[ClassDTO]) -> BulkDTO[ClassDTO]:
+        return await self.classes.create_bulk(
+            [
+                {
+                    "class_id": class_.class_id,
+                    "class_name": class_.class_name,
+                    "teacher_id": class_.teacher_id,
+                }
+                for class_ in classes
+            ],
+            failure=error.ClassCreationFailed,
         )
 
-    @RedisCacheDecorator()
-    async def read_class_list(self, page: int, limit: int) -> ClassListDTO:
-        async with AsyncScopedSession() as session:
-            stmt = (
-                select(Class, func.count().over().label("total"))
-                .limit(limit)
-                .offset((page - 1) * limit if page > 1 else 0)
-                .order_by(Class.created_at.desc())
-            )
+    @RedisCacheDecorator(
+        tags=("class_list",), lock=True, stale_ttl=60, early_refresh=1.0
+    )
+    async def read_class_list(
+        self,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassListDTO:
+        """
+        cursor가 있으면 (created_at, class_id) keyset으로 조회하고 page는 무시한다.
+        없으면 기존처럼 OFFSET으로 조회한다. 두 경우 모두 다음 페이지의 cursor를 돌려준다.
 
-            results: List[List[Class, int]] = (await session.execute(stmt)).all()
+        total은 pg_class의 추정치다. with_total=False면 계산하지 않고 None을 돌려준다.
+        """
+        async with read_connection() as connection:
+            stmt = class_list_stmt(page, limit, cursor)
+            results = (await connection.execute(stmt)).all()
+            total = await count_classes(connection) if with_total else None
 
-        data = []
-        page = PageDTO(page=page, limit=limit, total=0)
+        data = [ClassDTO(*row) for row in results[:limit]]
+        page = PageDTO(page=page, limit=limit, total=total)
 
-        if results:
-            for row, total in results:
-                data.append(
-                    ClassDTO(
-                        class_id=row.class_id,
-                        class_name=row.class_name,
-                        teacher_id=row.teacher_id,
-                        created_at=row.created_at,
-                    )
-                )
-            page.total = total
+        if len(results) > limit:
+            last = data[-1]
+            page.next_cursor = encode_cursor(last.created_at, last.class_id)
 
         return ClassListDTO(data=data, page=page)
 
-    @RedisCacheDecorator()
-    async def read_class(self, class_id: str) -> Optional[ClassDTO]:
-        async with AsyncScopedSession() as session:
-            stmt = select(Class).where(Class.class_id == class_id)
+    @RedisCacheDecorator(early_refresh=1.0)
+    async def read_class(self, class_id: UUID) -> Optional[ClassDTO]:
+        return await self.classes.read(class_id=class_id)
 
-            result = (await session.execute(stmt)).scalar()
+    async def stream_classes(self) -> AsyncIterator[List[ClassDTO]]:
+        async with stream_connection() as connection:
+            result = await connection.stream(CLASS_EXPORT)
+            async for rows in result.partitions():
+                yield [ClassDTO(*row) for row in rows]
 
-        if result:
-            return ClassDTO(
-                class_id=result.class_id,
-                class_name=result.class_name,
-                teacher_id=result.teacher_id,
-                created_at=result.created_at,
+    @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
+    async def create_class_notice(self, class_id: UUID, message: str) -> ClassNoticeDTO:
+        result = await self.notices.create(
+            {"class_id": class_id, "message": message},
+            failure=error.ClassNoticeCreationFailed,
+        )
+        async with self.notices.writing(error.ClassNoticeCreationFailed) as connection:
+            await connection.execute(
+                INCREMENT_CLASS_NOTICE_COUNT, {"class_id": class_id}
             )
-        else:
-            return None
-
-    async def create_class_notice(self, class_id: str, message: str) -> ClassNoticeDTO:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    insert(ClassNotice)
-                    .values(
-                        class_id=class_id,
-                        message=message,
-                    )
-                    .returning(ClassNotice)
-                )
 
-                result: ClassNotice = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.ClassNoticeCreationFailed()
-
-        return ClassNoticeDTO(
-            notice_id=result.id,
-            class_id=result.class_id,
-            message=result.message,
-            created_at=result.created_at,
-            updated_at=result.updated_at,
-        )
+        return result
 
-    @RedisCacheDecorator()
+    @RedisCacheDecorator(
+        tags=("class_notice:{class_id}",), lock=True, stale_ttl=60, early_refresh=1.0
+    )
     async def read_class_notice_list(
-        self, class_id: str, page: int, limit: int
+        self,
+        class_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> ClassNoticeListDTO:
-        async with AsyncScopedSession() as session:
-            stmt = (
-                select(ClassNotice, func.count().over().label("total"))
-                .where(ClassNotice.class_id == class_id)
-                .limit(limit)
-                .offset((page - 1) * limit if page > 1 else 0)
-                .order_by(ClassNotice.created_at.desc())
+        """
+        total은 class_notice_count에 유지되는 정확한 개수다. with_total=False면 None을 돌려준다.
+        """
+        async with read_connection() as connection:
+            stmt = class_notice_list_stmt(class_id, page, limit, cursor)
+            results = (await connection.execute(stmt)).all()
+            total = (
+                await count_class_notices(connection, class_id) if with_total else None
             )
 
-            results: List[List[ClassNotice, int]] = (await session.execute(stmt)).all()
-
-        data = []
-        page = PageDTO(page=page, limit=limit, total=0)
-
-        if results:
-            for row, total in results:
-                data.append(
-                    ClassNoticeDTO(
-                        notice_id=row.id,
-                        class_id=row.class_id,
-                        message=row.message,
-                        created_at=row.created_at,
-                        updated_at=row.updated_at,
-                    )
-                )
-            page.total = total
+        data = [ClassNoticeDTO(*row) for row in results[:limit]]
+        page = PageDTO(page=page, limit=limit, total=total)
+
+        if len(results) > limit:
+            last = data[-1]
+            page.next_cursor = encode_cursor(last.created_at, last.notice_id)
 
         return ClassNoticeListDTO(data=data, page=page)
 
-    async def update_class_notice(
-        self, class_id: str, notice_id: int, message: str
-    ) -> Optional[ClassNoticeDTO]:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    update(ClassNotice)
-                    .where(
-                        ClassNotice.id == notice_id, ClassNotice.class_id == class_id
-                    )
-                    .values(message=message)
-                    .returning(ClassNotice)
-                )
+    async def stream_class_notices(
+        self, class_id: UUID
+    ) -> AsyncIterator[List[ClassNoticeDTO]]:
+        """
+        공지사항을 EXPORT_BATCH_SIZE행씩 묶어서 넘긴다. 전체를 메모리에 올리지 않는다.
+        다 읽기 전에 닫히면(클라이언트 연결 끊김) 커서와 커넥션도 바로 정리된다.
+        """
+        async with stream_connection() as connection:
+            result = await connection.stream(
+                CLASS_NOTICE_EXPORT, {"class_id": class_id}
+            )
+            async for rows in result.partitions():
+                yield [ClassNoticeDTO(*row) for row in rows]
 
-                result: ClassNotice = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.ClassNoticeUpdateFailed()
+    @RedisCacheDecorator(tags=("class_notice:{class_id}",))
+    async def search_class_notices(
+        self,
+        class_id: UUID,
+        query: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> ClassNoticeListDTO:
+        return await self._search_class_notices(
+            "class", {"class_id": class_id}, query, page, limit, cursor
+        )
 
-        if result:
-            return ClassNoticeDTO(
-                notice_id=result.id,
-                class_id=result.class_id,
-                message=result.message,
-                created_at=result.created_at,
-                updated_at=result.updated_at,
-            )
+    @RedisCacheDecorator(ttl=config.SEARCH_CACHE_TTL)
+    async def search_teacher_class_notices(
+        self,
+        teacher_id: UUID,
+        query: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> ClassNoticeListDTO:
+        """
+        선생님의 모든 클래스에서 검색한다. 공지사항 쓰기는 teacher_id를 모르므로 세대 태그로 무효화하지 않고,
+        SEARCH_CACHE_TTL 동안만 캐시한다.
+        """
+        return await self._search_class_notices(
+            "teacher", {"teacher_id": teacher_id}, query, page, limit, cursor
+        )
+
+    async def _search_class_notices(
+        self,
+        scope: str,
+        params: Dict[str, UUID],
+        query: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> ClassNoticeListDTO:
+        """
+        cursor가 있으면 (rank, notice_id) keyset으로 조회하고 page는 무시한다. total은 계산하지 않는다.
+        """
+        params = {**params, "query": query, "size": limit + 1}
+        if cursor:
+            rank, notice_id = decode_cursor(cursor, 2)
+            if not isinstance(rank, (int, float)) or not isinstance(notice_id, int):
+                raise error.InvalidCursor()
+            params["rank"], params["notice_id"] = rank, notice_id
         else:
-            return None
+            params["offset"] = (page - 1) * limit if page > 1 else 0
+
+        async with read_connection() as connection:
+            stmt = class_notice_search_stmt(scope, bool(cursor))
+            results = (await connection.execute(stmt, params)).all()
+
+        data = [ClassNoticeDTO(*row[:-1]) for row in results[:limit]]
+        page = PageDTO(page=page, limit=limit, total=None)
 
+        if len(results) > limit:
+            page.next_cursor = encode_cursor(
+                results[limit - 1].rank, data[-1].notice_id
+            )
+
+        return ClassNoticeListDTO(data=data, page=page)
+
+    @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
+    async def update_class_notice(
+        self, class_id: UUID, notice_id: int, message: str
+    ) -> Optional[ClassNoticeDTO]:
+        return await self.notices.update(
+            {"id": notice_id, "class_id": class_id},
+            {"message": message},
+            failure=error.ClassNoticeUpdateFailed,
+        )
+
+    @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
     async def delete_class_notice(
-        self, class_id: str, notice_id: int
+        self, class_id: UUID, notice_id: int
     ) -> Optional[ClassNoticeDTO]:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    delete(ClassNotice)
-                    .where(
-                        ClassNotice.id == notice_id, ClassNotice.class_id == class_id
-                    )
-                    .returning(ClassNotice)
+        result = await self.notices.delete(
+            error.ClassNoticeDeleteFailed, id=notice_id, class_id=class_id
+        )
+        if result:
+            async with self.notices.writing(
+                error.ClassNoticeDeleteFailed
+            ) as connection:
+                await connection.execute(
+                    DECREMENT_CLASS_NOTICE_COUNT, {"class_id": class_id}
                 )
-                result: ClassNotice = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.ClassNoticeDeleteFailed()
+
+        return result
+
+    @RedisCacheInvalidator(tags=("class_student:{class_id}",))
+    async def enroll_student(self, class_id: UUID, student_id: UUID) -> ClassStudentDTO:
+        async with self.enrollments.writing(
+            error.ClassStudentEnrollFailed
+        ) as connection:
+            result = (
+                await connection.execute(
+                    ENROLL_STUDENTS, {"class_id": class_id, "student_id": student_id}
+                )
+            ).first()
 
         if result:
+            return self.enrollments.to_dto(result)
+
+        # 이미 등록되어 있으면 기존 행을 돌려준다.
+        return await self.enrollments.read(class_id=class_id, student_id=student_id)
 
-            return ClassNoticeDTO(
-                notice_id=result.id,
-                class_id=result.class_id,
-                message=result.message,
-                created_at=result.created_at,
-                updated_at=result.updated_at,
+    @RedisCacheInvalidator(tags=("class_student:{class_id}",))
+    async def enroll_students(
+        self, class_id: UUID, student_ids: List[UUID]
+    ) -> ClassStudentBulkDTO:
+        """
+        여러 행 INSERT ... ON CONFLICT DO NOTHING을 1000행씩(insertmanyvalues) 보낸다.
+        이미 등록된 학생이 섞여 있어도 실패하지 않으므로 같은 요청을 다시 보내도 된다.
+        """
+        student_ids = list(dict.fromkeys(student_ids))
+        async with self.enrollments.writing(
+            error.ClassStudentEnrollFailed
+        ) as connection:
+            results = (
+                await connection.execute(
+                    ENROLL_STUDENTS,
+                    [
+                        {"class_id": class_id, "student_id": student_id}
+                        for student_id in student_ids
+                    ],
+                )
+            ).all()
+
+        return ClassStudentBulkDTO(
+            enrolled=len(results), already_enrolled=len(student_ids) - len(results)
+        )
+
+    @RedisCacheInvalidator(tags=("class_student:{class_id}",))
+    async def unenroll_student(
+        self, class_id: UUID, student_id: UUID
+    ) -> Optional[ClassStudentDTO]:
+        return await self.enrollments.delete(
+            error.ClassStudentUnenrollFailed, class_id=class_id, student_id=student_id
+        )
+
+    @RedisCacheDecorator(
+        tags=("class_student:{class_id}",), lock=True, stale_ttl=60, early_refresh=1.0
+    )
+    async def read_class_student_list(
+        self,
+        class_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassStudentListDTO:
+        async with read_connection() as connection:
+            stmt = class_student_list_stmt(class_id, page, limit, cursor)
+            results = (await connection.execute(stmt)).all()
+            total = (
+                await connection.scalar(CLASS_STUDENT_COUNT, {"class_id": class_id})
+                if with_total
+                else None
             )
-        else:
-            return None
+
+        data = [ClassStudentDTO(*row) for row in results[:limit]]
+        page = PageDTO(page=page, limit=limit, total=total)
+
+        if len(results) > limit:
+            page.next_cursor = encode_cursor(data[-1].student_id)
+
+        return ClassStudentListDTO(data=data, page=page)
+
+    async def read_student_class_list(
+        self,
+        student_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassListDTO:
+        """
+        학생이 듣는 클래스 목록. 학생마다 키가 달라 캐시 적중률이 낮고,
+        벌크 등록마다 학생 수만큼 태그를 올려야 하므로 캐시하지 않는다. (인덱스 조회 한 번)
+        """
+        async with read_connection() as connection:
+            stmt = student_class_list_stmt(student_id, page, limit, cursor)
+            results = (await connection.execute(stmt)).all()
+            total = (
+                await connection.scalar(STUDENT_CLASS_COUNT, {"student_id": student_id})
+                if with_total
+                else None
+            )
+
+        data = [ClassDTO(*row) for row in results[:limit]]
+        page = PageDTO(page=page, limit=limit, total=total)
+
+        if len(results) > limit:
+            page.next_cursor = encode_cursor(data[-1].class_id)
+
+        return ClassListDTO(data=data, page=page)
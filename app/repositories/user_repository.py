@@ -1,68 +1,72 @@
-from sqlalchemy import insert
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Row
 
-from app.core.logger import logger
 from app.core.errors import error
-from app.core.db.session import AsyncScopedSession
 from app.models.db.student import Student
 from app.models.db.teacher import Teacher
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.user import UserDTO
 from app.models.constants import UserRole
+from app.repositories.base import BaseRepository
+
+
+class StudentTable(BaseRepository[UserDTO]):
+    model = Student
+    columns = (Student.student_id, Student.student_name, Student.created_at)
+
+    @classmethod
+    def to_dto(cls, row: Row) -> UserDTO:
+        user_id, user_name, created_at = row
+        return UserDTO(user_id, user_name, UserRole.STUDENT, created_at)
+
+
+class TeacherTable(BaseRepository[UserDTO]):
+    model = Teacher
+    columns = (Teacher.teacher_id, Teacher.teacher_name, Teacher.created_at)
+
+    @classmethod
+    def to_dto(cls, row: Row) -> UserDTO:
+        user_id, user_name, created_at = row
+        return UserDTO(user_id, user_name, UserRole.TEACHER, created_at)
 
 
 class UserRepository:
+    def __init__(self):
+        self.students = StudentTable()
+        self.teachers = TeacherTable()
 
     async def create_student_user(
-        self, user_id: str, user_name: str, user_role: UserRole
+        self, user_id: UUID, user_name: str, user_role: UserRole
     ) -> UserDTO:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    insert(Student)
-                    .values(
-                        student_id=user_id,
-                        student_name=user_name,
-                    )
-                    .returning(Student)
-                )
-
-                result: Student = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.UserCreationFailed()
-
-        return UserDTO(
-            user_id=result.student_id,
-            user_name=result.student_name,
-            user_role=user_role.value,
-            created_at=result.created_at,
+        return await self.students.create(
+            {"student_id": user_id, "student_name": user_name},
+            failure=error.UserCreationFailed,
         )
 
     async def create_teacher_user(
-        self, user_id: str, user_name: str, user_role: UserRole
+        self, user_id: UUID, user_name: str, user_role: UserRole
     ) -> UserDTO:
-        async with AsyncScopedSession() as session:
-            try:
-                stmt = (
-                    insert(Teacher)
-                    .values(
-                        teacher_id=user_id,
-                        teacher_name=user_name,
-                    )
-                    .returning(Teacher)
-                )
+        return await self.teachers.create(
+            {"teacher_id": user_id, "teacher_name": user_name},
+            failure=error.UserCreationFailed,
+        )
 
-                result: Teacher = (await session.execute(stmt)).scalar()
-                await session.commit()
-            except Exception as e:
-                logger.error(e)
-                await session.rollback()
-                raise error.UserCreationFailed()
+    async def create_student_users(self, users: List[UserDTO]) -> BulkDTO[UserDTO]:
+        return await self.students.create_bulk(
+            [
+                {"student_id": user.user_id, "student_name": user.user_name}
+                for user in users
+            ],
+            failure=error.UserCreationFailed,
+        )
 
-        return UserDTO(
-            user_id=result.teacher_id,
-            user_name=result.teacher_name,
-            user_role=user_role,
-            created_at=result.created_at,
+    async def create_teacher_users(self, users: List[UserDTO]) -> BulkDTO[UserDTO]:
+        return await self.teachers.create_bulk(
+            [
+                {"teacher_id": user.user_id, "teacher_name": user.user_name}
+                for user in users
+            ],
+            failure=error.UserCreationFailed,
         )
@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Query, Path, Body, Depends
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Query, Path, Body, Depends, Request
 from dependency_injector.wiring import Provide, inject
 
 from app import services
 from app.core.container import Container
+from app.core.export import ExportFormat, export_response
+from app.core.response_cache import ResponseCacheDecorator, last_modified_from
 from app.models.schemas.common import BaseResponse, HttpResponse, ErrorResponse
 from app.models.schemas.class_ import (
+    ClassBulkReq,
+    ClassBulkResp,
     ClassReq,
     ClassResp,
     ClassListResp,
     ClassNoticeReq,
     ClassNoticeResp,
     ClassNoticeListResp,
+    ClassStudentBulkReq,
+    ClassStudentBulkResp,
+    ClassStudentResp,
+    ClassStudentListResp,
 )
 
 router = APIRouter()
@@ -41,30 +52,88 @@ async def create_class(
     return HttpResponse(content=ClassResp.from_dto(result))
 
 
+@router.post(
+    "/bulk",
+    response_model=BaseResponse[ClassBulkResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def create_classes(
+    request_body: ClassBulkReq = Body(..., description="Classes to create"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassBulkResp]:
+    """
+    POST
+    클래스를 여러 개 한 번에 생성하는 API 입니다.
+    실패한 행은 errors에 요청 목록의 index와 함께 담기고, 나머지는 그대로 생성됩니다.
+
+    Args:
+        request_body (ClassBulkReq): 클래스 생성 요청 목록 (최대 BULK_MAX_ROWS개)
+
+    Returns:
+        BaseResponse[ClassBulkResp]: 생성된 클래스와 실패한 행
+    """
+    result = await class_service.create_classes(request_body.to_dtos())
+
+    return HttpResponse(content=ClassBulkResp.from_dto(result))
+
+
 @router.get(
     "/list",
     response_model=BaseResponse[ClassListResp],
     responses={400: {"model": ErrorResponse}},
 )
+@ResponseCacheDecorator(tags=("class_list",))
 @inject
 async def read_class_list(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Include page.total (null if false)"
+    ),
     class_service: services.ClassService = Depends(Provide[Container.class_service]),
 ) -> BaseResponse[ClassListResp]:
-    result = await class_service.read_class_list(page, limit)
+    result = await class_service.read_class_list(page, limit, cursor, with_total)
 
     return HttpResponse(content=ClassListResp.from_dto(result))
 
 
+@router.get("/export", responses={400: {"model": ErrorResponse}})
+@inject
+async def export_classes(
+    request: Request,
+    format: ExportFormat = Query("ndjson", description="ndjson | csv"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+):
+    """
+    GET
+    클래스 전체를 NDJSON 또는 CSV로 내려받는 API 입니다.
+    페이지 없이 server-side cursor로 읽으면서 바로 보내므로 행 수와 상관없이 메모리가 일정합니다.
+    """
+    return export_response(
+        request,
+        class_service.stream_classes(),
+        ClassResp.from_dto,
+        ClassResp,
+        format,
+        "classes",
+    )
+
+
 @router.get(
     "/{class_id}",
     response_model=BaseResponse[ClassResp],
     responses={400: {"model": ErrorResponse}},
 )
+@ResponseCacheDecorator()
 @inject
 async def read_class(
-    class_id: str = Path(..., description="Class ID"),
+    request: Request,
+    class_id: UUID = Path(..., description="Class ID"),
     class_service: services.ClassService = Depends(Provide[Container.class_service]),
 ) -> BaseResponse[ClassResp]:
     result = await class_service.read_class(class_id)
@@ -79,7 +148,7 @@ async def read_class(
 )
 @inject
 async def create_class_notice(
-    class_id: str = Path(..., description="Class ID"),
+    class_id: UUID = Path(..., description="Class ID"),
     request_body: ClassNoticeReq = Body(
         ..., description="Class notice creation request body"
     ),
@@ -95,14 +164,104 @@ async def create_class_notice(
     response_model=BaseResponse[ClassNoticeListResp],
     responses={400: {"model": ErrorResponse}},
 )
+@ResponseCacheDecorator(
+    tags=("class_notice:{class_id}",),
+    last_modified=last_modified_from("updatedAt", "createdAt"),
+)
 @inject
 async def read_class_notice_list(
-    class_id: str = Path(..., description="Class ID"),
+    request: Request,
+    class_id: UUID = Path(..., description="Class ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Include page.total (null if false)"
+    ),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassNoticeListResp]:
+    result = await class_service.read_class_notice_list(
+        class_id, page, limit, cursor, with_total
+    )
+
+    return HttpResponse(content=ClassNoticeListResp.from_dto(result))
+
+
+@router.get("/notice/{class_id}/export", responses={400: {"model": ErrorResponse}})
+@inject
+async def export_class_notices(
+    request: Request,
+    class_id: UUID = Path(..., description="Class ID"),
+    format: ExportFormat = Query("ndjson", description="ndjson | csv"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+):
+    """
+    GET
+    클래스의 공지사항 전체를 NDJSON 또는 CSV로 내려받는 API 입니다. (최신순)
+    """
+    return export_response(
+        request,
+        class_service.stream_class_notices(class_id),
+        ClassNoticeResp.from_dto,
+        ClassNoticeResp,
+        format,
+        "class_notices",
+    )
+
+
+@router.get(
+    "/notice/{class_id}/search",
+    response_model=BaseResponse[ClassNoticeListResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def search_class_notices(
+    class_id: UUID = Path(..., description="Class ID"),
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassNoticeListResp]:
+    """
+    GET
+    클래스의 공지사항을 검색하는 API 입니다. 관련도 순으로 정렬되고 page.total은 null입니다.
+    q는 웹 검색 문법을 따릅니다. 예: "시험 -중간", "\"기말 시험\"", "과제 or 숙제"
+    """
+    result = await class_service.search_class_notices(
+        q, page, limit, cursor, class_id=class_id
+    )
+
+    return HttpResponse(content=ClassNoticeListResp.from_dto(result))
+
+
+@router.get(
+    "/teacher/{teacher_id}/notice/search",
+    response_model=BaseResponse[ClassNoticeListResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def search_teacher_class_notices(
+    teacher_id: UUID = Path(..., description="Teacher ID"),
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
     class_service: services.ClassService = Depends(Provide[Container.class_service]),
 ) -> BaseResponse[ClassNoticeListResp]:
-    result = await class_service.read_class_notice_list(class_id, page, limit)
+    """
+    GET
+    선생님의 모든 클래스에서 공지사항을 검색하는 API 입니다. (최대 SEARCH_CACHE_TTL초 늦게 반영)
+    """
+    result = await class_service.search_class_notices(
+        q, page, limit, cursor, teacher_id=teacher_id
+    )
 
     return HttpResponse(content=ClassNoticeListResp.from_dto(result))
 
@@ -114,7 +273,7 @@ async def read_class_notice_list(
 )
 @inject
 async def update_class_notice(
-    class_id: str = Path(..., description="Class ID"),
+    class_id: UUID = Path(..., description="Class ID"),
     notice_id: int = Path(..., description="Notice ID"),
     request_body: ClassNoticeReq = Body(
         ..., description="Class notice update request body"
@@ -135,10 +294,119 @@ async def update_class_notice(
 )
 @inject
 async def delete_class_notice(
-    class_id: str = Path(..., description="Class ID"),
+    class_id: UUID = Path(..., description="Class ID"),
     notice_id: int = Path(..., description="Notice ID"),
     class_service: services.ClassService = Depends(Provide[Container.class_service]),
 ) -> BaseResponse[ClassNoticeResp]:
     result = await class_service.delete_class_notice(class_id, notice_id)
 
     return HttpResponse(content=ClassNoticeResp.from_dto(result))
+
+
+@router.get(
+    "/student/{student_id}",
+    response_model=BaseResponse[ClassListResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def read_student_class_list(
+    student_id: UUID = Path(..., description="Student ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Include page.total (null if false)"
+    ),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassListResp]:
+    """
+    GET
+    학생이 등록된 클래스 목록을 class_id 순으로 조회하는 API 입니다.
+    """
+    result = await class_service.read_student_class_list(
+        student_id, page, limit, cursor, with_total
+    )
+
+    return HttpResponse(content=ClassListResp.from_dto(result))
+
+
+@router.post(
+    "/{class_id}/students",
+    response_model=BaseResponse[ClassStudentBulkResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def enroll_students(
+    class_id: UUID = Path(..., description="Class ID"),
+    request_body: ClassStudentBulkReq = Body(..., description="Students to enroll"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassStudentBulkResp]:
+    """
+    POST
+    클래스에 학생을 여러 명 한 번에 등록하는 API 입니다.
+    이미 등록된 학생은 건너뛰므로 같은 요청을 다시 보내도 됩니다.
+    """
+    result = await class_service.enroll_students(class_id, request_body.studentIds)
+
+    return HttpResponse(content=ClassStudentBulkResp.from_dto(result))
+
+
+@router.get(
+    "/{class_id}/students",
+    response_model=BaseResponse[ClassStudentListResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@ResponseCacheDecorator(tags=("class_student:{class_id}",))
+@inject
+async def read_class_student_list(
+    request: Request,
+    class_id: UUID = Path(..., description="Class ID"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=10, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(
+        None, description="page.nextCursor of the previous page (ignores page)"
+    ),
+    with_total: bool = Query(
+        True, alias="withTotal", description="Include page.total (null if false)"
+    ),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassStudentListResp]:
+    result = await class_service.read_class_student_list(
+        class_id, page, limit, cursor, with_total
+    )
+
+    return HttpResponse(content=ClassStudentListResp.from_dto(result))
+
+
+@router.post(
+    "/{class_id}/students/{student_id}",
+    response_model=BaseResponse[ClassStudentResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def enroll_student(
+    class_id: UUID = Path(..., description="Class ID"),
+    student_id: UUID = Path(..., description="Student ID"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassStudentResp]:
+    result = await class_service.enroll_student(class_id, student_id)
+
+    return HttpResponse(content=ClassStudentResp.from_dto(result))
+
+
+@router.delete(
+    "/{class_id}/students/{student_id}",
+    response_model=BaseResponse[ClassStudentResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def unenroll_student(
+    class_id: UUID = Path(..., description="Class ID"),
+    student_id: UUID = Path(..., description="Student ID"),
+    class_service: services.ClassService = Depends(Provide[Container.class_service]),
+) -> BaseResponse[ClassStudentResp]:
+    result = await class_service.unenroll_student(class_id, student_id)
+
+    return HttpResponse(content=ClassStudentResp.from_dto(result))
@@ -0,0 +1,40 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from app.core.db.session import engine, replica_engine
+from app.core.metrics import (
+    deadline_metrics,
+    pool_stats,
+    statement_metrics,
+    unit_of_work_metrics,
+)
+from app.core.redis import redis_cache
+from app.models.schemas.common import HttpResponse
+
+router = APIRouter()
+
+
+@router.get("")
+async def read_metrics():
+    """
+    GET
+    커넥션 풀과 캐시의 현재 지표를 돌려주는 API 입니다.
+    풀 크기(DB_POOL_SIZE, DB_MAX_OVERFLOW)는 checked_out, overflow, checkout_wait을 보고 정한다.
+    statements는 구문 컴파일에 쓴 시간과 컴파일 캐시 적중 수다.
+    unit_of_work.after_commit_failures는 커밋 뒤 캐시 무효화 등이 실패한 횟수다. (캐시가 TTL까지 옛 값일 수 있다)
+    deadlines는 시간 예산(REQUEST_TIMEOUT)을 넘긴 요청과 클라이언트가 끊어서 취소한 요청 수다.
+    """
+    db = {"primary": pool_stats(engine)}
+    if replica_engine is not engine:
+        db["replica"] = pool_stats(replica_engine)
+
+    return HttpResponse(
+        content={
+            "db": db,
+            "statements": statement_metrics.snapshot(),
+            "deadlines": deadline_metrics.snapshot(),
+            "unit_of_work": asdict(unit_of_work_metrics),
+            "cache": redis_cache.stats(),
+        }
+    )
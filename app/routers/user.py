@@ -5,7 +5,7 @@ from app import services
 from app.core.container import Container
 from app.models.constants import UserRole
 from app.models.schemas.common import BaseResponse, HttpResponse, ErrorResponse
-from app.models.schemas.user import UserReq, UserResp
+from app.models.schemas.user import UserBulkReq, UserBulkResp, UserReq, UserResp
 
 router = APIRouter()
 
@@ -48,3 +48,38 @@ async def create_student(
     )
 
     return HttpResponse(content=UserResp.from_dto(result))
+
+
+@router.post(
+    "/teacher/bulk",
+    response_model=BaseResponse[UserBulkResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def create_teachers(
+    request_body: UserBulkReq,
+    user_service: services.UserService = Depends(Provide[Container.user_service]),
+) -> BaseResponse[UserBulkResp]:
+    # 실패한 행은 errors로 돌려주고, 나머지 행은 그대로 생성한다.
+    result = await user_service.create_teacher_users(
+        request_body.to_dtos(user_role=UserRole.TEACHER)
+    )
+
+    return HttpResponse(content=UserBulkResp.from_dto(result))
+
+
+@router.post(
+    "/student/bulk",
+    response_model=BaseResponse[UserBulkResp],
+    responses={400: {"model": ErrorResponse}},
+)
+@inject
+async def create_students(
+    request_body: UserBulkReq,
+    user_service: services.UserService = Depends(Provide[Container.user_service]),
+) -> BaseResponse[UserBulkResp]:
+    result = await user_service.create_student_users(
+        request_body.to_dtos(user_role=UserRole.STUDENT)
+    )
+
+    return HttpResponse(content=UserBulkResp.from_dto(result))
@@ -1,11 +1,16 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
 
 from app import repositories
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.class_ import (
     ClassDTO,
     ClassNoticeDTO,
     ClassListDTO,
     ClassNoticeListDTO,
+    ClassStudentDTO,
+    ClassStudentListDTO,
+    ClassStudentBulkDTO,
 )
 from app.core.errors import error
 
@@ -21,10 +26,24 @@ class ClassService:
             teacher_id=class_dto.teacher_id,
         )
 
-    async def read_class_list(self, page: int, limit: int) -> ClassListDTO:
-        return await self.class_repository.read_class_list(page=page, limit=limit)
+    async def create_classes(self, class_dtos: List[ClassDTO]) -> BulkDTO[ClassDTO]:
+        return await self.class_repository.create_classes(classes=class_dtos)
+
+    async def read_class_list(
+        self,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassListDTO:
+        return await self.class_repository.read_class_list(
+            page=page, limit=limit, cursor=cursor, with_total=with_total
+        )
+
+    def stream_classes(self) -> AsyncIterator[List[ClassDTO]]:
+        return self.class_repository.stream_classes()
 
-    async def read_class(self, class_id: str) -> ClassDTO:
+    async def read_class(self, class_id: UUID) -> ClassDTO:
         result = await self.class_repository.read_class(class_id=class_id)
 
         if not result:  # 에러가 발생하지 않게 하는 로직으로서 방어 로직이라 한다.
@@ -41,10 +60,47 @@ class ClassService:
         )
 
     async def read_class_notice_list(
-        self, class_id: str, page: int, limit: int
+        self,
+        class_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> ClassNoticeListDTO:
         return await self.class_repository.read_class_notice_list(
-            class_id=class_id, page=page, limit=limit
+            class_id=class_id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total,
+        )
+
+    def stream_class_notices(
+        self, class_id: UUID
+    ) -> AsyncIterator[List[ClassNoticeDTO]]:
+        return self.class_repository.stream_class_notices(class_id=class_id)
+
+    async def search_class_notices(
+        self,
+        query: str,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        class_id: Optional[UUID] = None,
+        teacher_id: Optional[UUID] = None,
+    ) -> ClassNoticeListDTO:
+        """
+        class_id가 있으면 그 클래스에서, 없으면 teacher_id의 모든 클래스에서 검색한다.
+        공백만 다른 검색어가 같은 캐시를 쓰도록 정리해서 넘긴다.
+        """
+        query = " ".join(query.split())
+        if class_id is not None:
+            return await self.class_repository.search_class_notices(
+                class_id=class_id, query=query, page=page, limit=limit, cursor=cursor
+            )
+
+        return await self.class_repository.search_teacher_class_notices(
+            teacher_id=teacher_id, query=query, page=page, limit=limit, cursor=cursor
         )
 
     async def update_class_notice(
@@ -64,7 +120,7 @@ class ClassService:
         return result
 
     async def delete_class_notice(
-        self, class_id: str, notice_id: int
+        self, class_id: UUID, notice_id: int
     ) -> ClassNoticeDTO:
         result = await self.class_repository.delete_class_notice(
             class_id=class_id, notice_id=notice_id
@@ -74,3 +130,59 @@ class ClassService:
             raise error.ClassNoticeNotFound()
 
         return result
+
+    async def enroll_student(self, class_id: UUID, student_id: UUID) -> ClassStudentDTO:
+        return await self.class_repository.enroll_student(
+            class_id=class_id, student_id=student_id
+        )
+
+    async def enroll_students(
+        self, class_id: UUID, student_ids: List[UUID]
+    ) -> ClassStudentBulkDTO:
+        return await self.class_repository.enroll_students(
+            class_id=class_id, student_ids=student_ids
+        )
+
+    async def unenroll_student(
+        self, class_id: UUID, student_id: UUID
+    ) -> ClassStudentDTO:
+        result = await self.class_repository.unenroll_student(
+            class_id=class_id, student_id=student_id
+        )
+
+        if not result:
+            raise error.ClassStudentNotFound()
+
+        return result
+
+    async def read_class_student_list(
+        self,
+        class_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassStudentListDTO:
+        return await self.class_repository.read_class_student_list(
+            class_id=class_id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total,
+        )
+
+    async def read_student_class_list(
+        self,
+        student_id: UUID,
+        page: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> ClassListDTO:
+        return await self.class_repository.read_student_class_list(
+            student_id=student_id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total,
+        )
@@ -1,4 +1,7 @@
+from typing import List
+
 from app import repositories
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.user import UserDTO
 
 
@@ -19,3 +22,9 @@ class UserService:
             user_name=user_dto.user_name,
             user_role=user_dto.user_role,
         )
+
+    async def create_student_users(self, user_dtos: List[UserDTO]) -> BulkDTO[UserDTO]:
+        return await self.user_repository.create_student_users(users=user_dtos)
+
+    async def create_teacher_users(self, user_dtos: List[UserDTO]) -> BulkDTO[UserDTO]:
+        return await self.user_repository.create_teacher_users(users=user_dtos)
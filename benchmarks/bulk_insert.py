@@ -0,0 +1,98 @@
+"""
+학생 생성 벤치마크: 단건 경로 vs 벌크 경로
+
+single은 POST /v1/user/student 한 번과 같다. 행마다 unit of work(트랜잭션 + 커밋)가 하나씩이다.
+bulk는 POST /v1/user/student/bulk와 같다. BULK_BATCH_SIZE개씩 SAVEPOINT 안에서 여러 행 INSERT 한 번이다.
+캐시 무효화는 포함하지 않는다.
+
+목표: bulk가 single보다 초당 행 수로 20배 이상 빠를 것. (행마다 왕복 3번 + fsync 1번 -> 1000행마다 왕복 몇 번)
+실패한 행이 섞여 있어도(--fail-every) 그 배치만 한 행씩 다시 넣으므로 5배 이상은 유지돼야 한다.
+
+$ ENV=local python -m benchmarks.bulk_insert --rows 10000 --fail-every 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete
+
+from app.core.ids import uuid7
+from app.core.db.session import AsyncScopedSession, close_db, unit_of_work
+from app.models.constants import UserRole
+from app.models.db.student import Student
+from app.models.dtos.user import UserDTO
+from app.repositories import UserRepository
+
+NAME = "benchmark-bulk"
+
+
+def users(rows: int, fail_every: int):
+    # fail_every번째 행마다 이미 있는 id를 넣어서 중복 키 에러를 만든다.
+    ids = [uuid7() for _ in range(rows)]
+    if fail_every:
+        for i in range(fail_every, rows, fail_every):
+            ids[i] = ids[i - 1]
+
+    return [UserDTO(user_id, NAME, UserRole.STUDENT) for user_id in ids]
+
+
+async def cleanup() -> None:
+    async with unit_of_work():
+        await AsyncScopedSession().execute(
+            delete(Student).where(Student.student_name == NAME)
+        )
+
+
+async def single(repository: UserRepository, rows: int) -> float:
+    started = time.perf_counter()
+    for user in users(rows, 0):
+        async with unit_of_work():
+            await repository.create_student_user(
+                user.user_id, user.user_name, user.user_role
+            )
+
+    return rows / (time.perf_counter() - started)
+
+
+async def bulk(repository: UserRepository, rows: int, fail_every: int) -> float:
+    started = time.perf_counter()
+    async with unit_of_work():
+        result = await repository.create_student_users(users(rows, fail_every))
+    elapsed = time.perf_counter() - started
+    print(f"  bulk: {len(result.data)} created, {len(result.errors)} failed")
+
+    return rows / elapsed
+
+
+async def main(rows: int, fail_every: int) -> None:
+    repository = UserRepository()
+
+    await cleanup()
+    # 단건 경로는 느리므로 행 수를 줄여서 잰다.
+    single_rate = await single(repository, min(rows, 1_000))
+    await cleanup()
+    bulk_rate = await bulk(repository, rows, 0)
+    await cleanup()
+    failing_rate = await bulk(repository, rows, fail_every) if fail_every else None
+    await cleanup()
+
+    print(f"{'path':>16}{'rows/s':>12}{'x single':>10}")
+    print(f"{'single':>16}{single_rate:>12.0f}{1:>10.1f}")
+    print(f"{'bulk':>16}{bulk_rate:>12.0f}{bulk_rate / single_rate:>10.1f}")
+    if failing_rate is not None:
+        print(
+            f"{'bulk (failures)':>16}{failing_rate:>12.0f}"
+            f"{failing_rate / single_rate:>10.1f}"
+        )
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.fail_every))
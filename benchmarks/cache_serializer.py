@@ -0,0 +1,88 @@
+"""
+RedisCache serializer 벤치마크
+
+목록 페이지(10개, 100개) DTO를 serializer별로 인코딩/디코딩하는 시간과 저장되는 바이트 수를 비교한다.
+
+$ python -m benchmarks.cache_serializer
+"""
+
+import timeit
+from datetime import datetime, timezone
+
+from app.core.serializer import SERIALIZERS, get_serializer
+from app.models.dtos.common import PageDTO
+from app.models.dtos.class_ import (
+    ClassDTO,
+    ClassListDTO,
+    ClassNoticeDTO,
+    ClassNoticeListDTO,
+)
+
+NUMBER = 1_000
+
+
+def class_list(limit: int) -> ClassListDTO:
+    now = datetime.now(timezone.utc)
+    return ClassListDTO(
+        data=[
+            ClassDTO(
+                class_id=f"{i:032x}",
+                class_name=f"class {i}",
+                teacher_id=f"{i:032x}",
+                created_at=now,
+            )
+            for i in range(limit)
+        ],
+        page=PageDTO(total=10_000, page=1, limit=limit),
+    )
+
+
+def class_notice_list(limit: int) -> ClassNoticeListDTO:
+    now = datetime.now(timezone.utc)
+    return ClassNoticeListDTO(
+        data=[
+            ClassNoticeDTO(
+                notice_id=i,
+                class_id=f"{i:032x}",
+                message="공지사항입니다. " * 20,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(limit)
+        ],
+        page=PageDTO(total=10_000, page=1, limit=limit),
+    )
+
+
+def main():
+    print(
+        f"{'payload':<24}{'serializer':<12}"
+        f"{'encode (us)':>14}{'decode (us)':>14}{'bytes':>10}"
+    )
+    for build in (class_list, class_notice_list):
+        for limit in (10, 100):
+            value = build(limit)
+            type_ = type(value)
+
+            for name in SERIALIZERS:
+                try:
+                    serializer = get_serializer(name)
+                except RuntimeError:
+                    continue
+
+                data = serializer.dumps(value)
+                assert serializer.loads(data, type_) == value
+
+                encode = timeit.timeit(lambda: serializer.dumps(value), number=NUMBER)
+                decode = timeit.timeit(
+                    lambda: serializer.loads(data, type_), number=NUMBER
+                )
+                print(
+                    f"{f'{build.__name__}[{limit}]':<24}{name:<12}"
+                    f"{encode / NUMBER * 1e6:>14.1f}{decode / NUMBER * 1e6:>14.1f}"
+                    f"{len(data):>10}"
+                )
+
+
+if __name__ == "__main__":
+    main()
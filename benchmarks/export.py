@@ -0,0 +1,53 @@
+"""
+공지사항 내보내기 메모리 벤치마크
+
+ClassRepository.stream_class_notices로 한 클래스의 공지사항 전체를 NDJSON으로 인코딩하면서
+tracemalloc으로 파이썬 힙의 최대 사용량을 잰다. 행 수를 늘려도 최대값은 거의 같아야 한다.
+(한 묶음 = EXPORT_BATCH_SIZE행만 메모리에 있다)
+
+$ ENV=local python -m benchmarks.export --rows 1000000 --seed
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from app.core.db.session import close_db
+from app.core.export import encode_ndjson
+from app.models.schemas.class_ import ClassNoticeResp
+from app.repositories import ClassRepository
+from benchmarks.pagination import CLASS_ID, seed
+
+
+async def main(rows: int, should_seed: bool) -> None:
+    if should_seed:
+        await seed(rows)
+
+    repository = ClassRepository()
+    exported = 0
+    size = 0
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    async for batch in repository.stream_class_notices(CLASS_ID):
+        chunk = encode_ndjson([ClassNoticeResp.from_dto(dto) for dto in batch])
+        exported += len(batch)
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"rows: {exported}, bytes: {size / 1024 / 1024:.1f} MiB")
+    print(f"rows/s: {exported / elapsed:.0f}, peak heap: {peak / 1024 / 1024:.1f} MiB")
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.seed))
@@ -0,0 +1,103 @@
+"""
+OFFSET vs keyset(cursor) 페이지네이션 벤치마크
+
+한 클래스에 공지사항을 rows개 넣고, 페이지 깊이별로 두 방식의 조회 시간을 비교한다.
+keyset은 깊이와 상관없이 일정해야 하고, OFFSET은 깊이에 비례해서 느려진다.
+캐시를 거치지 않도록 ClassRepository 메서드의 원본 함수(__wrapped__)를 호출한다.
+
+$ ENV=local python -m benchmarks.pagination --rows 1000000 --seed
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from statistics import median
+from uuid import UUID
+
+from sqlalchemy import delete, insert
+
+from app.core.db.session import AsyncScopedSession, close_db, unit_of_work
+from app.core.pagination import encode_cursor
+from app.models.db.class_ import ClassNotice
+from app.repositories import ClassRepository
+
+# 벤치마크 데이터만 쓰는 고정 id
+CLASS_ID = UUID("00000000-0000-7000-8000-62656e636801")
+LIMIT = 10
+DEPTHS = (1, 10, 100, 1_000, 10_000, 100_000)
+REPEAT = 5
+
+
+async def seed(rows: int) -> None:
+    now = datetime.now(timezone.utc)
+    async with unit_of_work():
+        session = AsyncScopedSession()
+        await session.execute(
+            delete(ClassNotice).where(ClassNotice.class_id == CLASS_ID)
+        )
+        for start in range(0, rows, 10_000):
+            await session.execute(
+                insert(ClassNotice),
+                [
+                    {
+                        "class_id": CLASS_ID,
+                        "message": f"notice {i}",
+                        "created_at": now - timedelta(seconds=i),
+                    }
+                    for i in range(start, min(start + 10_000, rows))
+                ],
+            )
+
+
+async def measure(call) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        async with unit_of_work():
+            await call()
+        timings.append(time.perf_counter() - started)
+
+    return median(timings) * 1000
+
+
+async def main(rows: int, should_seed: bool) -> None:
+    if should_seed:
+        await seed(rows)
+
+    repository = ClassRepository()
+    read_class_notice_list = ClassRepository.read_class_notice_list.__wrapped__
+
+    print(f"{'page':>10}{'offset (ms)':>14}{'keyset (ms)':>14}")
+    for depth in DEPTHS:
+        if depth * LIMIT > rows:
+            break
+
+        # 커서는 바로 앞 페이지의 마지막 행으로 만든다. (측정에는 포함하지 않는다)
+        async with unit_of_work():
+            previous = await read_class_notice_list(
+                repository, CLASS_ID, depth - 1, LIMIT
+            )
+        cursor = None
+        if depth > 1 and previous.data:
+            last = previous.data[-1]
+            cursor = encode_cursor(last.created_at, last.notice_id)
+
+        offset = await measure(
+            lambda: read_class_notice_list(repository, CLASS_ID, depth, LIMIT)
+        )
+        keyset = await measure(
+            lambda: read_class_notice_list(repository, CLASS_ID, depth, LIMIT, cursor)
+        )
+        print(f"{depth:>10}{offset:>14.2f}{keyset:>14.2f}")
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.seed))
@@ -0,0 +1,75 @@
+"""
+기본 키 벤치마크: uuid4 hex VARCHAR(이전) vs uuid4 UUID vs UUIDv7 UUID(현재)
+
+같은 모양의 임시 테이블 세 개에 rows개를 batch개씩 넣으면서 초당 행 수를 재고,
+마지막에 PK 인덱스 크기를 비교한다. 두 번째 테이블로 타입(문자열 -> 16바이트) 효과와
+순서(랜덤 -> 시간순) 효과를 나눠 볼 수 있다.
+
+랜덤 키는 인덱스 전체에 흩어져 들어가므로 인덱스가 shared_buffers보다 커지면 느려지고,
+페이지 분할로 인덱스가 부풀어 오른다. 시간순 키는 항상 오른쪽 끝 페이지에만 붙는다.
+
+$ ENV=local python -m benchmarks.primary_keys --rows 10000000
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.core.db.session import close_db, engine
+from app.core.ids import uuid7
+
+SCHEMES = {
+    "varchar uuid4": ("varchar(255)", lambda: uuid4().hex),
+    "uuid uuid4": ("uuid", uuid4),
+    "uuid uuid7": ("uuid", uuid7),
+}
+
+
+async def run(name: str, column_type: str, new_id, rows: int, batch: int) -> None:
+    table = "benchmark_pk_" + name.replace(" ", "_")
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await connection.execute(
+            text(
+                f"CREATE TABLE {table} (id {column_type} PRIMARY KEY, "
+                "created_at timestamptz NOT NULL DEFAULT now())"
+            )
+        )
+
+    insert = text(f"INSERT INTO {table} (id) VALUES (:id)")
+    started = time.perf_counter()
+    for start in range(0, rows, batch):
+        async with engine.begin() as connection:
+            await connection.execute(
+                insert, [{"id": new_id()} for _ in range(min(batch, rows - start))]
+            )
+    elapsed = time.perf_counter() - started
+
+    async with engine.begin() as connection:
+        index_size = await connection.scalar(text(f"SELECT pg_indexes_size('{table}')"))
+        await connection.execute(text(f"DROP TABLE {table}"))
+
+    print(
+        f"{name:>16}{rows / elapsed:>12.0f}{index_size / 1024 / 1024:>16.1f}"
+        f"{index_size / rows:>14.1f}"
+    )
+
+
+async def main(rows: int, batch: int) -> None:
+    print(f"{'key':>16}{'rows/s':>12}{'index (MiB)':>16}{'bytes/row':>14}")
+    for name, (column_type, new_id) in SCHEMES.items():
+        await run(name, column_type, new_id, rows, batch)
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.batch))
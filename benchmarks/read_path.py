@@ -0,0 +1,123 @@
+"""
+조회 경로 벤치마크: ORM 세션(old) vs AUTOCOMMIT 커넥션 + 컬럼 튜플 -> DTO(new)
+
+목록 조회를 반복해서 초당 몇 행을 DTO로 만들어 내는지 비교한다.
+old는 이전 ClassRepository와 같은 방식이다. 세션 트랜잭션(BEGIN/ROLLBACK) 안에서 ORM 엔티티를 만들고 DTO로 옮긴다.
+new는 ClassRepository의 원본 함수(__wrapped__)를 호출한다. (캐시 제외)
+
+$ ENV=local python -m benchmarks.read_path --seed
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from app.core.db.session import AsyncScopedSession, close_db, unit_of_work
+from app.models.db.class_ import Class, ClassNotice
+from app.models.dtos.class_ import ClassDTO, ClassNoticeDTO
+from app.repositories import ClassRepository
+from benchmarks.pagination import CLASS_ID, seed
+
+LIMIT = 100
+
+
+async def old_class_list() -> int:
+    async with unit_of_work():
+        session = AsyncScopedSession()
+        stmt = (
+            select(Class)
+            .order_by(Class.created_at.desc(), Class.class_id.desc())
+            .limit(LIMIT + 1)
+        )
+        results = (await session.execute(stmt)).scalars().all()
+        data = [
+            ClassDTO(
+                class_id=row.class_id,
+                class_name=row.class_name,
+                teacher_id=row.teacher_id,
+                created_at=row.created_at,
+            )
+            for row in results[:LIMIT]
+        ]
+
+    return len(data)
+
+
+async def old_class_notice_list() -> int:
+    async with unit_of_work():
+        session = AsyncScopedSession()
+        stmt = (
+            select(ClassNotice)
+            .where(ClassNotice.class_id == CLASS_ID)
+            .order_by(ClassNotice.created_at.desc(), ClassNotice.id.desc())
+            .limit(LIMIT + 1)
+        )
+        results = (await session.execute(stmt)).scalars().all()
+        data = [
+            ClassNoticeDTO(
+                notice_id=row.id,
+                class_id=row.class_id,
+                message=row.message,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in results[:LIMIT]
+        ]
+
+    return len(data)
+
+
+async def rows_per_second(call, duration: float) -> float:
+    await call()  # 워밍업
+
+    rows = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        rows += await call()
+
+    return rows / (time.perf_counter() - started)
+
+
+async def main(duration: float, should_seed: bool) -> None:
+    if should_seed:
+        await seed(10_000)
+
+    repository = ClassRepository()
+    read_class_list = ClassRepository.read_class_list.__wrapped__
+    read_class_notice_list = ClassRepository.read_class_notice_list.__wrapped__
+
+    async def new_class_list() -> int:
+        async with unit_of_work():
+            result = await read_class_list(repository, 1, LIMIT, with_total=False)
+        return len(result.data)
+
+    async def new_class_notice_list() -> int:
+        async with unit_of_work():
+            result = await read_class_notice_list(
+                repository, CLASS_ID, 1, LIMIT, with_total=False
+            )
+        return len(result.data)
+
+    print(f"{'query':>20}{'old rows/s':>14}{'new rows/s':>14}{'speedup':>10}")
+    for name, old, new in (
+        ("class list", old_class_list, new_class_list),
+        ("class notice list", old_class_notice_list, new_class_notice_list),
+    ):
+        old_rate = await rows_per_second(old, duration)
+        new_rate = await rows_per_second(new, duration)
+        print(
+            f"{name:>20}{old_rate:>14.0f}{new_rate:>14.0f}{new_rate / old_rate:>9.2f}x"
+        )
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--seed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.duration, args.seed))
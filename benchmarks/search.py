@@ -0,0 +1,54 @@
+"""
+공지사항 검색 벤치마크
+
+benchmarks.pagination과 같은 데이터("notice {i}")로 검색어별 첫 페이지 / 다음 페이지 조회 시간을 잰다.
+캐시를 거치지 않도록 원본 함수(__wrapped__)를 호출한다.
+
+목표 (공지사항 수백만 행, 한 클래스):
+- 드문 검색어("12345")는 GIN 인덱스로 바로 찾으므로 행 수와 상관없이 10ms 이하
+- 흔한 검색어("notice")는 일치하는 행을 모두 rank로 정렬해야 하므로 일치 건수에 비례한다.
+
+$ ENV=local python -m benchmarks.search --rows 1000000 --seed
+"""
+
+import argparse
+import asyncio
+
+from app.core.db.session import close_db, unit_of_work
+from app.repositories import ClassRepository
+from benchmarks.pagination import CLASS_ID, measure, seed
+
+QUERIES = ("12345", "notice 12345", '"notice 12345"', "notice")
+
+
+async def main(rows: int, should_seed: bool) -> None:
+    if should_seed:
+        await seed(rows)
+
+    repository = ClassRepository()
+    search = ClassRepository.search_class_notices.__wrapped__
+
+    print(f"{'query':>18}{'first (ms)':>14}{'next (ms)':>14}")
+    for query in QUERIES:
+        async with unit_of_work():
+            first = await search(repository, CLASS_ID, query, 1, 10)
+        cursor = first.page.next_cursor
+
+        first_ms = await measure(lambda: search(repository, CLASS_ID, query, 1, 10))
+        next_ms = (
+            await measure(lambda: search(repository, CLASS_ID, query, 1, 10, cursor))
+            if cursor
+            else float("nan")
+        )
+        print(f"{query:>18}{first_ms:>14.2f}{next_ms:>14.2f}")
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.seed))
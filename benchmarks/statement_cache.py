@@ -0,0 +1,83 @@
+"""
+구문을 호출마다 새로 만드는 방식 vs bindparam 템플릿 / lambda 구문의 호출당 오버헤드
+
+execute()가 DBAPI를 호출하기 전에 하는 일(구문 생성 + 캐시 키 계산 + 컴파일 캐시 조회)만 잰다. DB는 필요 없다.
+운영 중인 앱에서는 GET /v1/metrics의 statements.compile에서 같은 구간을 볼 수 있다.
+
+$ ENV=local python -m benchmarks.statement_cache
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.util import LRUCache
+
+from app.core.pagination import encode_cursor
+from app.models.db.class_ import Class
+from app.repositories.class_repository import ClassTable, class_list_stmt
+
+DIALECT = postgresql.asyncpg.dialect()
+CURSOR = encode_cursor("2024-05-01T00:00:00+00:00", "class_id")
+
+
+def overhead(build) -> None:
+    # Connection._execute_clauseelement가 부르는 것과 같은 경로: 캐시 키를 만들고 컴파일 캐시를 찾는다.
+    build()._compile_w_cache(
+        dialect=DIALECT,
+        compiled_cache=CACHE,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+
+
+CACHE = LRUCache(500)
+
+
+def inline_select():
+    return select(Class).where(Class.class_id == "class_id")
+
+
+def template_select():
+    return ClassTable.select_stmt(["class_id"])
+
+
+def inline_list():
+    return (
+        select(Class)
+        .order_by(Class.created_at.desc(), Class.class_id.desc())
+        .limit(11)
+        .where(
+            tuple_(Class.created_at, Class.class_id)
+            < (datetime.fromisoformat("2024-05-01T00:00:00+00:00"), "class_id")
+        )
+    )
+
+
+def lambda_list():
+    return class_list_stmt(1, 10, CURSOR)
+
+
+def main(number: int) -> None:
+    print(f"{'statement':>16}{'inline (us)':>14}{'cached (us)':>14}")
+    for name, inline, cached in (
+        ("class by id", inline_select, template_select),
+        ("class list", inline_list, lambda_list),
+    ):
+        rates = []
+        for build in (inline, cached):
+            overhead(build)  # 컴파일 캐시 채우기
+            seconds = timeit.timeit(lambda: overhead(build), number=number)
+            rates.append(seconds / number * 1_000_000)
+        print(f"{name:>16}{rates[0]:>14.1f}{rates[1]:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    main(args.number)
@@ -0,0 +1,54 @@
+import pytest
+
+from app.core.compression import HEADER_RAW, Compressor, lz4, zstandard
+
+CODECS = [
+    "zlib",
+    pytest.param(
+        "zstd",
+        marks=pytest.mark.skipif(
+            zstandard is None, reason="zstandard is not installed"
+        ),
+    ),
+    pytest.param(
+        "lz4", marks=pytest.mark.skipif(lz4 is None, reason="lz4 is not installed")
+    ),
+]
+
+small = b"message"
+large = "공지사항입니다. ".encode() * 200
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_small_values_are_stored_raw(codec: str):
+    compressor = Compressor(codec=codec, threshold=1024)
+    data = compressor.compress(small)
+
+    assert data[0] == HEADER_RAW
+    assert compressor.decompress(data) == small
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_large_values_are_compressed(codec: str):
+    compressor = Compressor(codec=codec, threshold=1024)
+    data = compressor.compress(large)
+
+    assert data[0] != HEADER_RAW
+    assert len(data) < len(large)
+    assert compressor.decompress(data) == large
+    assert compressor.stats.compressed == 1
+    assert compressor.stats.ratio > 1
+
+
+def test_compressed_and_raw_values_live_side_by_side():
+    compressed = Compressor(codec="zlib", threshold=0).compress(large)
+    raw = Compressor(codec="none").compress(large)
+
+    compressor = Compressor(codec="none")
+    assert compressor.decompress(compressed) == large
+    assert compressor.decompress(raw) == large
+
+
+def test_unavailable_codec():
+    with pytest.raises(RuntimeError):
+        Compressor(codec="unknown")
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+from starlette_context import request_cycle_context
+from starlette_context.middleware import ContextMiddleware
+
+from app.core.config import config
+from app.core.db import session as db_session
+from app.core.errors.error import DeadlineExceeded, ERROR_504_DEADLINE_EXCEEDED
+from app.core.metrics import deadline_metrics
+from app.core.middlewares.deadline import DeadlineMiddleware
+
+
+@pytest.fixture
+def deadline_app(monkeypatch) -> FastAPI:
+    monkeypatch.setattr(config, "REQUEST_TIMEOUT", 0.05)
+
+    app = FastAPI()
+    app.state.cancelled = []
+
+    @app.get("/sleep/{seconds}")
+    async def sleep(seconds: float):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            app.state.cancelled.append(seconds)
+            raise
+        return {"remaining": db_session.remaining_time()}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0.03)
+                yield b"chunk\n"
+
+        return StreamingResponse(chunks())
+
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(ContextMiddleware)
+    return app
+
+
+async def test_fast_request_sees_its_remaining_budget(deadline_app: FastAPI):
+    async with AsyncClient(app=deadline_app, base_url="http://test") as client:
+        response = await client.get("/sleep/0")
+
+    assert response.status_code == 200
+    assert 0 < response.json()["remaining"] <= 0.05
+
+
+async def test_slow_request_is_cancelled_with_504(deadline_app: FastAPI):
+    exceeded = deadline_metrics.exceeded["request_timeout"]
+
+    async with AsyncClient(app=deadline_app, base_url="http://test") as client:
+        response = await client.get("/sleep/1")
+
+    assert response.status_code == 504
+    assert response.json()["statusCode"] == ERROR_504_DEADLINE_EXCEEDED
+    assert deadline_app.state.cancelled == [1]
+    assert deadline_metrics.exceeded["request_timeout"] == exceeded + 1
+
+
+async def test_budget_does_not_cut_a_started_stream(deadline_app: FastAPI):
+    async with AsyncClient(app=deadline_app, base_url="http://test") as client:
+        response = await client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.content == b"chunk\n" * 3
+
+
+async def test_client_disconnect_cancels_the_request(deadline_app: FastAPI):
+    disconnected = deadline_metrics.disconnected
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.01)
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/sleep/0.04",
+        "raw_path": b"/sleep/0.04",
+        "query_string": b"",
+        "headers": [],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1234),
+        "root_path": "",
+    }
+    await asyncio.wait_for(deadline_app(scope, receive, send), timeout=1)
+
+    assert deadline_app.state.cancelled == [0.04]
+    assert sent[0]["status"] == 499
+    assert deadline_metrics.disconnected == disconnected + 1
+
+
+def test_transaction_gets_remaining_budget_as_statement_timeout():
+    connection = Mock()
+
+    with request_cycle_context({}):
+        db_session.set_statement_timeout(Mock(), Mock(), connection)
+        connection.exec_driver_sql.assert_not_called()
+
+        db_session.start_deadline(2)
+        db_session.set_statement_timeout(Mock(), Mock(), connection)
+
+    statement = connection.exec_driver_sql.call_args.args[0]
+    assert statement.startswith("SET LOCAL statement_timeout = ")
+    assert 1900 < int(statement.rsplit(" ", 1)[1]) <= 2000
+
+
+def test_statement_timeout_maps_to_deadline_exceeded():
+    exceeded = deadline_metrics.exceeded["statement_timeout"]
+    exception_context = Mock()
+    exception_context.original_exception.sqlstate = db_session.QUERY_CANCELED
+
+    translated = db_session.translate_query_canceled(exception_context)
+
+    assert isinstance(translated, DeadlineExceeded)
+    assert deadline_metrics.exceeded["statement_timeout"] == exceeded + 1
+
+    exception_context.original_exception.sqlstate = "23505"
+    assert db_session.translate_query_canceled(exception_context) is None
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+
+from app.core.export import export_response
+from app.models.dtos.class_ import ClassNoticeDTO
+from app.models.schemas.class_ import ClassNoticeResp
+
+CREATED_AT = datetime(2024, 5, 1, tzinfo=timezone.utc)
+CLASS_ID = UUID("0190a4d2-6c3e-7a01-8000-000000000001")
+
+
+def notices(count: int, batch_size: int, closed: list):
+    async def batches():
+        try:
+            for start in range(0, count, batch_size):
+                yield [
+                    ClassNoticeDTO(i, CLASS_ID, f"message {i}", CREATED_AT)
+                    for i in range(start, min(start + batch_size, count))
+                ]
+        finally:
+            closed.append(True)
+
+    return batches()
+
+
+def client(count: int, closed: list, disconnected: bool = False) -> AsyncClient:
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export(request: Request, format: str = "ndjson"):
+        if disconnected:
+
+            async def is_disconnected():
+                return True
+
+            request.is_disconnected = is_disconnected
+
+        return export_response(
+            request,
+            notices(count, 2, closed),
+            ClassNoticeResp.from_dto,
+            ClassNoticeResp,
+            format,
+            "notices",
+        )
+
+    return AsyncClient(app=app, base_url="http://test")
+
+
+async def test_ndjson_streams_every_row():
+    closed = []
+    response = await client(5, closed).get("/export")
+
+    lines = response.text.splitlines()
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(lines) == 5
+    assert lines[0].startswith(f'{{"id":0,"classId":"{CLASS_ID}"')
+    assert closed == [True]
+
+
+async def test_csv_has_header_and_iso_timestamps():
+    closed = []
+    response = await client(3, closed).get("/export", params={"format": "csv"})
+
+    lines = response.text.splitlines()
+    assert lines[0] == "id,classId,message,createdAt,updatedAt"
+    assert lines[1] == f"0,{CLASS_ID},message 0,2024-05-01T00:00:00+00:00,"
+    assert len(lines) == 4
+    assert 'filename="notices.csv"' in response.headers["content-disposition"]
+
+
+async def test_disconnect_stops_and_closes_the_cursor():
+    closed = []
+    response = await client(1000, closed, disconnected=True).get("/export")
+
+    assert response.text == ""
+    assert closed == [True]
@@ -0,0 +1,21 @@
+import pytest
+
+from app.core.errors import error
+from app.core.ids import uuid7
+from app.core.pagination import cursor_uuid, encode_cursor, decode_cursor
+
+
+def test_uuid7_is_time_ordered_and_unique():
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {id_.version for id_ in ids} == {7}
+
+
+def test_cursor_uuid_round_trip():
+    id_ = uuid7()
+
+    assert cursor_uuid(*decode_cursor(encode_cursor(id_), 1)) == id_
+    with pytest.raises(error.InvalidCursor):
+        cursor_uuid("not-a-uuid")
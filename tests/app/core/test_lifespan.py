@@ -0,0 +1,37 @@
+import asyncio
+
+from unittest.mock import AsyncMock, patch
+
+from httpx import AsyncClient
+
+from app.core import lifespan as lifespan_module
+from app.main import app
+
+
+async def test_ready_is_503_until_warm_up_finishes():
+    warmed_up = asyncio.Event()
+    redis_cache_mock = AsyncMock()
+
+    async def warm_up(connections: int):
+        await warmed_up.wait()
+
+    redis_cache_mock.warm_up.side_effect = warm_up
+
+    with (
+        patch.object(lifespan_module, "ping_db", AsyncMock()),
+        patch.object(lifespan_module, "close_db", AsyncMock()),
+        patch.object(lifespan_module, "warm_up_db", AsyncMock()),
+        patch.object(lifespan_module, "redis_cache", redis_cache_mock),
+    ):
+        async with lifespan_module.lifespan(app):
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                warming_up = await client.get("/ready")
+
+                warmed_up.set()
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                ready = await client.get("/ready")
+
+    assert warming_up.status_code == 503
+    assert ready.status_code == 200
+    assert app.state.ready is False
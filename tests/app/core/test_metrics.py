@@ -0,0 +1,32 @@
+import pytest
+from unittest.mock import Mock
+
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.metrics import Histogram, InstrumentedPool
+
+
+def test_histogram_is_cumulative():
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+
+
+async def test_pool_counts_checkout_wait_and_timeouts():
+    pool = InstrumentedPool(creator=Mock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    connection = await greenlet_spawn(pool.connect)
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    connection.close()
+
+    assert pool.metrics.timeouts == 1
+    assert pool.metrics.checkout_wait.count == 2
+    assert pool.checkedout() == 0
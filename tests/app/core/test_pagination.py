@@ -0,0 +1,21 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.core.errors import error
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime.now(timezone.utc)
+    cursor = encode_cursor(created_at, 1)
+
+    created_at_value, notice_id = decode_cursor(cursor, 2)
+
+    assert datetime.fromisoformat(created_at_value) == created_at
+    assert notice_id == 1
+
+
+@pytest.mark.parametrize("cursor", ["invalid", encode_cursor(1, 2, 3), "!!!"])
+def test_invalid_cursor(cursor: str):
+    with pytest.raises(error.InvalidCursor):
+        decode_cursor(cursor, 2)
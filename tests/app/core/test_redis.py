@@ -0,0 +1,501 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.core.config import config
+from app.core.errors.error import DeadlineExceeded
+from app.core.redis import (
+    CACHE_FORMAT,
+    MISS,
+    CacheEntry,
+    LocalCache,
+    RedisCacheDecorator,
+    RedisCache,
+    RedisCacheInvalidator,
+    bind_arguments,
+    schema_version,
+)
+from app.models.dtos.class_ import ClassListDTO
+from app.repositories import ClassRepository
+
+
+def build_key(func, *args, **kwargs) -> str:
+    decorator = RedisCacheDecorator()
+    arguments = bind_arguments(inspect.signature(func), *args, **kwargs)
+    return decorator.key_builder(decorator.namespace(func), arguments)
+
+
+async def read_class_list(self, page: int, limit: int = 10) -> ClassListDTO: ...
+
+
+def test_key_ignores_repository_instance():
+    # 요청마다 새로운 레포지토리 인스턴스가 만들어져도 같은 키가 나와야 한다.
+    assert build_key(read_class_list, ClassRepository(), 1, 10) == build_key(
+        read_class_list, ClassRepository(), 1, 10
+    )
+
+
+def test_key_normalizes_positional_keyword_and_default_arguments():
+    key = build_key(read_class_list, None, 1, 10)
+
+    assert build_key(read_class_list, None, page=1, limit=10) == key
+    assert build_key(read_class_list, None, limit=10, page=1) == key
+    assert build_key(read_class_list, None, 1) == key
+
+
+@pytest.mark.parametrize(
+    "kwargs,other_kwargs",
+    [
+        ({"page": 1, "limit": 10}, {"page": 2, "limit": 10}),
+        ({"page": 1, "limit": 10}, {"page": 1, "limit": 20}),
+    ],
+)
+def test_key_depends_on_argument_values(kwargs: dict, other_kwargs: dict):
+    assert build_key(read_class_list, None, **kwargs) != build_key(
+        read_class_list, None, **other_kwargs
+    )
+
+
+def test_key_namespace():
+    key = build_key(read_class_list, None, 1, 10)
+
+    assert key.startswith(
+        ":".join(
+            [
+                config.CACHE_KEY_PREFIX,
+                config.VERSION,
+                CACHE_FORMAT,
+                config.CACHE_SERIALIZER,
+                f"{read_class_list.__module__}.{read_class_list.__qualname__}",
+                schema_version(read_class_list),
+            ]
+        )
+    )
+
+
+def test_schema_version_changes_with_dto_fields():
+    @dataclass
+    class ItemDTO:
+        item_id: str
+
+    async def read_item(self, item_id: str) -> Optional[ItemDTO]: ...
+
+    before = schema_version(read_item)
+
+    @dataclass
+    class ItemDTO:  # noqa: F811
+        item_id: str
+        item_name: str
+
+    async def read_item(self, item_id: str) -> Optional[ItemDTO]: ...
+
+    assert schema_version(read_item) != before
+
+
+def test_key_depends_on_generation():
+    decorator = RedisCacheDecorator()
+    namespace = decorator.namespace(read_class_list)
+    arguments = bind_arguments(inspect.signature(read_class_list), None, 1, 10)
+
+    assert decorator.key_builder(namespace, arguments, [1]) != decorator.key_builder(
+        namespace, arguments, [2]
+    )
+
+
+async def test_cached_read_uses_tag_generations():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = [3]
+    redis_cache_mock.get_entry.return_value = None
+
+    @RedisCacheDecorator(tags=("class_notice:{class_id}",))
+    async def read_class_notice_list(self, class_id: str, page: int) -> str:
+        return "result"
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        result = await read_class_notice_list(None, "class_id", page=1)
+
+    assert result == "result"
+    redis_cache_mock.get_generations.assert_called_once_with(["class_notice:class_id"])
+    redis_cache_mock.set_entry.assert_called_once()
+
+
+async def test_invalidator_bumps_generation_after_success():
+    redis_cache_mock = AsyncMock()
+
+    @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
+    async def create_class_notice(self, class_id: str, message: str) -> str:
+        return "result"
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        await create_class_notice(None, class_id="class_id", message="message")
+
+    redis_cache_mock.bump_generations.assert_called_once_with(["class_notice:class_id"])
+
+
+async def test_invalidator_does_not_bump_generation_on_failure():
+    redis_cache_mock = AsyncMock()
+
+    @RedisCacheInvalidator(tags=("class_notice:{class_id}",))
+    async def create_class_notice(self, class_id: str, message: str) -> str:
+        raise ValueError()
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        with pytest.raises(ValueError):
+            await create_class_notice(None, class_id="class_id", message="message")
+
+    redis_cache_mock.bump_generations.assert_not_called()
+
+
+def test_local_cache_evicts_least_recently_used():
+    local_cache = LocalCache(max_entries=2, max_bytes=1024, ttl=60)
+    local_cache.set("a", b"a")
+    local_cache.set("b", b"b")
+    local_cache.get("a")
+    local_cache.set("c", b"c")
+
+    assert "a" in local_cache
+    assert "b" not in local_cache
+    assert "c" in local_cache
+
+
+def test_local_cache_is_bounded_by_bytes():
+    local_cache = LocalCache(max_entries=100, max_bytes=10, ttl=60)
+    local_cache.set("a", b"12345")
+    local_cache.set("b", b"12345")
+    local_cache.set("c", b"12345")
+    local_cache.set("too_large", b"12345678901")
+
+    assert len(local_cache) == 2
+    assert local_cache.size == 10
+    assert "a" not in local_cache
+    assert "too_large" not in local_cache
+
+
+def test_local_cache_expires_entries():
+    local_cache = LocalCache(max_entries=100, max_bytes=1024, ttl=60)
+    local_cache.set("a", b"a", ttl=-1)
+
+    assert local_cache.get("a") is None
+    assert local_cache.size == 0
+
+
+def test_local_cache_records_stats():
+    local_cache = LocalCache(max_entries=100, max_bytes=1024, ttl=60)
+    local_cache.set("a", b"a")
+    local_cache.get("a")
+    local_cache.get("b")
+
+    assert local_cache.stats.hits == 1
+    assert local_cache.stats.misses == 1
+
+
+async def test_concurrent_misses_are_coalesced():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = None
+    calls = 0
+
+    @RedisCacheDecorator()
+    async def read_class_list(self, page: int, limit: int) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        results = await asyncio.gather(
+            *[read_class_list(None, page=1, limit=10) for _ in range(10)]
+        )
+
+    assert results == ["result"] * 10
+    assert calls == 1
+    redis_cache_mock.set_entry.assert_called_once()
+
+
+async def test_cancelled_read_cancels_the_detached_load():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = None
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    @RedisCacheDecorator()
+    async def read_class_list(self, page: int, limit: int) -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        first = asyncio.create_task(read_class_list(None, page=1, limit=10))
+        second = asyncio.create_task(read_class_list(None, page=1, limit=10))
+        await started.wait()
+
+        # 기다리는 요청이 남아 있으면 계산은 계속된다.
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+async def test_new_caller_does_not_join_a_load_being_cancelled():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = None
+    started, cleanup = asyncio.Event(), asyncio.Event()
+    calls = 0
+
+    @RedisCacheDecorator()
+    async def read_class_list(self, page: int, limit: int) -> str:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            return "result"
+
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # 롤백, asyncpg cancel 왕복처럼 취소 정리에 시간이 걸린다.
+            await cleanup.wait()
+            raise
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        first = asyncio.create_task(read_class_list(None, page=1, limit=10))
+        await started.wait()
+        first.cancel()
+        await asyncio.sleep(0.01)
+
+        result = await asyncio.wait_for(
+            read_class_list(None, page=1, limit=10), timeout=1
+        )
+        cleanup.set()
+
+    assert result == "result"
+    assert calls == 2
+
+
+async def test_detached_load_is_bounded_by_request_timeout(monkeypatch):
+    monkeypatch.setattr(config, "REQUEST_TIMEOUT", 0.01)
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = None
+
+    @RedisCacheDecorator()
+    async def read_class_list(self, page: int, limit: int) -> str:
+        await asyncio.sleep(10)
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        with pytest.raises(DeadlineExceeded):
+            await read_class_list(None, page=1, limit=10)
+
+    redis_cache_mock.set_entry.assert_not_called()
+
+
+async def test_lock_waits_for_value_from_other_worker():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.acquire_lock.return_value = False
+    redis_cache_mock.get_entry.side_effect = [
+        None,
+        None,
+        CacheEntry(value="cached", soft_expires_at=time.time() + 60),
+    ]
+    func = AsyncMock(return_value="result")
+
+    decorator = RedisCacheDecorator(lock=True, lock_wait=1)
+
+    async def read_class_list(self, page: int, limit: int) -> str:
+        return await func()
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        result = await decorator(read_class_list)(None, page=1, limit=10)
+
+    assert result == "cached"
+    func.assert_not_called()
+
+
+async def test_cache_hit_is_a_single_get():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = CacheEntry(
+        value="cached", soft_expires_at=time.time() + 60
+    )
+    func = AsyncMock(return_value="result")
+
+    async def read_class(self, class_id: str) -> str:
+        return await func()
+
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        result = await RedisCacheDecorator()(read_class)(None, class_id="class_id")
+
+    assert result == "cached"
+    redis_cache_mock.get_entry.assert_called_once()
+    redis_cache_mock.exists.assert_not_called()
+    func.assert_not_called()
+
+
+async def test_get_many_reads_l1_first_and_the_rest_with_one_mget():
+    cache = RedisCache()
+    cache.local = LocalCache(max_entries=10, max_bytes=1024, ttl=60)
+    cache.local.set("a", cache.encode("local_a"))
+    cache.redis = AsyncMock()
+    cache.redis.mget.return_value = [cache.encode("remote_b"), None]
+
+    values = await cache.get_many(["a", "b", "c"])
+
+    assert values == ["local_a", "remote_b", MISS]
+    cache.redis.mget.assert_awaited_once_with(["b", "c"])
+    assert "b" in cache.local
+
+
+async def test_stale_value_is_served_while_refreshing_in_background():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = CacheEntry(
+        value="stale", soft_expires_at=time.time() - 1
+    )
+    func = AsyncMock(return_value="fresh")
+
+    async def read_class_list(self, page: int, limit: int) -> str:
+        return await func()
+
+    decorator = RedisCacheDecorator(stale_ttl=60)
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        result = await decorator(read_class_list)(None, page=1, limit=10)
+        await asyncio.gather(*decorator._refreshing.values())
+
+    assert result == "stale"
+    func.assert_called_once()
+    (key, value), kwargs = redis_cache_mock.set_entry.call_args
+    assert value == "fresh"
+    assert kwargs["stale_ttl"] == 60
+
+
+async def test_refresh_reuses_value_another_worker_already_refreshed():
+    now = time.time()
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.local = Mock()
+    # L1의 옛 값은 stale이고, Redis에는 다른 워커가 갱신한 값이 있다.
+    redis_cache_mock.get_entry.side_effect = [
+        CacheEntry(value="stale", soft_expires_at=now - 1),
+        CacheEntry(value="fresh", soft_expires_at=now + 60),
+    ]
+    func = AsyncMock(return_value="recomputed")
+
+    async def read_class_list(self, page: int, limit: int) -> str:
+        return await func()
+
+    decorator = RedisCacheDecorator(stale_ttl=60)
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        result = await decorator(read_class_list)(None, page=1, limit=10)
+        (refreshed,) = await asyncio.gather(*decorator._refreshing.values())
+
+    assert result == "stale"
+    assert refreshed == "fresh"
+    assert redis_cache_mock.get_entry.call_args.kwargs == {"remote": True}
+    func.assert_not_called()
+
+
+async def test_miss_while_refreshing_does_not_join_the_refresh():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.side_effect = [
+        CacheEntry(value="stale", soft_expires_at=time.time() - 1),
+        None,
+    ]
+    redis_cache_mock.local = None
+    # 다른 워커가 락을 잡고 있어서 백그라운드 갱신은 None으로 끝난다.
+    redis_cache_mock.acquire_lock.side_effect = [False, True]
+    func = AsyncMock(return_value="fresh")
+
+    async def read_class(self, class_id: str) -> str:
+        await asyncio.sleep(0.01)
+        return await func()
+
+    decorator = RedisCacheDecorator(lock=True, stale_ttl=60)
+    decorated = decorator(read_class)
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        stale = await decorated(None, class_id="class_id")
+        fresh = await decorated(None, class_id="class_id")
+        await asyncio.gather(*decorator._refreshing.values())
+
+    assert stale == "stale"
+    assert fresh == "fresh"
+
+
+@pytest.mark.parametrize(
+    "early_refresh,soft_expires_in,expected",
+    [
+        (0.0, 0.001, False),
+        (1.0, 3600, False),
+        (1.0, 0, True),
+    ],
+)
+def test_should_refresh_early(
+    early_refresh: float, soft_expires_in: float, expected: bool
+):
+    now = time.time()
+    entry = CacheEntry(value="value", soft_expires_at=now + soft_expires_in, delta=10)
+
+    decorator = RedisCacheDecorator(early_refresh=early_refresh)
+    assert decorator.should_refresh_early(entry, now) == expected
+
+
+async def test_ttl_is_jittered():
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = []
+    redis_cache_mock.get_entry.return_value = None
+
+    async def read_class(self, class_id: str) -> str:
+        return "result"
+
+    decorated = RedisCacheDecorator(ttl=100, jitter=0.5)(read_class)
+    with patch("app.core.redis.redis_cache", redis_cache_mock):
+        for i in range(20):
+            await decorated(None, class_id=str(i))
+
+    ttls = {call.kwargs["ttl"] for call in redis_cache_mock.set_entry.call_args_list}
+    assert len(ttls) > 1
+    assert all(50 <= ttl <= 100 for ttl in ttls)
+
+
+async def test_invalidation_listener_recovers_after_failed_resubscribe(monkeypatch):
+    monkeypatch.setattr(config, "CACHE_INVALIDATION_RETRY_INTERVAL", 0.001)
+    cache = RedisCache()
+    cache.local = LocalCache(max_entries=10, max_bytes=1024, ttl=60)
+    cache.local.set("stale", b"value")
+    received = asyncio.Event()
+
+    async def disconnected():
+        raise ConnectionError("down")
+        yield
+
+    async def recovered():
+        yield {"type": "subscribe", "data": 1}
+        cache.local.set("other", b"value")
+        yield {"type": "message", "data": b"other"}
+        received.set()
+        await asyncio.sleep(10)
+
+    pubsub = AsyncMock()
+    pubsub.listen = Mock(side_effect=[disconnected(), recovered()])
+    pubsub.subscribe.side_effect = [ConnectionError("still down"), None]
+
+    listener = asyncio.create_task(cache._listen(pubsub))
+    await asyncio.wait_for(received.wait(), timeout=1)
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+
+    assert pubsub.subscribe.await_count == 2
+    assert "stale" not in cache.local
+    assert "other" not in cache.local
@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+
+from app.core.config import config
+from app.core.response_cache import ResponseCacheDecorator, last_modified_from
+from app.models.schemas.common import HttpResponse
+
+
+@pytest.fixture
+def redis_cache_mock(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_CACHE_ENABLED", True)
+
+    storage = {}
+    redis_cache_mock = AsyncMock()
+    redis_cache_mock.get_generations.return_value = [0]
+    redis_cache_mock.get_bytes.side_effect = lambda key: storage.get(key)
+    redis_cache_mock.set_bytes.side_effect = lambda key, data, ttl: storage.update(
+        {key: data}
+    )
+
+    with patch("app.core.response_cache.redis_cache", redis_cache_mock):
+        yield redis_cache_mock
+
+
+@pytest.fixture
+def service_mock() -> AsyncMock:
+    return AsyncMock(
+        return_value=[
+            {
+                "id": 1,
+                "createdAt": "2024-05-01T00:00:00+00:00",
+                "updatedAt": "2024-05-03T00:00:00+00:00",
+            },
+            {"id": 2, "createdAt": "2024-05-02T00:00:00+00:00", "updatedAt": None},
+        ]
+    )
+
+
+@pytest.fixture
+def client(service_mock: AsyncMock) -> AsyncClient:
+    app = FastAPI()
+
+    @app.get("/notice/{class_id}/list")
+    @ResponseCacheDecorator(
+        tags=("class_notice:{class_id}",),
+        last_modified=last_modified_from("updatedAt", "createdAt"),
+    )
+    async def read_class_notice_list(request: Request, class_id: str):
+        return HttpResponse(content=await service_mock())
+
+    return AsyncClient(app=app, base_url="http://test")
+
+
+async def test_etag_and_last_modified(
+    client: AsyncClient, redis_cache_mock: AsyncMock, service_mock: AsyncMock
+):
+    response = await client.get("/notice/class_id/list")
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["id"] == 1
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["last-modified"] == "Fri, 03 May 2024 00:00:00 GMT"
+    redis_cache_mock.get_generations.assert_called_once_with(["class_notice:class_id"])
+
+
+async def test_if_none_match_returns_304_without_service_call(
+    client: AsyncClient, redis_cache_mock: AsyncMock, service_mock: AsyncMock
+):
+    etag = (await client.get("/notice/class_id/list")).headers["etag"]
+
+    response = await client.get(
+        "/notice/class_id/list", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    service_mock.assert_called_once()
+
+
+async def test_cache_hit_returns_same_body_without_service_call(
+    client: AsyncClient, redis_cache_mock: AsyncMock, service_mock: AsyncMock
+):
+    first = await client.get("/notice/class_id/list?page=1&limit=10")
+    second = await client.get("/notice/class_id/list?limit=10&page=1")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    service_mock.assert_called_once()
+
+
+async def test_stale_etag_returns_full_response(
+    client: AsyncClient, redis_cache_mock: AsyncMock, service_mock: AsyncMock
+):
+    response = await client.get(
+        "/notice/class_id/list", headers={"If-None-Match": '"stale"'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]
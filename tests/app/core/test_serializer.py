@@ -0,0 +1,63 @@
+import pytest
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from uuid import UUID
+
+from app.core.serializer import get_serializer, msgpack
+from app.models.constants import UserRole
+from app.models.dtos.common import PageDTO
+from app.models.dtos.class_ import (
+    ClassDTO,
+    ClassListDTO,
+    ClassNoticeDTO,
+    ClassNoticeListDTO,
+)
+from app.models.dtos.user import UserDTO
+
+SERIALIZERS = [
+    "pickle",
+    "orjson",
+    pytest.param(
+        "msgpack",
+        marks=pytest.mark.skipif(msgpack is None, reason="msgpack is not installed"),
+    ),
+]
+
+now = datetime.now(timezone.utc)
+class_id = UUID("0190a4d2-6c3e-7a01-8000-000000000001")
+teacher_id = UUID("0190a4d2-6c3e-7a01-8000-000000000002")
+
+
+@pytest.mark.parametrize("serializer_name", SERIALIZERS)
+@pytest.mark.parametrize(
+    "type_,value",
+    [
+        (
+            ClassListDTO,
+            ClassListDTO(
+                data=[ClassDTO(class_id, "class_name", teacher_id, now)],
+                page=PageDTO(total=1, page=1, limit=10),
+            ),
+        ),
+        (
+            ClassNoticeListDTO,
+            ClassNoticeListDTO(
+                data=[ClassNoticeDTO(1, class_id, "message", now, None)],
+                page=PageDTO(total=1, page=1, limit=10),
+            ),
+        ),
+        (
+            Dict[UUID, ClassDTO],
+            {class_id: ClassDTO(class_id, "class_name", teacher_id, now)},
+        ),
+        (
+            UserDTO,
+            UserDTO(teacher_id, "user_name", UserRole.TEACHER, datetime.now()),
+        ),
+        (Optional[ClassDTO], None),
+    ],
+)
+def test_round_trip(serializer_name: str, type_, value):
+    serializer = get_serializer(serializer_name)
+
+    assert serializer.loads(serializer.dumps(value), type_) == value
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import encode_cursor
+from app.repositories.class_repository import (
+    ClassNoticeTable,
+    ClassTable,
+    class_list_stmt,
+    class_notice_search_stmt,
+    student_class_list_stmt,
+)
+
+
+def compile_(stmt):
+    return stmt.compile(dialect=postgresql.asyncpg.dialect())
+
+
+def test_statements_are_built_once_per_table():
+    assert ClassTable.select_stmt(["class_id"]) is ClassTable.select_stmt(["class_id"])
+    assert ClassTable.select_stmt(["class_id"]) is not ClassNoticeTable.select_stmt(
+        ["class_id"]
+    )
+
+
+def test_update_binds_do_not_clash_with_columns():
+    stmt = ClassNoticeTable.update_stmt(["id", "class_id"], ["message"])
+    sql = str(compile_(stmt))
+
+    assert "SET message=$1" in sql.replace("\n", " ")
+    assert "RETURNING class_notice.id AS notice_id" in sql.replace("\n", " ")
+
+
+def test_rows_map_straight_to_dtos():
+    created_at = datetime.now(timezone.utc)
+    dto = ClassNoticeTable.to_dto((1, "class_id", "message", created_at, None))
+
+    assert dto.notice_id == 1
+    assert dto.created_at == created_at
+
+
+def test_list_lambda_statement_shares_cache_key_across_values():
+    a, b = UUID(int=1), UUID(int=2)
+    first = class_list_stmt(1, 10, encode_cursor(datetime(2024, 1, 1), a))
+    second = class_list_stmt(3, 20, encode_cursor(datetime(2024, 5, 1), b))
+
+    assert first._generate_cache_key().key == second._generate_cache_key().key
+    assert compile_(second).params["class_id_1"] == b
+
+
+def test_student_class_list_walks_the_reverse_index():
+    sql = str(
+        compile_(
+            student_class_list_stmt(UUID(int=1), 1, 10, encode_cursor(UUID(int=2)))
+        )
+    )
+
+    assert "WHERE class_student.student_id = $1::UUID" in sql
+    assert "class_student.class_id > $2::UUID" in sql
+    assert "ORDER BY class_student.class_id" in sql
+
+
+def test_search_uses_the_gin_operator_and_rank_keyset():
+    sql = str(compile_(class_notice_search_stmt("teacher", True))).replace("\n", " ")
+
+    assert "class_notice.search_vector @@ websearch_to_tsquery" in sql
+    assert "WHERE class.teacher_id" in sql
+    assert "(ts_rank_cd(" in sql and "class_notice.id) < (" in sql
+    assert class_notice_search_stmt("teacher", True) is class_notice_search_stmt(
+        "teacher", True
+    )
@@ -0,0 +1,56 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.errors import error
+from app.repositories.class_repository import ClassTable
+
+
+@pytest.fixture
+def session_mock():
+    # teacher_id가 "duplicate"인 행이 들어 있는 INSERT는 실패한다.
+    def execute(stmt, rows):
+        if any(row["teacher_id"] == "duplicate" for row in rows):
+            raise IntegrityError("INSERT", rows, Exception("duplicate key"))
+
+        result = MagicMock()
+        rows_ = [(row["class_id"], "name", row["teacher_id"], None) for row in rows]
+        result.all.return_value = rows_
+        result.one.return_value = rows_[0]
+        return result
+
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    connection = AsyncMock()
+    connection.execute.side_effect = execute
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    session.begin_nested = begin_nested
+
+    with patch("app.repositories.base.AsyncScopedSession", return_value=session):
+        yield connection
+
+
+async def test_create_bulk_reports_failed_rows_and_keeps_the_rest(
+    session_mock: AsyncMock,
+):
+    rows = [
+        {"class_id": str(i), "class_name": "name", "teacher_id": "teacher_id"}
+        for i in range(5)
+    ]
+    rows[3]["teacher_id"] = "duplicate"
+
+    result = await ClassTable().create_bulk(
+        rows, failure=error.ClassCreationFailed, batch_size=2
+    )
+
+    assert [class_.class_id for class_ in result.data] == ["0", "1", "2", "4"]
+    assert [(e.index, e.code) for e in result.errors] == [
+        (3, error.ERROR_400_CLASS_CREATION_FAILED)
+    ]
+    # 배치 3번 + 실패한 배치(2, 3)만 한 행씩 2번
+    assert session_mock.execute.call_count == 5
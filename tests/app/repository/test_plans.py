@@ -0,0 +1,125 @@
+"""
+목록 조회가 정렬 없이 인덱스를 따라 읽는지 확인하는 실행 계획 회귀 테스트.
+EXPLAIN 테스트는 실제 Postgres가 필요하다. (DB에 접속할 수 없으면 건너뛴다)
+
+별도 스키마에 테이블을 만들고 데이터를 넣은 뒤 EXPLAIN하고, 트랜잭션을 롤백해서 흔적을 남기지 않는다.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.db.session import Base, engine
+from app.core.pagination import encode_cursor
+from app.models.db.class_ import Class, ClassNotice
+from app.repositories.class_repository import class_list_stmt, class_notice_list_stmt
+
+CLASS_ID = UUID("0190a4d2-6c3e-7a01-8000-000000000001")
+NOW = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def test_ddl_uses_server_timestamps_and_time_ordered_indexes():
+    dialect = postgresql.asyncpg.dialect()
+    indexes = {
+        index.name: str(CreateIndex(index).compile(dialect=dialect))
+        for table in (Class.__table__, ClassNotice.__table__)
+        for index in table.indexes
+    }
+
+    assert "created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL" in str(
+        CreateTable(ClassNotice.__table__).compile(dialect=dialect)
+    )
+    assert indexes["ix_class_created_at_class_id"].endswith(
+        "ON class (created_at DESC, class_id DESC)"
+    )
+    assert indexes["ix_class_notice_class_id_created_at_id"].endswith(
+        "ON class_notice (class_id, created_at DESC, id DESC)"
+    )
+    assert "ix_class_notice_class_id" not in indexes
+
+
+@pytest.fixture
+async def connection():
+    try:
+        connection = await asyncio.wait_for(engine.connect(), timeout=3)
+    except Exception as e:
+        pytest.skip(f"Postgres is not available: {e}")
+
+    transaction = await connection.begin()
+    try:
+        await connection.execute(text("CREATE SCHEMA plan_test"))
+        await connection.execute(text("SET LOCAL search_path TO plan_test"))
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            text(
+                "INSERT INTO class (class_id, class_name, teacher_id, created_at) "
+                "SELECT gen_random_uuid(), 'class', gen_random_uuid(), "
+                "now() - i * interval '1 second' FROM generate_series(1, 20000) i"
+            )
+        )
+        await connection.execute(
+            text(
+                "INSERT INTO class_notice (class_id, message, created_at) "
+                "SELECT (ARRAY[CAST(:class_id AS uuid), gen_random_uuid()])[1 + i % 2], "
+                "'notice ' || i, now() - i * interval '1 second' "
+                "FROM generate_series(1, 20000) i"
+            ),
+            {"class_id": str(CLASS_ID)},
+        )
+        await connection.execute(text("ANALYZE class"))
+        await connection.execute(text("ANALYZE class_notice"))
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
+
+
+async def explain(connection: AsyncConnection, stmt) -> List[Dict[str, Any]]:
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+    )
+    plan = result.scalar()
+
+    nodes, stack = [], [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+
+    return nodes
+
+
+def assert_index_scan(nodes: List[Dict[str, Any]], index_name: str) -> None:
+    assert not [node for node in nodes if node["Node Type"] == "Sort"], nodes
+    assert [
+        node
+        for node in nodes
+        if node["Node Type"] in ("Index Scan", "Index Only Scan")
+        and node.get("Index Name") == index_name
+    ], nodes
+
+
+@pytest.mark.parametrize(
+    "cursor", [None, encode_cursor(NOW.isoformat(), str(CLASS_ID))]
+)
+async def test_class_list_walks_the_index(connection: AsyncConnection, cursor):
+    nodes = await explain(connection, class_list_stmt(1, 10, cursor))
+
+    assert_index_scan(nodes, "ix_class_created_at_class_id")
+
+
+@pytest.mark.parametrize("cursor", [None, encode_cursor(NOW.isoformat(), 10_000)])
+async def test_class_notice_list_walks_the_index(connection: AsyncConnection, cursor):
+    stmt = class_notice_list_stmt(CLASS_ID, 1, 10, cursor)
+    nodes = await explain(connection, stmt)
+
+    assert_index_scan(nodes, "ix_class_notice_class_id_created_at_id")
@@ -1,25 +1,36 @@
+import orjson
 import pytest
 from datetime import datetime
+from uuid import UUID
 
 from httpx import AsyncClient
 
 from app.core.container import Container
 from app.core.errors import error
-from app.models.dtos.common import PageDTO
+from app.core.pagination import encode_cursor
+from app.models.dtos.common import BulkDTO, BulkErrorDTO, PageDTO
 from app.models.dtos.class_ import (
     ClassDTO,
     ClassListDTO,
     ClassNoticeDTO,
     ClassNoticeListDTO,
+    ClassStudentDTO,
+    ClassStudentListDTO,
+    ClassStudentBulkDTO,
 )
-from app.models.schemas.class_ import ClassReq, ClassNoticeReq
+from app.models.schemas.class_ import ClassBulkReq, ClassReq, ClassNoticeReq
+from app.repositories.class_repository import class_list_stmt, class_notice_list_stmt
 from app.services import ClassService
 
+CLASS_ID = UUID("0190a4d2-6c3e-7a01-8000-000000000001")
+TEACHER_ID = UUID("0190a4d2-6c3e-7a01-8000-000000000002")
+STUDENT_IDS = [UUID(f"0190a4d2-6c3e-7a01-8000-00000000001{i}") for i in range(3)]
+
 
 @pytest.mark.parametrize(
     "class_name,teacher_id",
     [
-        ("class_name", "teacher_id"),
+        ("class_name", TEACHER_ID),
     ],
 )
 async def test_create_class_200(
@@ -27,7 +38,7 @@ async def test_create_class_200(
     async_client: AsyncClient,
     class_service_mock: ClassService,
     class_name: str,
-    teacher_id: str,
+    teacher_id: UUID,
 ):
     # Setup
     # Request
@@ -37,7 +48,7 @@ async def test_create_class_200(
     )
     # Respository
     class_dto = ClassDTO(
-        class_id="-",
+        class_id=CLASS_ID,
         class_name=class_name,
         teacher_id=teacher_id,
         created_at=datetime.now(),
@@ -56,7 +67,68 @@ async def test_create_class_200(
     # Assert
     assert response.status_code == 200
     assert json_response["data"]["className"] == class_dto.class_name
-    assert json_response["data"]["teacherId"] == class_dto.teacher_id
+    assert json_response["data"]["teacherId"] == str(class_dto.teacher_id)
+
+
+async def test_create_classes_reports_failed_rows_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    data = ClassBulkReq(
+        data=[
+            ClassReq(className="class_1", teacherId=TEACHER_ID),
+            ClassReq(className="class_2", teacherId=TEACHER_ID),
+        ]
+    )
+    class_dto = ClassDTO(
+        class_id=CLASS_ID,
+        class_name="class_1",
+        teacher_id=TEACHER_ID,
+        created_at=datetime.now(),
+    )
+    class_service_mock.class_repository.create_classes.return_value = BulkDTO(
+        data=[class_dto],
+        errors=[
+            BulkErrorDTO(
+                1, error.ERROR_400_CLASS_CREATION_FAILED, "Class creation failed"
+            )
+        ],
+    )
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = "/v1/class/bulk"
+    response = await async_client.post(
+        url, headers=headers, data=data.model_dump_json()
+    )
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert json_response["data"]["data"][0]["className"] == class_dto.class_name
+    assert json_response["data"]["errors"] == [
+        {
+            "index": 1,
+            "statusCode": error.ERROR_400_CLASS_CREATION_FAILED,
+            "message": "Class creation failed",
+        }
+    ]
+    classes = class_service_mock.class_repository.create_classes.call_args.kwargs[
+        "classes"
+    ]
+    assert [class_.class_name for class_ in classes] == ["class_1", "class_2"]
+
+
+async def test_create_classes_empty_422(async_client: AsyncClient):
+    headers = {"x-api-key": "test_api_key"}
+    response = await async_client.post(
+        "/v1/class/bulk", headers=headers, json={"data": []}
+    )
+
+    assert response.status_code == 422
 
 
 @pytest.mark.parametrize(
@@ -80,9 +152,9 @@ async def test_read_class_list_200(
     }
     # Respository
     class_dto = ClassDTO(
-        class_id="class_id",
+        class_id=CLASS_ID,
         class_name="class_name",
-        teacher_id="teacher_id",
+        teacher_id=TEACHER_ID,
         created_at=datetime.now(),
     )
     page_dto = PageDTO(
@@ -114,24 +186,92 @@ async def test_read_class_list_200(
     results = json_response["data"]["data"]
     assert len(results) == 1
     result = results[0]
-    assert result["classId"] == class_dto.class_id
+    assert result["classId"] == str(class_dto.class_id)
     assert result["className"] == class_dto.class_name
-    assert result["teacherId"] == class_dto.teacher_id
+    assert result["teacherId"] == str(class_dto.teacher_id)
+
+
+@pytest.mark.parametrize(
+    "cursor,limit",
+    [
+        ("cursor", 10),
+    ],
+)
+async def test_read_class_list_with_cursor_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+    cursor: str,
+    limit: int,
+):
+    params = {
+        "cursor": cursor,
+        "limit": limit,
+    }
+    class_list_dto = ClassListDTO(
+        page=PageDTO(page=1, limit=limit, total=None, next_cursor="next_cursor"),
+        data=[],
+    )
+    class_service_mock.class_repository.read_class_list.return_value = class_list_dto
+    container.class_service.override(class_service_mock)
+
+    headers = {"x-api-key": "test_api_key"}
+    url = "/v1/class/list"
+    response = await async_client.get(url, headers=headers, params=params)
+    json_response = response.json()
+
+    assert response.status_code == 200
+
+    page = json_response["data"]["page"]
+    assert page["total"] is None
+    assert page["nextCursor"] == "next_cursor"
+
+    class_service_mock.class_repository.read_class_list.assert_called_once_with(
+        page=1, limit=limit, cursor=cursor, with_total=True
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor("not a datetime", str(CLASS_ID)),
+        encode_cursor(None, str(CLASS_ID)),
+        encode_cursor(datetime.now().isoformat(), "not a uuid"),
+    ],
+)
+async def test_read_class_list_with_malformed_cursor_400(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+    cursor: str,
+):
+    # 레포지토리는 DB에 가기 전에 구문을 만들면서 커서를 검사한다.
+    class_service_mock.class_repository.read_class_list.side_effect = (
+        lambda page, limit, cursor, with_total: class_list_stmt(page, limit, cursor)
+    )
+    container.class_service.override(class_service_mock)
+
+    headers = {"x-api-key": "test_api_key"}
+    url = "/v1/class/list"
+    response = await async_client.get(url, headers=headers, params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["statusCode"] == error.ERROR_400_INVALID_CURSOR
 
 
 @pytest.mark.parametrize(
     "class_id,class_name,teacher_id",
     [
-        ("class_id", "class_name", "teacher_id"),
+        (CLASS_ID, "class_name", TEACHER_ID),
     ],
 )
 async def test_read_class_200(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     class_name: str,
-    teacher_id: str,
+    teacher_id: UUID,
 ):
     # Setup
     # Respository
@@ -152,9 +292,9 @@ async def test_read_class_200(
 
     # Assert
     assert response.status_code == 200
-    assert json_response["data"]["classId"] == class_dto.class_id
+    assert json_response["data"]["classId"] == str(class_dto.class_id)
     assert json_response["data"]["className"] == class_dto.class_name
-    assert json_response["data"]["teacherId"] == class_dto.teacher_id
+    assert json_response["data"]["teacherId"] == str(class_dto.teacher_id)
 
 
 @pytest.mark.parametrize(
@@ -171,7 +311,7 @@ async def test_create_class_400(
     # Request
     data = ClassReq(
         className="class_name",
-        teacherId="teacher_id",
+        teacherId=TEACHER_ID,
     )
 
     # Run
@@ -190,7 +330,7 @@ async def test_create_class_400(
 @pytest.mark.parametrize(
     "class_id,expected_error",
     [
-        ("class_id", error.ERROR_400_CLASS_NOT_FOUND),
+        (CLASS_ID, error.ERROR_400_CLASS_NOT_FOUND),
     ],
 )
 async def test_read_class_400(
@@ -198,7 +338,7 @@ async def test_read_class_400(
     async_client: AsyncClient,
     expected_error: str,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
 ):
     # Setup
     class_service_mock.class_repository.read_class.return_value = None
@@ -218,14 +358,14 @@ async def test_read_class_400(
 @pytest.mark.parametrize(
     "class_id,message",
     [
-        ("class_id", "message"),
+        (CLASS_ID, "message"),
     ],
 )
 async def test_create_class_notice_200(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     message: str,
 ):
     # Setup
@@ -256,21 +396,21 @@ async def test_create_class_notice_200(
     # Assert
     assert response.status_code == 200
     assert json_response["data"]["id"] == class_notice_dto.notice_id
-    assert json_response["data"]["classId"] == class_notice_dto.class_id
+    assert json_response["data"]["classId"] == str(class_notice_dto.class_id)
     assert json_response["data"]["message"] == class_notice_dto.message
 
 
 @pytest.mark.parametrize(
     "class_id,page,limit",
     [
-        ("class_id", 1, 10),
+        (CLASS_ID, 1, 10),
     ],
 )
 async def test_read_class_notice_list_200(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     page: int,
     limit: int,
 ):
@@ -319,21 +459,60 @@ async def test_read_class_notice_list_200(
     assert len(results) == 1
     result = results[0]
     assert result["id"] == class_notice_dto.notice_id
-    assert result["classId"] == class_notice_dto.class_id
+    assert result["classId"] == str(class_notice_dto.class_id)
     assert result["message"] == class_notice_dto.message
 
 
+@pytest.mark.parametrize(
+    "class_id,limit",
+    [
+        (CLASS_ID, 10),
+    ],
+)
+async def test_read_class_notice_list_without_total_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+    class_id: UUID,
+    limit: int,
+):
+    params = {
+        "limit": limit,
+        "withTotal": "false",
+    }
+    class_notice_list_dto = ClassNoticeListDTO(
+        page=PageDTO(page=1, limit=limit, total=None),
+        data=[],
+    )
+    class_service_mock.class_repository.read_class_notice_list.return_value = (
+        class_notice_list_dto
+    )
+    container.class_service.override(class_service_mock)
+
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/notice/{class_id}/list"
+    response = await async_client.get(url, headers=headers, params=params)
+    json_response = response.json()
+
+    assert response.status_code == 200
+    assert json_response["data"]["page"]["total"] is None
+
+    class_service_mock.class_repository.read_class_notice_list.assert_called_once_with(
+        class_id=class_id, page=1, limit=limit, cursor=None, with_total=False
+    )
+
+
 @pytest.mark.parametrize(
     "class_id,notice_id",
     [
-        ("class_id", 1),
+        (CLASS_ID, 1),
     ],
 )
 async def test_update_class_notice_200(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     notice_id: int,
 ):
     # Setup
@@ -362,21 +541,21 @@ async def test_update_class_notice_200(
     # Assert
     assert response.status_code == 200
     assert json_response["data"]["id"] == class_notice_dto.notice_id
-    assert json_response["data"]["classId"] == class_notice_dto.class_id
+    assert json_response["data"]["classId"] == str(class_notice_dto.class_id)
     assert json_response["data"]["message"] == class_notice_dto.message
 
 
 @pytest.mark.parametrize(
     "class_id,notice_id",
     [
-        ("class_id", 1),
+        (CLASS_ID, 1),
     ],
 )
 async def test_delete_class_notice_200(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     notice_id: int,
 ):
     # Setup
@@ -401,19 +580,19 @@ async def test_delete_class_notice_200(
     # Assert
     assert response.status_code == 200
     assert json_response["data"]["id"] == class_notice_dto.notice_id
-    assert json_response["data"]["classId"] == class_notice_dto.class_id
+    assert json_response["data"]["classId"] == str(class_notice_dto.class_id)
     assert json_response["data"]["message"] == class_notice_dto.message
 
 
 @pytest.mark.parametrize(
     "class_id,message,expected_error",
     [
-        ("class_id", "message", error.ERROR_400_CLASS_NOTICE_CREATION_FAILED),
+        (CLASS_ID, "message", error.ERROR_400_CLASS_NOTICE_CREATION_FAILED),
     ],
 )
 async def test_create_class_notice_400(
     async_client: AsyncClient,
-    class_id: str,
+    class_id: UUID,
     message: str,
     expected_error: str,
 ):
@@ -439,14 +618,14 @@ async def test_create_class_notice_400(
 @pytest.mark.parametrize(
     "class_id,notice_id,expected_error",
     [
-        ("class_id", 1, error.ERROR_400_CLASS_NOTICE_NOT_FOUND),
+        (CLASS_ID, 1, error.ERROR_400_CLASS_NOTICE_NOT_FOUND),
     ],
 )
 async def test_update_class_notice_400(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     notice_id: int,
     expected_error: str,
 ):
@@ -473,14 +652,14 @@ async def test_update_class_notice_400(
 @pytest.mark.parametrize(
     "class_id,notice_id,expected_error",
     [
-        ("class_id", 1, error.ERROR_400_CLASS_NOTICE_NOT_FOUND),
+        (CLASS_ID, 1, error.ERROR_400_CLASS_NOTICE_NOT_FOUND),
     ],
 )
 async def test_delete_class_notice_400(
     container: Container,
     async_client: AsyncClient,
     class_service_mock: ClassService,
-    class_id: str,
+    class_id: UUID,
     notice_id: int,
     expected_error: str,
 ):
@@ -497,3 +676,206 @@ async def test_delete_class_notice_400(
     # Assert
     assert response.status_code == 400
     assert json_response["statusCode"] == expected_error
+
+
+async def test_enroll_students_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_service_mock.class_repository.enroll_students.return_value = (
+        ClassStudentBulkDTO(enrolled=2, already_enrolled=1)
+    )
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/{CLASS_ID}/students"
+    response = await async_client.post(
+        url, headers=headers, json={"studentIds": [str(id_) for id_ in STUDENT_IDS]}
+    )
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert json_response["data"] == {"enrolled": 2, "alreadyEnrolled": 1}
+    class_service_mock.class_repository.enroll_students.assert_called_once_with(
+        class_id=CLASS_ID, student_ids=STUDENT_IDS
+    )
+
+
+async def test_read_class_student_list_with_cursor_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_student_dto = ClassStudentDTO(
+        class_id=CLASS_ID, student_id=STUDENT_IDS[1], created_at=datetime.now()
+    )
+    class_service_mock.class_repository.read_class_student_list.return_value = (
+        ClassStudentListDTO(
+            data=[class_student_dto],
+            page=PageDTO(total=None, page=1, limit=10, next_cursor="next"),
+        )
+    )
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/{CLASS_ID}/students"
+    params = {"limit": 10, "cursor": "cursor", "withTotal": False}
+    response = await async_client.get(url, headers=headers, params=params)
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert json_response["data"]["data"][0]["studentId"] == str(STUDENT_IDS[1])
+    assert json_response["data"]["page"]["nextCursor"] == "next"
+    class_service_mock.class_repository.read_class_student_list.assert_called_once_with(
+        class_id=CLASS_ID, page=1, limit=10, cursor="cursor", with_total=False
+    )
+
+
+async def test_read_student_class_list_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_dto = ClassDTO(
+        class_id=CLASS_ID,
+        class_name="class_name",
+        teacher_id=TEACHER_ID,
+        created_at=datetime.now(),
+    )
+    class_service_mock.class_repository.read_student_class_list.return_value = (
+        ClassListDTO(data=[class_dto], page=PageDTO(total=1, page=1, limit=10))
+    )
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/student/{STUDENT_IDS[0]}"
+    response = await async_client.get(url, headers=headers)
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert json_response["data"]["data"][0]["classId"] == str(CLASS_ID)
+    assert json_response["data"]["page"]["total"] == 1
+
+
+async def test_unenroll_student_400(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_service_mock.class_repository.unenroll_student.return_value = None
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/{CLASS_ID}/students/{STUDENT_IDS[0]}"
+    response = await async_client.delete(url, headers=headers)
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 400
+    assert json_response["statusCode"] == error.ERROR_400_CLASS_STUDENT_NOT_FOUND
+
+
+async def test_export_class_notices_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    async def stream_class_notices(class_id: UUID):
+        yield [ClassNoticeDTO(1, class_id, "message", datetime.now())]
+        yield [ClassNoticeDTO(2, class_id, "message", datetime.now())]
+
+    class_service_mock.class_repository.stream_class_notices = stream_class_notices
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/notice/{CLASS_ID}/export"
+    response = await async_client.get(url, headers=headers)
+
+    # Assert
+    assert response.status_code == 200
+    assert [line["id"] for line in map(orjson.loads, response.text.splitlines())] == [
+        1,
+        2,
+    ]
+
+
+async def test_search_class_notices_200(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_notice_dto = ClassNoticeDTO(
+        notice_id=1, class_id=CLASS_ID, message="기말 시험", created_at=datetime.now()
+    )
+    class_service_mock.class_repository.search_class_notices.return_value = (
+        ClassNoticeListDTO(
+            data=[class_notice_dto],
+            page=PageDTO(total=None, page=1, limit=10, next_cursor="next"),
+        )
+    )
+    container.class_service.override(class_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/notice/{CLASS_ID}/search"
+    response = await async_client.get(url, headers=headers, params={"q": "시험"})
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert json_response["data"]["data"][0]["message"] == "기말 시험"
+    assert json_response["data"]["page"]["nextCursor"] == "next"
+    class_service_mock.class_repository.search_class_notices.assert_called_once_with(
+        class_id=CLASS_ID, query="시험", page=1, limit=10, cursor=None
+    )
+
+
+async def test_read_class_invalid_id_422(async_client: AsyncClient):
+    headers = {"x-api-key": "test_api_key"}
+    response = await async_client.get("/v1/class/not-a-uuid", headers=headers)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor("not a datetime", 1),
+        encode_cursor(datetime.now().isoformat(), "abc"),
+        encode_cursor(datetime.now().isoformat(), None),
+    ],
+)
+async def test_read_class_notice_list_with_malformed_cursor_400(
+    container: Container,
+    async_client: AsyncClient,
+    class_service_mock: ClassService,
+    cursor: str,
+):
+    class_service_mock.class_repository.read_class_notice_list.side_effect = (
+        lambda class_id, page, limit, cursor, with_total: class_notice_list_stmt(
+            class_id, page, limit, cursor
+        )
+    )
+    container.class_service.override(class_service_mock)
+
+    headers = {"x-api-key": "test_api_key"}
+    url = f"/v1/class/notice/{CLASS_ID}/list"
+    response = await async_client.get(url, headers=headers, params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["statusCode"] == error.ERROR_400_INVALID_CURSOR
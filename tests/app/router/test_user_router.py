@@ -5,9 +5,11 @@ from httpx import AsyncClient
 
 from app.core.container import Container
 from app.core.errors import error
+from app.core.ids import uuid7
+from app.models.dtos.common import BulkDTO
 from app.models.dtos.user import UserDTO
 from app.models.constants import UserRole
-from app.models.schemas.user import UserReq
+from app.models.schemas.user import UserBulkReq, UserReq
 from app.services import UserService
 
 # 모든 엔드포인트에 대한 테스트 코드는 STATUS CODE에 맞게 테스트 코드를 작성해야 한다.
@@ -35,7 +37,7 @@ async def test_create_user_teacher_200(  # 선생님 계정 생성 테스트. 20
     )
     # Repository
     user_dto = UserDTO(
-        user_id="-",  # 내부적으로 랜덤하게 유효하게 만들어놔서 이렇게 넣는다.
+        user_id=uuid7(),  # 내부적으로 랜덤하게 유효하게 만들어놔서 이렇게 넣는다.
         user_name=user_name,
         user_role=user_role,
         created_at=datetime.now(),  # 검사만 하면 되는 것이기 때문에 이렇게 넣어도 된다.
@@ -94,7 +96,7 @@ async def test_create_user_student_200(
     )
     # Repository
     user_dto = UserDTO(
-        user_id="-",
+        user_id=uuid7(),
         user_name=user_name,
         user_role=user_role,
         created_at=datetime.now(),
@@ -178,3 +180,42 @@ async def test_create_user_student_400(
     # Assert
     assert response.status_code == 400
     assert json_response["statusCode"] == expected_error
+
+
+async def test_create_user_student_bulk_200(
+    container: Container,
+    async_client: AsyncClient,
+    user_service_mock: UserService,
+):
+    # Setup
+    data = UserBulkReq(
+        data=[UserReq(userName="student_1"), UserReq(userName="student_2")]
+    )
+    user_service_mock.user_repository.create_student_users.side_effect = (
+        lambda users: BulkDTO(
+            data=[
+                UserDTO(user.user_id, user.user_name, user.user_role, datetime.now())
+                for user in users
+            ]
+        )
+    )
+    container.user_service.override(user_service_mock)
+
+    # Run
+    headers = {"x-api-key": "test_api_key"}
+    url = "/v1/user/student/bulk"
+    response = await async_client.post(
+        url, headers=headers, data=data.model_dump_json()
+    )
+    json_response = response.json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [user["userName"] for user in json_response["data"]["data"]] == [
+        "student_1",
+        "student_2",
+    ]
+    assert {user["userRole"] for user in json_response["data"]["data"]} == {
+        UserRole.STUDENT.value
+    }
+    assert json_response["data"]["errors"] == []
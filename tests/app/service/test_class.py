@@ -78,7 +78,7 @@ async def test_read_class_list(
     assert result.teacher_id == class_dto.teacher_id
 
     class_service_mock.class_repository.read_class_list.assert_called_once_with(
-        page=page, limit=limit
+        page=page, limit=limit, cursor=None, with_total=True
     )
 
 
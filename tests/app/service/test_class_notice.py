@@ -77,7 +77,7 @@ async def test_read_class_notice_list(
     assert result.message == class_notice_dto.message
 
     class_service_mock.class_repository.read_class_notice_list.assert_called_once_with(
-        class_id=class_id, page=page, limit=limit
+        class_id=class_id, page=page, limit=limit, cursor=None, with_total=True
     )
 
 
@@ -140,3 +140,26 @@ async def test_delete_class_notice(
     class_service_mock.class_repository.delete_class_notice.assert_called_once_with(
         class_id=class_id, notice_id=notice_id
     )
+
+
+@pytest.mark.asyncio
+async def test_search_class_notices_by_scope(
+    class_repository_mock: AsyncMock,
+    class_service_mock: ClassService,
+):
+    # Run
+    await class_service_mock.search_class_notices(
+        "  기말   시험 ", page=1, limit=10, class_id="class_id"
+    )
+    await class_service_mock.search_class_notices(
+        "기말 시험", page=1, limit=10, teacher_id="teacher_id"
+    )
+
+    # Assert
+    # 공백만 다른 검색어는 같은 캐시 키가 되도록 정리된다.
+    class_repository_mock.search_class_notices.assert_called_once_with(
+        class_id="class_id", query="기말 시험", page=1, limit=10, cursor=None
+    )
+    class_repository_mock.search_teacher_class_notices.assert_called_once_with(
+        teacher_id="teacher_id", query="기말 시험", page=1, limit=10, cursor=None
+    )
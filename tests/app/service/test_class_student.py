@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.errors import error
+from app.models.dtos.common import PageDTO
+from app.models.dtos.class_ import (
+    ClassStudentDTO,
+    ClassStudentListDTO,
+    ClassStudentBulkDTO,
+)
+from app.services.class_service import ClassService
+
+
+@pytest.mark.asyncio
+async def test_enroll_students(
+    class_repository_mock: AsyncMock,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_repository_mock.enroll_students.return_value = ClassStudentBulkDTO(
+        enrolled=2, already_enrolled=1
+    )
+
+    # Run
+    result = await class_service_mock.enroll_students(
+        class_id="class_id", student_ids=["a", "b", "c"]
+    )
+
+    # Assert
+    assert result.enrolled == 2
+    assert result.already_enrolled == 1
+    class_repository_mock.enroll_students.assert_called_once_with(
+        class_id="class_id", student_ids=["a", "b", "c"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_unenroll_student_not_found(
+    class_repository_mock: AsyncMock,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_repository_mock.unenroll_student.return_value = None
+
+    # Run & Assert
+    with pytest.raises(error.ClassStudentNotFound):
+        await class_service_mock.unenroll_student(
+            class_id="class_id", student_id="student_id"
+        )
+
+
+@pytest.mark.asyncio
+async def test_read_class_student_list(
+    class_repository_mock: AsyncMock,
+    class_service_mock: ClassService,
+):
+    # Setup
+    class_student_list_dto = ClassStudentListDTO(
+        data=[ClassStudentDTO(class_id="class_id", student_id="student_id")],
+        page=PageDTO(total=1, page=1, limit=10),
+    )
+    class_repository_mock.read_class_student_list.return_value = class_student_list_dto
+
+    # Run
+    result = await class_service_mock.read_class_student_list(
+        class_id="class_id", page=1, limit=10
+    )
+
+    # Assert
+    assert result == class_student_list_dto
+    class_repository_mock.read_class_student_list.assert_called_once_with(
+        class_id="class_id", page=1, limit=10, cursor=None, with_total=True
+    )